@@ -10,6 +10,11 @@ timeout = 180
 graceful_timeout = 180
 bind = "0.0.0.0:8080"
 
+# Extraction runs in child processes with per-job limits (see lode/api.py);
+# the deadline stays below the worker timeout so the job dies, not the worker.
+os.environ.setdefault("LODE_EXTRACT_ISOLATED", "1")
+os.environ.setdefault("LODE_EXTRACT_DEADLINE", "150")
+
 # Memory limits
 max_requests = 800
 max_requests_jitter = 200
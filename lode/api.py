@@ -7,13 +7,19 @@ from enum import Enum
 from typing import Optional
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 import tempfile
+import io
 import os
 import traceback
 import logging
 from urllib.parse import urlencode
 from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 import hashlib
+import threading
+import asyncio
+import weakref
 
 # Configura logging
 logging.basicConfig(
@@ -25,7 +31,9 @@ logger = logging.getLogger(__name__)
 # Internal modules
 from lode.reader import Reader
 from lode.reader import security
-from lode.exceptions import LODEError, ArtefactValidationError
+from lode.reader import spool
+from lode.reader import extraction_pool
+from lode.exceptions import LODEError, ArtefactLoadError, ArtefactValidationError, ExtractionBusyError
 
 # When enabled, error pages include the full traceback (development only).
 DEBUG = os.getenv("LODE_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
@@ -64,48 +72,282 @@ os.makedirs(SPOOL_DIR, exist_ok=True)
 _SPOOL_TTL = 4 * 60 * 60           # entries are cached for 4 hours
 _SPOOL_MAX_BYTES = 1024 ** 3       # 1 GB total budget shared by uploads + URLs
 
-def _spool_path(token: str) -> str:
+def _spool_path(token: str, ext: str = "rdf") -> str:
     # Spool tokens are opaque IDs we mint ourselves (uuid4 hex / "url_"+sha256).
     # Resolve and confirm the path stays inside SPOOL_DIR, so a crafted upload_id
     # cannot traverse out of it (path injection).
-    path = os.path.realpath(os.path.join(SPOOL_DIR, f"{token}.rdf"))
+    path = os.path.realpath(os.path.join(SPOOL_DIR, f"{token}.{ext}"))
     if os.path.commonpath((SPOOL_DIR, path)) != SPOOL_DIR:
         raise ArtefactValidationError("Invalid upload token", context={"token": token})
     return path
 
+_UPLOAD_CHUNK = 64 * 1024
+
+# Spool writes kept off the request path (see _spool_in_background)
+_spool_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lode-spool")
+_spool_pending = {}  # path -> Future of its pending write
+_spool_pending_lock = threading.Lock()
+
+def _read_upload(upload) -> io.BytesIO:
+    """Read the uploaded file object, validating it on the way in one pass
+    (security.TextStreamValidator). The returned buffer is the only copy."""
+    validator = security.TextStreamValidator()
+    buffer = io.BytesIO()
+    upload.seek(0)
+    while chunk := upload.read(_UPLOAD_CHUNK):
+        validator.feed(chunk)
+        buffer.write(chunk)
+    validator.close()
+    return buffer
+
+def _write_spool_entry(data, path: str) -> None:
+    # written aside and renamed: concurrent readers never see a partial entry
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+def _spool_in_background(data, path: str) -> None:
+    def _job():
+        try:
+            _write_spool_entry(data, path)
+        except OSError:
+            logger.warning("Could not spool %s", path, exc_info=True)
+        finally:
+            with _spool_pending_lock:
+                _spool_pending.pop(path, None)
+    # the job cannot unregister itself before it is registered: it needs the lock
+    with _spool_pending_lock:
+        _spool_pending[path] = _spool_writer.submit(_job)
+
+def _wait_spooled(path: str) -> None:
+    """Block until a background write of `path` (if any) is done."""
+    with _spool_pending_lock:
+        future = _spool_pending.get(path)
+    if future is not None:
+        future.result()
+
 def _prune_spool():
     """Evict expired entries, then enforce the total-size budget by deleting the
     oldest (by cache-write time) until back under the cap. Uploads and URL caches
-    share the same budget. Best-effort across workers (races caught via OSError).
+    share the same budget (policy in lode.reader.spool.prune_dir).
     """
-    cutoff = time.time() - _SPOOL_TTL
-    survivors = []  # (mtime, size, path) of entries still within the TTL
-    for name in os.listdir(SPOOL_DIR):
-        p = os.path.join(SPOOL_DIR, name)
+    spool.prune_dir(SPOOL_DIR, _SPOOL_TTL, _SPOOL_MAX_BYTES)
+
+# ----------------------------------------------------------
+#  IN-PROCESS READER CACHE (per worker)
+# ----------------------------------------------------------
+
+# Budget in "units" = triples in the graph + instances in the cache, a cheap
+# proxy for the memory held by an extracted Reader (env LODE_READER_CACHE_UNITS).
+try:
+    _READER_CACHE_MAX_UNITS = int(os.getenv("LODE_READER_CACHE_UNITS", "2000000"))
+except ValueError:
+    _READER_CACHE_MAX_UNITS = 2_000_000
+
+def _reader_units(reader) -> int:
+    graph = reader._graph
+    return (len(graph) if graph is not None else 0) + len(reader._instance_cache)
+
+class _ReaderCache:
+    """LRU of fully extracted Readers, so navigating the same artefact (every
+    click on /extract?resource=...) does not re-run the Loader and the phases.
+
+    Entries expire with the spool TTL and the oldest are evicted once the total
+    estimated size exceeds the budget. A cached Reader (and the viewer memoized
+    on it) is only read after extraction, so it is shared across requests.
+    """
+
+    def __init__(self, max_units: int, ttl: float):
+        self.max_units = max_units
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (reader, units, stored_at)
+        self._units = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            reader, _, stored_at = entry
+            if time.time() - stored_at > self.ttl:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return reader
+
+    def put(self, key, reader) -> None:
+        units = self._size(reader)
+        with self._lock:
+            self._drop(key)
+            if units > self.max_units:
+                return  # would evict everything else: serve it uncached
+            self._entries[key] = (reader, units, time.time())
+            self._units += units
+            while self._units > self.max_units:
+                self._drop(next(iter(self._entries)))
+
+    def discard(self, key) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._units = 0
+
+    def _drop(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._units -= entry[1]
+
+    @staticmethod
+    def _size(reader) -> int:
+        return _reader_units(reader)
+
+_reader_cache = _ReaderCache(_READER_CACHE_MAX_UNITS, _SPOOL_TTL)
+
+# Serialized provenance subgraphs served to the cards (/extract/provenance), in
+# characters (env LODE_PROVENANCE_CACHE_CHARS). Keyed by reader key first, so
+# the entries of a re-extracted artefact are dropped together.
+_PROVENANCE_CACHE_MAX_CHARS = security._env_int("LODE_PROVENANCE_CACHE_CHARS", 64 * 1024 * 1024)
+
+class _ProvenanceCache(_ReaderCache):
+    """LRU of serialized provenance: (reader key, resource, kind, format) -> str."""
+
+    def discard_reader(self, reader_key) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == reader_key]:
+                self._drop(key)
+
+    @staticmethod
+    def _size(text) -> int:
+        return len(text)
+
+_provenance_cache = _ProvenanceCache(_PROVENANCE_CACHE_MAX_CHARS, _SPOOL_TTL)
+
+# ----------------------------------------------------------
+#  EXTRACTION EXECUTOR (per worker)
+# ----------------------------------------------------------
+
+# Loading, parsing, extraction phases and view building are all synchronous:
+# /extract runs them on a bounded thread pool so the event loop keeps serving
+# other requests (/health, static files, cached pages) in the meantime.
+_EXTRACT_CONCURRENCY = max(1, security._env_int("LODE_EXTRACT_CONCURRENCY", 2))
+# Seconds a request may wait for a free slot before getting a 503.
+_EXTRACT_QUEUE_TIMEOUT = security._env_int("LODE_EXTRACT_QUEUE_TIMEOUT", 30)
+
+_extract_executor = ThreadPoolExecutor(max_workers=_EXTRACT_CONCURRENCY,
+                                       thread_name_prefix="lode-extract")
+_extract_slots = weakref.WeakKeyDictionary()  # event loop -> asyncio.Semaphore
+_job_context = threading.local()              # .cancel: Event of the running job
+_DISCONNECT_POLL = 0.5                        # seconds
+
+async def _run_extraction(fn, *args, disconnect: Optional[Request] = None):
+    """Run `fn` on the extraction pool once a slot is free (at most
+    _EXTRACT_CONCURRENCY at a time), waiting up to _EXTRACT_QUEUE_TIMEOUT.
+    With process isolation on, a job whose `disconnect` request goes away
+    meanwhile is cancelled."""
+    loop = asyncio.get_running_loop()
+    slots = _extract_slots.get(loop)
+    if slots is None:
+        slots = _extract_slots[loop] = asyncio.Semaphore(_EXTRACT_CONCURRENCY)
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=_EXTRACT_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise ExtractionBusyError(
+            "Server busy, please retry shortly",
+            context={"queue_timeout_s": _EXTRACT_QUEUE_TIMEOUT, "concurrency": _EXTRACT_CONCURRENCY},
+        )
+
+    def _release(_):
+        # The slot is held until the job really ends, even if the client went
+        # away and the awaiting request was cancelled meanwhile.
         try:
-            st = os.stat(p)
-        except OSError:
-            continue
-        if st.st_mtime < cutoff:
-            try:
-                os.unlink(p)
-            except OSError:
-                pass
-            continue
-        survivors.append((st.st_mtime, st.st_size, p))
-
-    total = sum(size for _, size, _ in survivors)
-    if total <= _SPOOL_MAX_BYTES:
-        return
-    survivors.sort()  # oldest cache-write time first
-    for _, size, p in survivors:
-        if total <= _SPOOL_MAX_BYTES:
-            break
+            loop.call_soon_threadsafe(slots.release)
+        except RuntimeError:
+            pass  # loop already closed
+
+    # Only the process pool acts on a cancellation (it kills the child): a
+    # thread cannot be stopped mid-parse, so in-process jobs get no Event
+    # and simply run to completion.
+    cancel = threading.Event() if EXTRACT_ISOLATED else None
+    def _job():
+        _job_context.cancel = cancel
         try:
-            os.unlink(p)
-            total -= size
-        except OSError:
-            pass
+            return fn(*args)
+        finally:
+            _job_context.cancel = None
+
+    future = _extract_executor.submit(_job)
+    future.add_done_callback(_release)
+    wrapped = asyncio.wrap_future(future)
+    try:
+        while disconnect is not None and cancel is not None:
+            done, _ = await asyncio.wait({wrapped}, timeout=_DISCONNECT_POLL)
+            if done:
+                break
+            if await disconnect.is_disconnected():
+                cancel.set()
+                break
+        return await wrapped
+    except asyncio.CancelledError:
+        if cancel is not None:
+            cancel.set()
+        raise
+
+# ----------------------------------------------------------
+#  PROCESS ISOLATION (optional, per worker)
+# ----------------------------------------------------------
+
+# With LODE_EXTRACT_ISOLATED set, each extraction runs in a pre-started child
+# process under a wall-clock deadline and RLIMIT_AS / RLIMIT_CPU limits, so a
+# runaway artefact kills only its own job (see lode.reader.extraction_pool).
+EXTRACT_ISOLATED = os.getenv("LODE_EXTRACT_ISOLATED", "").strip().lower() in ("1", "true", "yes", "on")
+_EXTRACT_DEADLINE = security._env_int("LODE_EXTRACT_DEADLINE", 150)        # seconds
+_EXTRACT_MAX_MEMORY_MB = security._env_int("LODE_EXTRACT_MAX_MEMORY_MB", 2048)
+_EXTRACT_MAX_CPU_S = security._env_int("LODE_EXTRACT_MAX_CPU_S", 120)
+
+_extraction_pool = None
+_extraction_pool_lock = threading.Lock()
+
+def _get_extraction_pool():
+    global _extraction_pool
+    if not EXTRACT_ISOLATED:
+        return None
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            # one process per extraction slot: a job never waits for a process
+            _extraction_pool = extraction_pool.ExtractionPool(
+                _EXTRACT_CONCURRENCY, _EXTRACT_DEADLINE,
+                max_memory_mb=_EXTRACT_MAX_MEMORY_MB, max_cpu_s=_EXTRACT_MAX_CPU_S,
+            )
+        return _extraction_pool
+
+def _extract(source, read_as, imported, closure, warnings, snap, format=None):
+    """Extract `source` into a Reader, leaving its snapshot at `snap`.
+    `format` is the loader's format hint (e.g. the extension of an upload)."""
+    pool = _get_extraction_pool()
+    if pool is not None:
+        saved = pool.run(extraction_pool.extract_to_snapshot,
+                         source, read_as, imported, closure, warnings, snap, format,
+                         cancel=getattr(_job_context, "cancel", None))
+        reader = Reader.load_snapshot(snap) if saved else None
+        if reader is None:
+            # never retry in-process: that parse would run without the job's limits
+            raise ArtefactLoadError("Extraction produced no usable model",
+                                    context={"reason": "no snapshot from the extraction process"})
+        return reader
+    reader = Reader()
+    reader.load_instances(source, read_as, imported=imported, closure=closure, warnings=warnings,
+                          format=format)
+    reader.save_snapshot(snap)
+    return reader
 
 # ----------------------------------------------------------
 #  HELPERS FOR \extract endpoints using cache from the reader
@@ -116,7 +358,19 @@ def _nav_qs(read_as: str, url, upload_id, lang) -> str:
     p["upload_id" if upload_id else "url"] = upload_id or (url or "")
     return urlencode(p)
     
-def _render_view(request, reader, *, resource, lang, source_url, upload_id, read_as):
+def _provenance_qs(read_as: str, url, upload_id, imported, closure, warnings) -> str:
+    # the card must fetch from the same Reader that rendered it
+    p = {"read_as": read_as}
+    p["upload_id" if upload_id else "url"] = upload_id or (url or "")
+    for name, value in (("imported", imported), ("closure", closure)):
+        if value is not None:
+            p[name] = "true" if value else "false"
+    if warnings:
+        p["warnings"] = "true"
+    return urlencode(p)
+
+def _render_view(request, reader, *, resource, lang, source_url, upload_id, read_as,
+                 imported=None, closure=None, warnings=False):
     viewer = reader.get_viewer()
     data = viewer.get_view_data(resource_uri=resource, language=lang)
     data["warnings"] = reader.get_warnings()
@@ -125,6 +379,7 @@ def _render_view(request, reader, *, resource, lang, source_url, upload_id, read
         "source_url": source_url,
         "upload_id": upload_id,
         "nav_qs": _nav_qs(read_as, source_url, upload_id, lang),
+        "prov_qs": _provenance_qs(read_as, source_url, upload_id, imported, closure, warnings),
         **data,
     })
 
@@ -132,6 +387,11 @@ def _url_token(url, read_as, imported, closure) -> str:
     key = f"{url}|{read_as}|{imported}|{closure}".encode()
     return "url_" + hashlib.sha256(key).hexdigest()[:32]
 
+def _snapshot_path(token, read_as, imported, closure, warnings) -> str:
+    # One extracted-model snapshot per (spool entry, extraction parameters).
+    key = f"{token}|{read_as}|{imported}|{closure}|{warnings}".encode()
+    return _spool_path("snap_" + hashlib.sha256(key).hexdigest()[:32], ext="snap")
+
 def _load_url(url, read_as, imported, closure, warnings, use_cache=True):
     # Enforce http(s)://host up front: a non-URL value (local path, file://, ...)
     # must never reach the loader and be opened as a local file.
@@ -139,38 +399,80 @@ def _load_url(url, read_as, imported, closure, warnings, use_cache=True):
     _prune_spool()
     token = _url_token(url, read_as, imported, closure)
     path = _spool_path(token)
+    snap = _snapshot_path(token, read_as, imported, closure, warnings)
     if use_cache and os.path.exists(path):
-        # cache hit: ricostruisci dal Turtle salvato
-        reader = Reader()
-        reader.load_instances(path, read_as, imported=imported, closure=closure, warnings=warnings)
-        return reader
+        # cache hit: prima lo snapshot del modello, poi il grafo in spool
+        reader = Reader.load_snapshot(snap)
+        if reader is not None:
+            return reader
+        return _extract(path, read_as, imported, closure, warnings, snap)
     if not use_cache:
-        # cache=false: drop the stale copy so the fresh fetch replaces it
-        try:
-            os.unlink(path)
-        except OSError:
-            pass
+        # cache=false: drop the stale copies so the fresh fetch replaces them
+        for stale in (path, snap):
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
     # cache miss (or forced refresh): scarica e processa dalla URL
-    reader = Reader()
-    reader.load_instances(url, read_as, imported=imported, closure=closure, warnings=warnings)
-    # persisti il grafo normalizzato per i prossimi hit
+    reader = _extract(url, read_as, imported, closure, warnings, snap)
+    # persisti il grafo (imports già espansi) per i prossimi hit
     try:
-        with open(path, "wb") as f:
-            f.write(reader._graph.serialize(format="turtle").encode("utf-8"))
-    except OSError:
-        pass
+        spool.write_graph(reader._graph, path, read_as=read_as, imported=imported,
+                          closure=closure, modules_applied=bool(imported or closure))
+    except (OSError, ValueError):
+        pass  # ValueError: a term the spool cannot hold, the next hit re-fetches
+    return reader
+
+def _upload_spool_path(upload_id) -> Optional[str]:
+    """Spool entry of an upload (kept under its original extension), if any."""
+    for ext in sorted(security.ALLOWED_EXTENSIONS):
+        path = _spool_path(upload_id, ext=ext.lstrip("."))
+        _wait_spooled(path)
+        if os.path.exists(path):
+            return path
+    return None
+
+def _load_upload(upload_id, read_as, imported, closure, warnings):
+    path = _upload_spool_path(upload_id)
+    if path is None:
+        raise ArtefactValidationError("Upload expired, please re-upload",
+                                    context={"upload_id": upload_id})
+    snap = _snapshot_path(upload_id, read_as, imported, closure, warnings)
+    reader = Reader.load_snapshot(snap)
+    if reader is None:
+        reader = _extract(path, read_as, imported, closure, warnings, snap,
+                          format=os.path.splitext(path)[1])
     return reader
 
+def _upload_reader_key(upload_id, read_as, imported, closure, warnings):
+    return (upload_id, read_as, imported, closure, warnings)
+
+def _reader_key(read_as: str, url, upload_id, imported, closure, warnings):
+    # Uploads are keyed by their id, URLs by the same token as their spool entry.
+    if upload_id:
+        return _upload_reader_key(upload_id, read_as, imported, closure, warnings)
+    if url:
+        return (_url_token(url, read_as, imported, closure), warnings)
+    raise ArtefactValidationError("Missing 'url' or 'upload_id'")
+
 def _resolve_reader(read_as: str, url, upload_id, imported, closure, warnings, use_cache=True):
+    key = _reader_key(read_as, url, upload_id, imported, closure, warnings)
+    if use_cache or upload_id:
+        reader = _reader_cache.get(key)
+        if reader is not None:
+            return reader
+    else:
+        _reader_cache.discard(key)
+    reader = _extract_reader(read_as, url, upload_id, imported, closure, warnings, use_cache)
+    # a fresh extraction (the URL may have been re-fetched): drop its old provenance
+    _provenance_cache.discard_reader(key)
+    _reader_cache.put(key, reader)
+    return reader
+
+def _extract_reader(read_as: str, url, upload_id, imported, closure, warnings, use_cache=True):
     if upload_id:
         # Uploads are not re-fetched, so the cache flag does not apply to them.
-        path = _spool_path(upload_id)
-        if not os.path.exists(path):
-            raise ArtefactValidationError("Upload expired, please re-upload",
-                                        context={"upload_id": upload_id})
-        reader = Reader()
-        reader.load_instances(path, read_as, imported=imported, closure=closure, warnings=warnings)
-        return reader
+        return _load_upload(upload_id, read_as, imported, closure, warnings)
     if url:
         return _load_url(url, read_as, imported, closure, warnings, use_cache=use_cache)
     raise ArtefactValidationError("Missing 'url' or 'upload_id'")
@@ -198,6 +500,15 @@ async def lode_error_handler(request: Request, exc: LODEError):
         "error.html", {"request": request, "error": _error_payload(exc)}, status_code=400
     )
 
+@app.exception_handler(ExtractionBusyError)
+async def busy_error_handler(request: Request, exc: ExtractionBusyError):
+    logger.warning(f"{type(exc).__name__}: {exc}")
+    response = templates.TemplateResponse(
+        "error.html", {"request": request, "error": _error_payload(exc)}, status_code=503
+    )
+    response.headers["Retry-After"] = str(_EXTRACT_QUEUE_TIMEOUT)
+    return response
+
 @app.exception_handler(Exception)
 async def unexpected_error_handler(request: Request, exc: Exception):
     logger.exception("Unexpected error")
@@ -216,7 +527,7 @@ def _check_format_enabled(read_as: "ReadAsFormat") -> None:
 async def limit_upload_size(request: Request, call_next):
     """Reject oversized POST bodies early, before reading them, when the client
     declares a Content-Length. (Chunked bodies omit it: those are still capped
-    in read_upload_capped; the hard limit belongs at the reverse proxy.)"""
+    while being read, in _read_upload; the hard limit belongs at the reverse proxy.)"""
     if request.method == "POST":
         declared = request.headers.get("content-length")
         if declared and declared.isdigit() and int(declared) > security.MAX_BYTES:
@@ -243,30 +554,77 @@ async def extract_get(
     cache: bool = True
 ):
         _check_format_enabled(read_as)
+        return await _run_extraction(_extract_get_response, request, read_as, url, upload_id,
+                                     resource, lang, imported, closure, format, warnings, cache,
+                                     disconnect=request)
 
-        reader = _resolve_reader(read_as.value, url, upload_id, imported, closure, warnings, use_cache=cache)
-        
-        # Content negotiation
-        accept = request.headers.get("accept", "text/html")
-        serial = None
-        if format and format.lower() in _EXT_TO_SERIALIZATION:
-            serial = _EXT_TO_SERIALIZATION[format.lower()]
-        elif accept in _ACCEPT_TO_SERIALIZATION:
-            serial = _ACCEPT_TO_SERIALIZATION[accept]
-        if serial:
-            rdflib_fmt, mime_type, ext = serial
-            if resource:
-                serialized = reader.get_viewer().export_resource(resource, rdflib_fmt)
-                filename = resource.rstrip("/").split("#")[-1].split("/")[-1] or "resource"
-            else:
-                serialized = reader._graph.serialize(format=rdflib_fmt)
-                filename = (url.rstrip("/").split("/")[-1] if url else "graph") or "graph"
-            return Response(content=serialized, media_type=mime_type,
-                            headers={"Content-Disposition": f'inline; filename="{filename}.{ext}"'})
-
-        logger.info(f"=== REQUEST SUCCESS ===")
-        return _render_view(request, reader, resource=resource, lang=lang,
-                            source_url=url, upload_id=upload_id, read_as=read_as.value)
+def _extract_get_response(request, read_as, url, upload_id, resource, lang,
+                          imported, closure, format, warnings, cache):
+    reader = _resolve_reader(read_as.value, url, upload_id, imported, closure, warnings, use_cache=cache)
+    
+    # Content negotiation
+    accept = request.headers.get("accept", "text/html")
+    serial = None
+    if format and format.lower() in _EXT_TO_SERIALIZATION:
+        serial = _EXT_TO_SERIALIZATION[format.lower()]
+    elif accept in _ACCEPT_TO_SERIALIZATION:
+        serial = _ACCEPT_TO_SERIALIZATION[accept]
+    if serial:
+        rdflib_fmt, mime_type, ext = serial
+        if resource:
+            serialized = reader.get_viewer().export_resource(resource, rdflib_fmt)
+            filename = resource.rstrip("/").split("#")[-1].split("/")[-1] or "resource"
+        else:
+            serialized = reader._graph.serialize(format=rdflib_fmt)
+            filename = (url.rstrip("/").split("/")[-1] if url else "graph") or "graph"
+        return Response(content=serialized, media_type=mime_type,
+                        headers={"Content-Disposition": f'inline; filename="{filename}.{ext}"'})
+
+    logger.info(f"=== REQUEST SUCCESS ===")
+    return _render_view(request, reader, resource=resource, lang=lang,
+                        source_url=url, upload_id=upload_id, read_as=read_as.value,
+                        imported=imported, closure=closure, warnings=warnings)
+
+@app.get("/extract/provenance")
+async def extract_provenance(
+    request: Request,
+    read_as: ReadAsFormat,
+    resource: str,
+    url: Optional[str] = None,
+    upload_id: Optional[str] = None,
+    kind: Optional[str] = None,
+    format: str = "ttl",
+    imported: Optional[bool] = None,
+    closure: Optional[bool] = None,
+    warnings: bool = False,
+):
+    """Provenance subgraph of one card, fetched when the card is opened."""
+    _check_format_enabled(read_as)
+    serial = _EXT_TO_SERIALIZATION.get(format.lower())
+    if serial is None:
+        raise ArtefactValidationError(
+            f"Unsupported format '{format}'",
+            context={"requested": format, "supported": sorted(_EXT_TO_SERIALIZATION)}
+        )
+    key = (_reader_key(read_as.value, url, upload_id, imported, closure, warnings),
+           resource, kind, serial[0])
+    # served from the cache without queuing for an extraction slot
+    text = _provenance_cache.get(key)
+    if text is None:
+        text = await _run_extraction(_provenance_text, key, read_as.value, url, upload_id,
+                                     resource, kind, serial[0], imported, closure, warnings,
+                                     disconnect=request)
+    return Response(content=text, media_type=f"{serial[1]}; charset=utf-8")
+
+def _provenance_text(key, read_as, url, upload_id, resource, kind, rdflib_fmt,
+                     imported, closure, warnings) -> str:
+    reader = _resolve_reader(read_as, url, upload_id, imported, closure, warnings)
+    text = reader.get_viewer().export_provenance(resource, rdflib_fmt, kind)
+    if text is None:
+        raise ArtefactValidationError("Resource not found",
+                                      context={"resource": resource, "kind": kind})
+    _provenance_cache.put(key, text)
+    return text
 
 @app.post("/extract", response_class=HTMLResponse)
 async def extract_post(
@@ -286,21 +644,42 @@ async def extract_post(
 
     # SECURITY CHECKS
     _check_format_enabled(read_as)
-    security.check_extension(file.filename)
-    content = await security.read_upload_capped(file)
-    security.check_is_text(content)
-    security.check_safe_xml(content.decode("utf-8-sig"))
-
+    ext = security.check_extension(file.filename)
+    return await _run_extraction(_extract_post_response, request, read_as, file.file, ext,
+                                 resource, lang, imported, closure, warnings,
+                                 disconnect=request)
+
+def _form_flag(value: Optional[str]) -> Optional[bool]:
+    # checkbox fields, parsed like the GET query flags so both share reader keys
+    if value is None:
+        return None
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def _extract_post_response(request, read_as, upload, ext, resource, lang, imported, closure, warnings):
+    imported, closure = _form_flag(imported), _form_flag(closure)
     _prune_spool()
     token = uuid4().hex
-    path = _spool_path(token)
-    with open(path, "wb") as f:
-        f.write(content)
-
-    reader = Reader()
-    reader.load_instances(path, read_as.value, imported=imported, closure=closure, warnings=warnings)
+    # spooled under the validated extension: the loader uses it as format hint
+    path = _spool_path(token, ext=ext.lstrip("."))
+    content = _read_upload(upload)
+    snap = _snapshot_path(token, read_as.value, imported, closure, warnings)
+
+    if _get_extraction_pool() is not None:
+        # the extraction process reads the upload back from the spool
+        _write_spool_entry(content.getbuffer(), path)
+        source = path
+    else:
+        # parsed straight from memory; the spool copy only serves later
+        # navigation (after the reader and its snapshot are gone)
+        _spool_in_background(content.getbuffer(), path)
+        source = content
+
+    # the navigation links carry upload_id: serve them from memory / snapshot
+    reader = _extract(source, read_as.value, imported, closure, warnings, snap, format=ext)
+    _reader_cache.put(_upload_reader_key(token, read_as.value, imported, closure, warnings), reader)
     return _render_view(request, reader, resource=resource, lang=lang,
-                        source_url=None, upload_id=token, read_as=read_as.value)
+                        source_url=None, upload_id=token, read_as=read_as.value,
+                        imported=imported, closure=closure, warnings=warnings)
 
 @app.get("/", response_class=HTMLResponse)
 async def input_web_interface(request: Request):
@@ -40,6 +40,33 @@ def _resource_url(uri: str, section: str) -> str:
     return f"resources/{section}/{slug}.html"
 
 
+# Estensione dei file di provenance -> formato rdflib
+_PROVENANCE_FORMATS = {"ttl": "turtle", "rdf": "xml", "n3": "n3"}
+
+
+def _provenance_path(uri: str, kind: str, ext: str) -> str:
+    """Path relativo del file di provenance di una card (caricato quando si apre)."""
+    return f"provenance/{_uri_to_slug(uri)}_{kind}.{ext}"
+
+
+def _write_provenance(viewer, out_dir: Path) -> None:
+    """Un file per card e formato, al posto dei subgraph inline in ogni pagina."""
+    prov_dir = out_dir / "provenance"
+    prov_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for inst in viewer.get_all_instances():
+        uri = inst.get_has_identifier()
+        if not uri or not viewer.reader.has_provenance(inst):
+            continue  # card without provenance: no accordion links here
+        kind = type(inst).__name__
+        for ext, fmt in _PROVENANCE_FORMATS.items():
+            text = viewer.export_provenance(str(uri), fmt, kind)
+            if text is not None:
+                (out_dir / _provenance_path(str(uri), kind, ext)).write_text(text, encoding="utf-8")
+                written += 1
+    print(f"  [build] provenance/ ({written} files)")
+
+
 def _copy_static(out_dir: Path) -> None:
     static_src = Path(__file__).parent / "static"
     static_dst = out_dir / "static"
@@ -67,11 +94,20 @@ def build_html(viewer, out_dir: Path, lang: str = "en") -> None:
     def resource_url_resource(uri: str, section: str) -> str:
         return f"../../resources/{section}/{_uri_to_slug(uri)}.html"
 
+    def provenance_url_index(uri: str, kind: str, ext: str) -> str:
+        return _provenance_path(uri, kind, ext)
+
+    def provenance_url_resource(uri: str, kind: str, ext: str) -> str:
+        return "../../" + _provenance_path(uri, kind, ext)
+
+    _write_provenance(viewer, out_dir)
+
     # --- index.html ---
     data = viewer.get_view_data(language=lang)
     data["request"] = _FakeRequest("/")
     data["is_static"] = True
     data["resource_url"] = resource_url_index
+    data["provenance_url"] = provenance_url_index
     html = template_index.render(**data)
     (out_dir / "index.html").write_text(html, encoding="utf-8")
     print(f"  [build] index.html")
@@ -102,6 +138,7 @@ def build_html(viewer, out_dir: Path, lang: str = "en") -> None:
             data_r["request"] = _FakeRequest(f"resources/{section_id}/{slug}.html")
             data_r["is_static"] = True
             data_r["resource_url"] = resource_url_resource
+            data_r["provenance_url"] = provenance_url_resource
             html_r = template_resource.render(**data_r)
             (section_dir / f"{slug}.html").write_text(html_r, encoding="utf-8")
 
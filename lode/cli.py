@@ -3,6 +3,7 @@
 lode serve [--port 8000]
 lode build --url <url>  --read-as <owl|rdf|skos> [--out ./docs] [--lang en] [--imported] [--closure]
 lode build --file <path> --read-as <owl|rdf|skos> [--out ./docs] [--lang en] [--imported] [--closure]
+lode build --file - --format ttl --read-as <owl|rdf|skos> ...     (artefact read from stdin)
 """
 
 import argparse
@@ -20,6 +21,8 @@ def cmd_build(args):
     from lode.builder import build_html 
 
     source = args.url or args.file
+    if source == "-":
+        source = sys.stdin.buffer
     if not source:
         print("ERROR: --url o --file richiesto", file=sys.stderr)
         sys.exit(1)
@@ -33,6 +36,7 @@ def cmd_build(args):
         args.read_as,
         imported=args.imported or None,
         closure=args.closure or None,
+        format=args.format,
     )
     viewer = reader.get_viewer()
 
@@ -58,6 +62,7 @@ def main():
     p_build.add_argument("--lang", default="en")
     p_build.add_argument("--imported", action="store_true")
     p_build.add_argument("--closure", action="store_true")
+    p_build.add_argument("--format", help="formato dell'input (ttl, rdf, nt, ...), altrimenti rilevato")
 
     args = parser.parse_args()
     {"serve": cmd_serve, "build": cmd_build}[args.cmd](args)
@@ -20,4 +20,12 @@ class ArtefactNotFoundError(LODEError):
 
 class ArtefactValidationError(LODEError):
     """Artefatto rifiutato dai security check (size, estensione, scheme/SSRF, non testo)."""
-    pass
\ No newline at end of file
+    pass
+
+class ExtractionBusyError(LODEError):
+    """Nessuno slot di estrazione libero nel worker entro il tempo di attesa."""
+    pass
+
+class ExtractionLimitError(LODEError):
+    """Job di estrazione interrotto: deadline, limite CPU/memoria o client disconnesso."""
+    pass
@@ -2,5 +2,7 @@ from .property import Property
 
 class Annotation(Property):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
\ No newline at end of file
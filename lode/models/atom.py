@@ -1,14 +1,16 @@
-from .resource import Resource
+from .resource import Resource, EMPTY
 
 class Atom(Resource):
+
+    __slots__ = ('has_arguments', 'has_predicate')
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.has_arguments = []   # Variable or Resource [1...n]
+        self.has_arguments = EMPTY   # Variable or Resource [1...n]
         self.has_predicate = None   # Concept (classPredicate) or Property (propertyPredicate) [1]
 
 
-    def get_has_arguments(self): return list(self.has_arguments)
-    def set_has_arguments(self, v): self.has_arguments.append(v)
+    def get_has_arguments(self): return self.has_arguments
+    def set_has_arguments(self, v): self._grow('has_arguments', list).append(v)  # posizionali: p(?x, ?x) è lecito
 
     def get_has_predicate(self): return self.has_predicate
     def set_has_predicate(self, v): self.has_predicate = v
\ No newline at end of file
@@ -1,10 +1,13 @@
 from .property import Property
+from .resource import EMPTY
 
 class Attribute(Property):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         # Relation with Literal
-        self.has_range = [] # GIà definita in parent class, card 1..*
-        self.has_type = [] # [1..*]
\ No newline at end of file
+        self.has_range = EMPTY # GIà definita in parent class, card 1..*
+        self.has_type = EMPTY # [1..*]
\ No newline at end of file
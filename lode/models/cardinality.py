@@ -1,6 +1,8 @@
 from .propertyConceptRestriction import PropertyConceptRestriction
 
 class Cardinality(PropertyConceptRestriction):
+
+    __slots__ = ('has_cardinality', 'has_cardinality_type')
             
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
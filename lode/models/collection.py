@@ -1,12 +1,14 @@
-from .resource import Resource
+from .resource import Resource, EMPTY
 
 class Collection(Resource):
 
+    __slots__ = ('is_ordered', 'has_member')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self.is_ordered= False # bool[1]
-        self.has_member= [] # [0..*]
+        self.has_member = EMPTY # [0..*]
 
     def get_is_ordered(self):
         """Restituisce il valore is_ordered bool[1]"""
@@ -18,9 +20,9 @@ class Collection(Resource):
 
     def get_has_member(self):
         """Restituisce il valore has_member [0..*]"""
-        return list(self.has_member)
+        return self.has_member
     
     def set_has_member(self, concept_or_collection):
         """Setta il valore di has_member [0..*]"""
-        self.has_member.append(concept_or_collection)
+        self._grow('has_member', list).append(concept_or_collection)  # posizionali, ripetizioni ammesse
     
\ No newline at end of file
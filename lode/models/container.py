@@ -1,16 +1,17 @@
-from .resource import Resource
+from .resource import Resource, EMPTY
 
 class Container(Resource):
     """RDF Container (Bag, Seq, Alt, List)"""
+
+    __slots__ = ('members', '_members')
     
     def __init__(self):
         super().__init__()
-        self.members = []
+        self.members = EMPTY
     
     def set_has_member(self, member):
         """Aggiunge un singolo membro"""
-        if member not in self.members:
-            self.members.append(member)
+        self._grow('members', list).append(member)  # posizionali: ( :a :b :a ) è lecita
     
     def set_has_members(self, members: list):
         """Imposta tutti i membri in una volta"""
@@ -18,4 +19,4 @@ class Container(Resource):
     
     def get_has_members(self):
         """Ritorna la lista dei membri"""
-        return self.members.copy()
+        return self.members
@@ -2,5 +2,7 @@ from .concept import Concept
 
 class Datatype(Concept):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -2,6 +2,8 @@ from .restriction import Restriction
 
 class DatatypeRestriction(Restriction):
 
+    __slots__ = ('applies_on_concept', 'has_restriction_value')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.applies_on_concept = None  # Datatype (from owl:onDatatype) string (xsd:pattern, xsd:minInclusive, ...)
@@ -2,6 +2,8 @@ from .resource import Resource
 
 class Literal(Resource): 
 
+    __slots__ = ('has_language', 'has_value')
+
     def __init__(self, **kwargs):
         
         super().__init__(**kwargs)
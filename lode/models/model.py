@@ -1,48 +1,53 @@
-from .resource import Resource
+from .resource import Resource, EMPTY
 
 class Model(Resource):
 
+    __slots__ = (
+        'has_version', 'is_backward_compatible_with', 'imports', 'is_incompatible_with',
+        'has_top_concept', 'has_prior_version', 'has_namespaces',
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.has_version = []                  # 0..*
-        self.is_backward_compatible_with = []  # 0..* 
-        self.imports = []                      # 0..*
-        self.is_incompatible_with = []         # 0..*
-        self.has_top_concept = []              # 0..1
+        self.has_version = EMPTY                  # 0..*
+        self.is_backward_compatible_with = EMPTY  # 0..* 
+        self.imports = EMPTY                      # 0..*
+        self.is_incompatible_with = EMPTY         # 0..*
+        self.has_top_concept = EMPTY              # 0..1
         self.has_prior_version = None          # 0..1
         self.has_namespaces = {}               # 1 (prefix -> URI)
 
     def get_has_version(self):
         """Restituisce la lista has_version"""
-        return list(self.has_version)
+        return self.has_version
     
     def set_has_version(self, model):
         """Aggiunge un Model a has_version """
-        self.has_version.append(model)
+        self._grow('has_version').append(model)
     
     def get_is_backward_compatible_with(self):
         """Restituisce la lista is_backward_compatible_with"""
-        return list(self.is_backward_compatible_with)
+        return self.is_backward_compatible_with
     
     def set_is_backward_compatible_with(self, model):
         """Aggiunge un Model a is_backward_compatible_with"""
-        self.is_backward_compatible_with.append(model)
+        self._grow('is_backward_compatible_with').append(model)
     
     def get_imports(self):
         """Restituisce la lista imports"""
-        return list(self.imports)
+        return self.imports
     
     def set_imports(self, model):
         """Aggiunge un Model a imports"""
-        self.imports.append(model)
+        self._grow('imports').append(model)
     
     def get_is_incompatible_with(self):
         """Restituisce la lista is_incompatible_with"""
-        return list(self.is_incompatible_with)
+        return self.is_incompatible_with
     
     def set_is_incompatible_with(self, model):
         """Aggiunge un Model a is_incompatible_with"""
-        self.is_incompatible_with.append(model)
+        self._grow('is_incompatible_with').append(model)
     
     def get_has_top_concept(self):
         """Restituisce la lista has_top_concept"""
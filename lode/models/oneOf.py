@@ -1,17 +1,20 @@
 from .restriction import Restriction
+from .resource import EMPTY
 
 class OneOf(Restriction):
 
+    __slots__ = ('applies_on_resource',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.applies_on_resource = [] # 1..*
+        self.applies_on_resource = EMPTY # 1..*
 
     def get_applies_on_resource(self):
         """Restituisce la lista applies on resource"""
-        return list(self.applies_on_resource)
+        return self.applies_on_resource
         
     def set_applies_on_resource(self, resource):
         """Aggiunge un Resource a applies_on_resource """
-        self.applies_on_resource.append(resource)
+        self._grow('applies_on_resource').append(resource)
 
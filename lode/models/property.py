@@ -1,8 +1,18 @@
-from .resource import Resource
+from .resource import Resource, EMPTY
 
 class Property(Resource):
     """Represents an RDF Property"""
 
+    # the Relation fields live here too: phase 5 reclassifies a generic Property
+    # in place (instance.__class__ = Relation/Attribute/Annotation), which needs
+    # the same slot layout across the whole Property family
+    __slots__ = (
+        'is_functional', 'is_sub_property_of', 'is_disjoint_with', 'is_equivalent_to',
+        'has_range', 'has_domain',
+        'is_asymmetric', 'is_inverse_functional', 'is_irreflexive', 'is_reflexive',
+        'is_symmetric', 'is_transitive', 'is_inverse_of', 'has_property_chain',
+    )
+
     def __init__(self, **kwargs):
         
         super().__init__(**kwargs)
@@ -11,17 +21,17 @@ class Property(Resource):
         self.is_functional = False  # bool [1]
         
         # Relations with Properties (0..*)
-        self.is_sub_property_of = []
-        self.is_disjoint_with = []
-        self.is_equivalent_to = []
+        self.is_sub_property_of = EMPTY
+        self.is_disjoint_with = EMPTY
+        self.is_equivalent_to = EMPTY
         
         # Relation with Resource (1..*) 
         # Nell'extractor - default per OWL ontologies = OWL.Thing
-        self.has_range = []  
+        self.has_range = EMPTY  
         
         # Relations with Concept (1..*)
         # Nell'extractor - default per OWL ontologies = OWL.Thing
-        self.has_domain = []  
+        self.has_domain = EMPTY  
 
     # Metodi per is_functional
     def set_is_functional(self, bool):
@@ -35,44 +45,42 @@ class Property(Resource):
     # Metodi per is_sub_property_of
     def set_is_sub_property_of(self, property_obj):
         """Aggiunge una property a is_sub_property_of"""
-        self.is_sub_property_of.append(property_obj)
+        self._grow('is_sub_property_of').append(property_obj)
     
     def get_is_sub_property_of(self):
-        """Restituisce una copia della lista is_sub_property_of"""
-        return list(set(self.is_sub_property_of))
+        """Restituisce la lista is_sub_property_of"""
+        return self.is_sub_property_of
 
     # Metodi per is_disjoint_with
     def set_is_disjoint_with(self, property_obj):
         """Aggiunge una property a is_disjoint_with"""
-        self.is_disjoint_with.append(property_obj)
+        self._grow('is_disjoint_with').append(property_obj)
     
     def get_is_disjoint_with(self):
-        """Restituisce una copia della lista is_disjoint_with"""
-        return list(set(self.is_disjoint_with))
+        """Restituisce la lista is_disjoint_with"""
+        return self.is_disjoint_with
 
     # Metodi per is_equivalent_to
     def set_is_equivalent_to(self, property_obj):
         """Aggiunge una property a is_equivalent_to"""
-        self.is_equivalent_to.append(property_obj)
+        self._grow('is_equivalent_to').append(property_obj)
     
     def get_is_equivalent_to(self):
-        """Restituisce una copia della lista is_equivalent_to"""
-        return list(set(self.is_equivalent_to))
+        """Restituisce la lista is_equivalent_to"""
+        return self.is_equivalent_to
 
     # Metodi per has_range
     def set_has_range(self, resource):
-        if resource not in self.has_range:
-            self.has_range.append(resource)
+        self._grow('has_range').append(resource)
     
     def get_has_range(self):
-        """Restituisce una copia della lista has_range"""
-        return list(self.has_range)
+        """Restituisce la lista has_range"""
+        return self.has_range
 
     def set_has_domain(self, concept):
-        if concept not in self.has_domain:
-            self.has_domain.append(concept)
+        self._grow('has_domain').append(concept)
     
     def get_has_domain(self):
-        """Restituisce una copia della lista has_domain"""
-        return list(self.has_domain)
+        """Restituisce la lista has_domain"""
+        return self.has_domain
 
@@ -1,6 +1,8 @@
 from .restriction import Restriction
 
 class PropertyConceptRestriction(Restriction):
+
+    __slots__ = ('applies_on_property', 'applies_on_concept', 'is_inverse')
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -2,6 +2,8 @@ from .restriction import Restriction
 
 class PropertySelfRestriction(Restriction):
 
+    __slots__ = ('applies_on_property',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -1,6 +1,8 @@
 from .propertyConceptRestriction import PropertyConceptRestriction
 
 class Quantifier(PropertyConceptRestriction):
+
+    __slots__ = ('has_quantifier_type',)
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1,8 +1,11 @@
 from .property import Property
+from .resource import EMPTY
 
 class Relation(Property):
     """Rappresenta una Object Property RDF"""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         # Chiama il costruttore della classe padre
         super().__init__(**kwargs)
@@ -16,11 +19,11 @@ class Relation(Property):
         self.is_transitive = False  # [1]
         
         # Relations with Relations
-        self.is_inverse_of = []  # [0..*] Relation
-        self.has_property_chain = []  # 1..*
+        self.is_inverse_of = EMPTY  # [0..*] Relation
+        self.has_property_chain = EMPTY  # 1..*
 
         # Relation with Concept
-        self.has_range = [] # 1..*
+        self.has_range = EMPTY # 1..*
 
     # Metodi per is_asymmetric
     def set_is_asymmetric(self, value):
@@ -78,18 +81,17 @@ class Relation(Property):
 
     def get_is_inverse_of(self):
         """Returns the list of inverse of"""
-        return list(set(self.is_inverse_of))
+        return self.is_inverse_of
     
     def set_is_inverse_of(self, relation):
         """Adds a inverse relation"""
-        self.is_inverse_of.append(relation)
+        self._grow('is_inverse_of').append(relation)
 
     def set_has_property_chain(self, relation):
-        if relation not in self.has_property_chain:
-            self.has_property_chain.append(relation)
+        self._grow('has_property_chain').append(relation)
 
     def get_has_property_chain(self):
-        return list(self.has_property_chain)
+        return self.has_property_chain
     
     # def set_has_range(self, concept):
     #     """Imposta has_range"""
@@ -97,5 +99,5 @@ class Relation(Property):
     
     # def get_has_range(self):
     #     """Restituisce has_range"""
-    #     return list(self.has_range)
+    #     return self.has_range
     
@@ -1,39 +1,179 @@
+class _EmptyList(list):
+    """Lista vuota condivisa, in sola lettura: il valore di ogni relazione 0..*
+    finché il suo primo set_* non alloca la lista vera (vedi Resource._grow)."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("empty relation placeholder: add values through the set_* method")
+
+    append = extend = insert = __setitem__ = __iadd__ = _read_only
+
+    def __reduce__(self):
+        # gli snapshot (pickle) devono ritrovare il segnaposto, non una sua copia
+        return 'EMPTY'
+
+
+EMPTY = _EmptyList()
+_UNSET = object()
+
+
+class RelationList(list):
+    """Valori di una relazione 0..*: ordine di inserimento, senza duplicati.
+    I getter la restituiscono senza copiarla: chi deve confrontare due letture
+    successive (l'indice dei figli di BaseLogic) se ne tiene una tuple. Sopra INDEX_FROM valori il test di
+    appartenenza passa da un set, così set_* resta O(1) anche con molti valori."""
+
+    __slots__ = ('_index',)
+    INDEX_FROM = 8
+
+    def __init__(self, values=()):
+        super().__init__()
+        self._index = None
+        self.extend(values)
+
+    def __contains__(self, value):
+        index = self._index
+        return list.__contains__(self, value) if index is None else value in index
+
+    def append(self, value):
+        """Aggiunge `value` in coda, se non c'è già."""
+        if value in self:
+            return
+        list.append(self, value)
+        if self._index is not None:
+            self._index.add(value)
+        elif len(self) > self.INDEX_FROM:
+            self._index = set(self)
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def insert(self, position, value):
+        if value not in self:
+            self._index = None
+            list.insert(self, position, value)
+
+    def _drops_index(method):
+        # mutatori che tolgono o sostituiscono valori: l'indice si ricostruisce al prossimo append
+        def mutator(self, *args):
+            self._index = None
+            return method(self, *args)
+        return mutator
+
+    clear = _drops_index(list.clear)
+    remove = _drops_index(list.remove)
+    pop = _drops_index(list.pop)
+    __setitem__ = _drops_index(list.__setitem__)
+    __delitem__ = _drops_index(list.__delitem__)
+    del _drops_index
+
+    def __reduce__(self):
+        # ricostruita vuota e riempita con append: l'indice non finisce nello snapshot
+        return (self.__class__, (), None, iter(self))
+
+
 class Resource():
     """Rappresenta una Risorsa RDF"""
 
+    # Attributes in __slots__, no per-instance __dict__. The relations (0..*) start
+    # as the shared EMPTY placeholder and get their own list on the first set_*.
+    __slots__ = (
+        'has_identifier', 'is_deprecated',
+        'has_comment', 'has_label', 'has_preferred_label', 'has_alternative_label',
+        'has_hidden_label', 'has_notation', 'has_note', 'has_change_note',
+        'has_definition', 'has_editorial_note', 'has_example', 'has_history_note',
+        'has_scope_note', 'has_contributor', 'has_creator',
+        'see_also', 'is_defined_by', 'has_version_info', 'also_defined_as',
+        'has_type', 'is_included_in',
+    )
+
     def __init__(self):
         # Init Attributes
         self.has_identifier = None 
         self.is_deprecated = False 
         
         # Relations with Literals (0..*)
-        self.has_comment = []
-        self.has_label = []
-        self.has_preferred_label = []
-        self.has_alternative_label = []
-        self.has_hidden_label = []
-        self.has_notation = []
-        self.has_note = []
-        self.has_change_note = []
-        self.has_definition = []
-        self.has_editorial_note = []
-        self.has_example = []
-        self.has_history_note = []
-        self.has_scope_note = []
-        self.has_contributor = []
-        self.has_creator = []
+        self.has_comment = EMPTY
+        self.has_label = EMPTY
+        self.has_preferred_label = EMPTY
+        self.has_alternative_label = EMPTY
+        self.has_hidden_label = EMPTY
+        self.has_notation = EMPTY
+        self.has_note = EMPTY
+        self.has_change_note = EMPTY
+        self.has_definition = EMPTY
+        self.has_editorial_note = EMPTY
+        self.has_example = EMPTY
+        self.has_history_note = EMPTY
+        self.has_scope_note = EMPTY
+        self.has_contributor = EMPTY
+        self.has_creator = EMPTY
         
         # Relations with Resources (0..*)
-        self.see_also = []
-        self.is_defined_by = []
-        self.has_version_info = []
-        self.also_defined_as = []
+        self.see_also = EMPTY
+        self.is_defined_by = EMPTY
+        self.has_version_info = EMPTY
+        self.also_defined_as = EMPTY
 
         # Relation with Concepts (0..*)
-        self.has_type = []
+        self.has_type = EMPTY
 
         # Relation with Models (1..*)
-        self.is_included_in = [] # NEEDS TO BE CHECKED
+        self.is_included_in = EMPTY # NEEDS TO BE CHECKED
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_names = tuple(
+            name for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ()) if name != '__dict__'
+        )
+
+    # ----------------------------------------------------------
+    #  FIELDS (al posto di __dict__)
+    # ----------------------------------------------------------
+
+    def _grow(self, name, factory=RelationList):
+        """La lista di `name`, allocata al primo valore (una RelationList, salvo
+        le sequenze posizionali che passano `list`)."""
+        values = getattr(self, name)
+        if values is EMPTY:
+            values = factory()
+            setattr(self, name, values)
+        return values
+
+    def iter_fields(self):
+        """(nome, valore) degli attributi valorizzati, nell'ordine di __init__;
+        le relazioni ancora vuote sono saltate. Le istanze con __dict__
+        (Statement) aggiungono in coda gli attributi ad-hoc."""
+        for name in self._field_names:
+            value = getattr(self, name, _UNSET)
+            if value is not _UNSET and value is not EMPTY:
+                yield name, value
+        extra = getattr(self, '__dict__', None)
+        if extra:
+            yield from extra.items()
+
+    def copy_fields_from(self, other):
+        """Copia gli attributi di `other` (promozioni di tipo, punning). Le liste
+        restano condivise, anche quelle ancora vuote, come faceva
+        __dict__.update; gli attributi che questa classe non prevede sono scartati."""
+        has_dict = hasattr(self, '__dict__')
+        for name in other._field_names:
+            value = getattr(other, name, _UNSET)
+            if value is _UNSET or not (has_dict or name in self._field_names):
+                continue
+            if value is EMPTY:
+                value = other._grow(name)
+            setattr(self, name, value)
+        extra = getattr(other, '__dict__', None)
+        if extra and has_dict:
+            self.__dict__.update(extra)
 
     def set_has_identifier(self, value):
         """Imposta has_identifier"""
@@ -53,163 +193,165 @@ class Resource():
 
     def set_has_comment(self, literal):
         """Aggiunge un literal a has_comment"""
-        self.has_comment.append(literal)
+        self._grow('has_comment').append(literal)
     
     def get_has_comment(self):
-        """Restituisce una copia della lista has_comment"""
-        return list(set(self.has_comment))
+        """Restituisce la lista has_comment"""
+        return self.has_comment
 
     def set_has_label(self, literal):
         """Aggiunge un literal a has_label"""
-        self.has_label.append(literal)
+        self._grow('has_label').append(literal)
     
     def get_has_label(self):
-        """Restituisce una copia della lista has_label"""
-        return list(set(self.has_label))
+        """Restituisce la lista has_label"""
+        return self.has_label
 
     def set_has_preferred_label(self, literal):
         """Aggiunge un literal a has_preferred_label"""
-        self.has_preferred_label.append(literal)
+        self._grow('has_preferred_label').append(literal)
     
     def get_has_preferred_label(self):
-        """Restituisce una copia della lista has_preferred_label"""
-        return list(set(self.has_preferred_label))
+        """Restituisce la lista has_preferred_label"""
+        return self.has_preferred_label
 
     def set_has_alternative_label(self, literal):
         """Aggiunge un literal a has_alternative_label"""
-        self.has_alternative_label.append(literal)
+        self._grow('has_alternative_label').append(literal)
     
     def get_has_alternative_label(self):
-        """Restituisce una copia della lista has_alternative_label"""
-        return list(set(self.has_alternative_label))
+        """Restituisce la lista has_alternative_label"""
+        return self.has_alternative_label
 
     def set_has_hidden_label(self, literal):
         """Aggiunge un literal a has_hidden_label"""
-        self.has_hidden_label.append(literal)
+        self._grow('has_hidden_label').append(literal)
     
     def get_has_hidden_label(self):
-        """Restituisce una copia della lista has_hidden_label"""
-        return list(set(self.has_hidden_label))
+        """Restituisce la lista has_hidden_label"""
+        return self.has_hidden_label
 
     def set_has_notation(self, literal):
         """Aggiunge un literal a has_notation"""
-        self.has_notation.append(literal)
+        self._grow('has_notation').append(literal)
     
     def get_has_notation(self):
-        """Restituisce una copia della lista has_notation"""
-        return list(set(self.has_notation))
+        """Restituisce la lista has_notation"""
+        return self.has_notation
 
     def set_has_note(self, literal):
         """Aggiunge un literal a has_note"""
-        self.has_note.append(literal)
+        self._grow('has_note').append(literal)
     
     def get_has_note(self):
-        """Restituisce una copia della lista has_note"""
-        return list(set(self.has_note))
+        """Restituisce la lista has_note"""
+        return self.has_note
 
     def set_has_change_note(self, literal):
         """Aggiunge un literal a has_change_note"""
-        self.has_change_note.append(literal)
+        self._grow('has_change_note').append(literal)
     
     def get_has_change_note(self):
-        """Restituisce una copia della lista has_change_note"""
-        return list(set(self._has_change_note))
+        """Restituisce la lista has_change_note"""
+        return self.has_change_note
 
     def set_has_definition(self, literal):
         """Aggiunge un literal a has_definition"""
-        self.has_definition.append(literal)
+        self._grow('has_definition').append(literal)
     
     def get_has_definition(self):
-        """Restituisce una copia della lista has_definition"""
-        return list(set(self.has_definition))
+        """Restituisce la lista has_definition"""
+        return self.has_definition
 
     def set_has_editorial_note(self, literal):
         """Aggiunge un literal a has_editorial_note"""
-        self.has_editorial_note.append(literal)
+        self._grow('has_editorial_note').append(literal)
     
     def get_has_editorial_note(self):
-        """Restituisce una copia della lista has_editorial_note"""
-        return list(set(self.has_editorial_note))
+        """Restituisce la lista has_editorial_note"""
+        return self.has_editorial_note
 
     def set_has_example(self, literal):
         """Aggiunge un literal a has_example"""
-        self.has_example.append(literal)
+        self._grow('has_example').append(literal)
     
     def get_has_example(self):
-        """Restituisce una copia della lista has_example"""
-        return list(set(self.has_example))
+        """Restituisce la lista has_example"""
+        return self.has_example
 
     def set_has_history_note(self, literal):
         """Aggiunge un literal a has_history_note"""
-        self.has_history_note.append(literal)
+        self._grow('has_history_note').append(literal)
     
     def get_has_history_note(self):
-        """Restituisce una copia della lista has_history_note"""
-        return list(set(self.has_history_note))
+        """Restituisce la lista has_history_note"""
+        return self.has_history_note
 
     def set_has_scope_note(self, literal):
         """Aggiunge un literal a has_scope_note"""
-        self.has_scope_note.append(literal)
+        self._grow('has_scope_note').append(literal)
     
     def get_has_scope_note(self):
-        """Restituisce una copia della lista has_scope_note"""
-        return list(set(self.has_scope_note))
+        """Restituisce la lista has_scope_note"""
+        return self.has_scope_note
 
     def set_see_also(self, resource):
         """Aggiunge una risorsa a see_also"""
-        self.see_also.append(resource)
+        self._grow('see_also').append(resource)
     
     def get_see_also(self):
-        """Restituisce una copia della lista see_also"""
-        return list(set(self.see_also))
+        """Restituisce la lista see_also"""
+        return self.see_also
 
     def set_is_defined_by(self, resource):
         """Aggiunge una risorsa a is_defined_by"""
-        self.is_defined_by.append(resource)
+        self._grow('is_defined_by').append(resource)
     
     def get_is_defined_by(self):
-        """Restituisce una copia della lista is_defined_by"""
-        return list(set(self.is_defined_by))
+        """Restituisce la lista is_defined_by"""
+        return self.is_defined_by
 
     def set_has_version_info(self, resource):
         """Aggiunge una risorsa a has_version_info"""
-        self.has_version_info.append(resource)
+        self._grow('has_version_info').append(resource)
     
     def get_has_version_info(self):
-        """Restituisce una copia della lista has_version_info"""
-        return list(set(self.has_version_info))
+        """Restituisce la lista has_version_info"""
+        return self.has_version_info
 
     def set_has_type(self, concept):
-        if concept not in self.has_type:
-            self.has_type.append(concept)
+        self._grow('has_type').append(concept)
 
     def get_has_type(self):
-        return list(self.has_type)
+        return self.has_type
 
     def set_is_included_in(self, model):
         """Aggiunge un model a is_included_in"""
-        self.is_included_in.append(model)
+        self._grow('is_included_in').append(model)
     
     def get_is_included_in(self):
-        """Restituisce una copia della lista is_included_in"""
-        return list(set(self.is_included_in))
+        """Restituisce la lista is_included_in"""
+        return self.is_included_in
 
     def set_has_contributor(self, literal):
-        self.has_contributor.append(literal)
+        self._grow('has_contributor').append(literal)
 
     def get_has_contributor(self):
-        return list(set(self.has_contributor))
+        return self.has_contributor
 
     def set_has_creator(self, literal):
-        self.has_creator.append(literal)
+        self._grow('has_creator').append(literal)
 
     def get_has_creator(self):
-        return list(set(self.has_creator))
+        return self.has_creator
     
     def get_also_defined_as(self):
         """Returns the list of also defined as"""
-        return list(self.also_defined_as)
+        return self.also_defined_as
     
     def set_also_defined_as(self, resource):
         """Aggiunge un Resource alla lista di also_defined_as"""
-        self.also_defined_as.append(resource)
\ No newline at end of file
+        self._grow('also_defined_as').append(resource)
+
+
+Resource._field_names = Resource.__slots__
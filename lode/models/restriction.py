@@ -2,6 +2,8 @@ from .concept import Concept
 
 class Restriction(Concept):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -1,13 +1,15 @@
-from .resource import Resource
+from .resource import Resource, EMPTY
 
 class Rule(Resource):
+
+    __slots__ = ('has_antecedent', 'has_consequent')
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.has_antecedent = []  # Atom [1..*]
-        self.has_consequent = []  # Atom [1..*]
+        self.has_antecedent = EMPTY  # Atom [1..*]
+        self.has_consequent = EMPTY  # Atom [1..*]
 
-    def get_has_antecedent(self): return list(self.has_antecedent)
-    def set_has_antecedent(self, atom): self.has_antecedent.append(atom)
+    def get_has_antecedent(self): return self.has_antecedent
+    def set_has_antecedent(self, atom): self._grow('has_antecedent').append(atom)
 
-    def get_has_consequent(self): return list(self.has_consequent)
-    def set_has_consequent(self, atom): self.has_consequent.append(atom)
\ No newline at end of file
+    def get_has_consequent(self): return self.has_consequent
+    def set_has_consequent(self, atom): self._grow('has_consequent').append(atom)
\ No newline at end of file
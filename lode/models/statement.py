@@ -2,6 +2,10 @@ from .resource import Resource
 
 class Statement(Resource):
 
+    # __dict__: the extra triples of a reified statement are stored as ad-hoc
+    # attributes named after their predicate (BaseLogic._create_nested_statement)
+    __slots__ = ('is_positive_statement', 'has_subject', 'has_object', 'has_predicate', '__dict__')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -1,7 +1,10 @@
 from .restriction import Restriction
+from .resource import EMPTY
 
 class TruthFunction(Restriction):
 
+    __slots__ = ('has_logical_operator', 'applies_on_concept')
+
     # the has_cardinality_type can have one of three values: "max", "min", and "exact". Any other string will be interpreted as "exact".
     # fallback = exact
     
@@ -9,7 +12,7 @@ class TruthFunction(Restriction):
         super().__init__(**kwargs)
 
         self.has_logical_operator = None # string[1]
-        self.applies_on_concept = [] # 1..*
+        self.applies_on_concept = EMPTY # 1..*
 
     def get_has_logical_operator(self):
         """Restituisce la stringa per has_logical_operator"""
@@ -21,9 +24,9 @@ class TruthFunction(Restriction):
 
     def get_applies_on_concept(self):
         """Restituisce la lista applies on concept"""
-        return list(self.applies_on_concept)
+        return self.applies_on_concept
         
     def set_applies_on_concept(self, concept):
         """Aggiunge un Concept a applies_on_concept """
-        self.applies_on_concept.append(concept)
+        self._grow('applies_on_concept').append(concept)
 
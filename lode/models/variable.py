@@ -1,5 +1,7 @@
 from .resource import Resource
 
 class Variable(Resource):
+
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
\ No newline at end of file
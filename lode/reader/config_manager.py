@@ -13,6 +13,8 @@ class ConfigManager(ABC):
         self.config = self._load_config()
         self._type_mapping_cache = None
         self._property_mapping_cache = None
+        self._classifier_cache = None
+        self._classification_memo = {}
     
     @abstractmethod
     def create_logic(self, graph: Graph, cache: dict):
@@ -177,19 +179,41 @@ class ConfigManager(ABC):
             - classify: false nel config: il predicato non classifica il soggetto,
               serve solo per i setters in phase3 (es. facet XSD)
             """
-            fallback = None
-            inferred = None
-            for predicate, cfg in self.get_property_mapping().items():
-                if (uri, predicate, None) in graph:
-                    if 'inferred_class' in cfg:
-                        candidate = cfg['inferred_class']
-                        if inferred is None or issubclass(candidate, inferred):
-                            inferred = candidate
-                    elif fallback is None and len(cfg.get('target_classes', [])) == 1:
-                        if cfg.get('classify', True):
-                            fallback = cfg['target_classes'][0]
-            return inferred if inferred else fallback
-    
+            classifiers = self.get_predicate_classifiers()
+            return self.classify_predicates(p for p in graph.predicates(uri, None) if p in classifiers)
+
+    def get_predicate_classifiers(self) -> dict:
+        """predicate -> (position in the mapping, inferred_class, fallback class)
+        for the predicates that can classify their subject (see classify_by_predicate)."""
+        if self._classifier_cache is None:
+            classifiers = {}
+            for position, (predicate, cfg) in enumerate(self.get_property_mapping().items()):
+                if 'inferred_class' in cfg:
+                    classifiers[predicate] = (position, cfg['inferred_class'], None)
+                elif len(cfg.get('target_classes', [])) == 1 and cfg.get('classify', True):
+                    classifiers[predicate] = (position, None, cfg['target_classes'][0])
+            self._classifier_cache = classifiers
+        return self._classifier_cache
+
+    def classify_predicates(self, predicates) -> type | None:
+        """classify_by_predicate for a subject whose classifying predicates are
+        already known; memoized per predicate set (subjects mostly share a few)."""
+        key = frozenset(predicates)
+        if key in self._classification_memo:
+            return self._classification_memo[key]
+        classifiers = self.get_predicate_classifiers()
+        fallback = None
+        inferred = None
+        # mapping order, as the scan over the property mapping did
+        for _, candidate, single in sorted(classifiers[p] for p in key):
+            if candidate is not None:
+                if inferred is None or issubclass(candidate, inferred):
+                    inferred = candidate
+            elif fallback is None:
+                fallback = single
+        result = self._classification_memo[key] = inferred if inferred else fallback
+        return result
+
     def get_punning_priority(self):
         names = self.config.get('punning_priority', [])
         return [self._parse_class(n) for n in names]
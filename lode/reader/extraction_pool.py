@@ -0,0 +1,207 @@
+# extraction_pool.py - ESTRAZIONE IN PROCESSI SEPARATI
+"""
+Pool of pre-started extraction processes.
+
+Extraction is pure-Python CPU work, so threads cannot spread it over cores, and
+a pathological artefact would otherwise pin the web worker until gunicorn kills
+it. Each job instead runs in a pool process under:
+
+- RLIMIT_AS (address space) and RLIMIT_CPU (CPU seconds for this job), applied
+  inside the child, where exceeding them kills only that process;
+- a wall-clock deadline enforced by the parent;
+- a cancel event (client disconnected) that terminates the job.
+
+A process that is killed for any of these reasons is replaced, and the caller
+gets an ExtractionLimitError. Jobs exchange only small picklable values: the
+heavy result (the extracted Reader) travels as a snapshot in the spool.
+"""
+import logging
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+
+from lode import exceptions
+from lode.exceptions import ArtefactLoadError, ExtractionLimitError
+
+try:
+    import resource
+except ImportError:  # non-POSIX: no per-job rlimits, deadline still applies
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 0.1  # seconds between deadline / cancel checks
+
+
+# ----------------------------------------------------------
+#  JOBS (run inside the pool processes)
+# ----------------------------------------------------------
+
+def extract_to_snapshot(source, read_as, imported, closure, warnings, snapshot_path,
+                        format=None) -> bool:
+    """Extract `source` and persist the Reader at `snapshot_path`.
+    Returns False if the model could not be snapshotted."""
+    from lode.reader import Reader
+    reader = Reader()
+    reader.load_instances(source, read_as, imported=imported, closure=closure, warnings=warnings,
+                          format=format)
+    return reader.save_snapshot(snapshot_path)
+
+
+# ----------------------------------------------------------
+#  CHILD PROCESS
+# ----------------------------------------------------------
+
+def _apply_memory_limit(max_memory_mb: int) -> None:
+    if resource is None or max_memory_mb <= 0:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def _arm_cpu_limit(max_cpu_s: int) -> None:
+    """RLIMIT_CPU counts the whole process lifetime: re-arm it before every job
+    so each one gets `max_cpu_s` on top of what the process already used."""
+    if resource is None or max_cpu_s <= 0:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + max_cpu_s
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+def _worker_main(conn, max_memory_mb: int, max_cpu_s: int) -> None:
+    # the parent handles Ctrl+C / shutdown; a job must not be torn mid-write by SIGINT
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _apply_memory_limit(max_memory_mb)
+    while True:
+        try:
+            fn, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        _arm_cpu_limit(max_cpu_s)
+        try:
+            result = ("ok", fn(*args))
+        except MemoryError:
+            result = ("error", "ExtractionLimitError", "Memory limit exceeded",
+                      {"limit": "memory", "max_memory_mb": max_memory_mb})
+        except Exception as e:
+            context = getattr(e, "context", None) or {"original_error": str(e)}
+            result = ("error", type(e).__name__, str(e), context)
+        try:
+            conn.send(result)
+        except Exception as e:  # unpicklable result / context
+            conn.send(("error", "ArtefactLoadError", "Extraction failed", {"original_error": str(e)}))
+
+
+# ----------------------------------------------------------
+#  PARENT SIDE
+# ----------------------------------------------------------
+
+class _Worker:
+    def __init__(self, ctx, max_memory_mb, max_cpu_s):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, max_memory_mb, max_cpu_s),
+                                   name="lode-extract", daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ExtractionPool:
+    """Fixed-size pool of extraction processes (see module docstring)."""
+
+    def __init__(self, processes: int, deadline_s: float, max_memory_mb: int = 0, max_cpu_s: int = 0):
+        self.processes = processes
+        self.deadline_s = deadline_s
+        self.max_memory_mb = max_memory_mb
+        self.max_cpu_s = max_cpu_s
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._ctx = multiprocessing.get_context(method)
+        self._idle = queue.Queue()
+        for _ in range(processes):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._ctx, self.max_memory_mb, self.max_cpu_s)
+
+    def run(self, fn, *args, cancel: threading.Event = None):
+        """Run `fn(*args)` in a pool process and return its result. `fn` and
+        `args` must be picklable (module-level function, plain values)."""
+        worker = self._idle.get()
+        reason = None
+        try:
+            worker.conn.send((fn, args))
+            deadline = time.monotonic() + self.deadline_s
+            while True:
+                if worker.conn.poll(_POLL_INTERVAL):
+                    try:
+                        result = worker.conn.recv()
+                    except (EOFError, OSError):
+                        reason = self._death_reason(worker)
+                        break
+                    self._idle.put(worker)
+                    worker = None
+                    return self._unwrap(result)
+                if cancel is not None and cancel.is_set():
+                    reason = "cancelled"
+                    break
+                if time.monotonic() > deadline:
+                    reason = "deadline"
+                    break
+                if not worker.process.is_alive():
+                    reason = self._death_reason(worker)
+                    break
+        finally:
+            if worker is not None:
+                # job killed (or the pipe broke): replace the process
+                worker.kill()
+                self._idle.put(self._spawn())
+
+        logger.warning("extraction job stopped: %s", reason)
+        raise ExtractionLimitError(
+            "Extraction stopped: the artefact exceeded the processing limits"
+            if reason != "cancelled" else "Extraction cancelled",
+            context={"limit": reason, "deadline_s": self.deadline_s,
+                     "max_memory_mb": self.max_memory_mb, "max_cpu_s": self.max_cpu_s},
+        )
+
+    @staticmethod
+    def _death_reason(worker) -> str:
+        worker.process.join(1)
+        code = worker.process.exitcode
+        if hasattr(signal, "SIGXCPU") and code == -signal.SIGXCPU:
+            return "cpu"
+        if code == -signal.SIGKILL:
+            return "memory"  # OOM killer
+        return f"exit code {code}"
+
+    @staticmethod
+    def _unwrap(result):
+        if result[0] == "ok":
+            return result[1]
+        _, name, message, context = result
+        exc_type = getattr(exceptions, name, None)
+        if isinstance(exc_type, type) and issubclass(exc_type, exceptions.LODEError):
+            raise exc_type(message, context=context)
+        raise ArtefactLoadError("Extraction failed", context={"error": name, **context})
+
+    def shutdown(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
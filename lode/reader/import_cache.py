@@ -0,0 +1,101 @@
+# import_cache.py - CACHE PERSISTENTE DELLE ONTOLOGIE IMPORTATE
+"""
+On-disk cache of owl:imports targets, keyed by the normalized import IRI.
+
+The same few vocabularies (dcterms, foaf, prov-o, skos, SPAR core modules) are
+imported by most ontologies we render. Each import is stored once, as a spool
+graph entry (see lode.reader.spool) whose header keeps the IRI and the HTTP
+validators (ETag / Last-Modified):
+
+- younger than IMPORT_CACHE_FRESH  -> served from disk, no request at all;
+- older                            -> conditional GET; 304 keeps the entry;
+- unreachable on revalidation      -> the stale copy is served.
+
+The file mtime is the last (re)validation time, so eviction follows the spool
+policy (lode.reader.spool.prune_dir) with its own TTL and size budget.
+"""
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from rdflib import Graph
+
+from lode.reader import spool
+from lode.reader.security import _env_int
+
+IMPORT_CACHE_DIR = os.getenv("LODE_IMPORT_CACHE_DIR") or str(
+    Path(__file__).resolve().parent.parent / "spool" / "imports")
+IMPORT_CACHE_FRESH = _env_int("LODE_IMPORT_CACHE_FRESH", 24 * 60 * 60)     # seconds
+IMPORT_CACHE_TTL = _env_int("LODE_IMPORT_CACHE_TTL", 7 * 24 * 60 * 60)     # seconds
+IMPORT_CACHE_MAX_BYTES = _env_int("LODE_IMPORT_CACHE_MB", 256) * 1024 * 1024
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(IMPORT_CACHE_DIR, hashlib.sha256(key.encode()).hexdigest()[:32] + ".rdf")
+
+
+def fetch(source: str, key: str) -> Graph:
+    """Graph of the import `source` (deduplication `key` = normalized IRI),
+    from the cache when fresh or still valid, downloaded otherwise."""
+    from lode.reader.loader import Loader
+
+    os.makedirs(IMPORT_CACHE_DIR, exist_ok=True)
+    path = _entry_path(key)
+    params = _cached_params(path, key)
+
+    if params is not None and time.time() - os.path.getmtime(path) < IMPORT_CACHE_FRESH:
+        cached = _read_cached(path)
+        if cached is not None:
+            return cached
+        params = None
+
+    loader = Loader()
+    try:
+        modified = loader.load_if_modified(
+            source,
+            etag=params.get("etag") if params else None,
+            last_modified=params.get("last_modified") if params else None,
+        )
+    except Exception:
+        if params is None:
+            raise
+        cached = _read_cached(path)
+        if cached is None:
+            raise
+        print(f"  [modules] Warning: could not revalidate {source}, using cached copy")
+        return cached
+
+    if not modified:
+        cached = _read_cached(path)
+        if cached is not None:
+            os.utime(path)  # revalidated: fresh again
+            return cached
+        # entry vanished meanwhile (pruned): download it unconditionally
+        loader = Loader()
+        loader.load_if_modified(source)
+
+    graph = loader.get_graph()
+    try:
+        spool.prune_dir(IMPORT_CACHE_DIR, IMPORT_CACHE_TTL, IMPORT_CACHE_MAX_BYTES)
+        spool.write_graph(graph, path, iri=key, **loader.validators)
+    except (OSError, ValueError):
+        pass  # not cacheable (disk, or a term the spool cannot hold): serve it anyway
+    return graph
+
+
+def _read_cached(path: str) -> Optional[Graph]:
+    try:
+        return spool.read_graph(path)[0]
+    except Exception:
+        return None
+
+
+def _cached_params(path: str, key: str) -> Optional[dict]:
+    try:
+        params = spool.read_params(path)
+    except Exception:
+        return None
+    # hash collisions / foreign files are treated as a miss
+    return params if params.get("iri") == key else None
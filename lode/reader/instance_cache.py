@@ -0,0 +1,87 @@
+# instance_cache.py - CACHE DELLE ISTANZE CON INDICE PER IRI
+"""
+The instance cache shared by Reader, Logic and the viewers: node (URIRef or
+BNode) -> set of model instances. Literals are not entities and live in the
+logic's own intern table (BaseLogic._literals).
+
+On top of the plain dict it keeps an index from the string form of every key to
+the key itself, so resource pages and export_resource resolve an IRI in O(1)
+instead of comparing str(key) for every entry. Entries are mutated in place
+(get_or_create promotions, _force_as_concept): only key insertions and removals
+have to be mirrored in the index, and every dict mutator below does it.
+"""
+from typing import Optional
+
+
+class InstanceCache(dict):
+    """dict node -> set of instances, indexed by str(node)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._by_str = {}
+        self.update(*args, **kwargs)
+
+    # ----------------------------------------------------------
+    #  LOOKUP
+    # ----------------------------------------------------------
+
+    def key_for(self, iri: str):
+        """The cache key whose string form is `iri` (the first inserted, if
+        several nodes share it), or None."""
+        return self._by_str.get(iri)
+
+    def lookup(self, iri: str) -> Optional[set]:
+        key = self._by_str.get(iri)
+        return None if key is None else self[key]
+
+    # ----------------------------------------------------------
+    #  DICT MUTATORS (kept in sync with the index)
+    # ----------------------------------------------------------
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._by_str.setdefault(str(key), key)
+        super().__setitem__(key, value)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._unindex(key)
+
+    def pop(self, key, *default):
+        present = key in self
+        value = super().pop(key, *default)
+        if present:
+            self._unindex(key)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._unindex(key)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._by_str.clear()
+
+    def _unindex(self, key) -> None:
+        s = str(key)
+        if self._by_str.get(s) == key:
+            del self._by_str[s]
+            # another node with the same string form takes over (rare: never in practice)
+            for other in self:
+                if str(other) == s:
+                    self._by_str[s] = other
+                    break
+
+    def __reduce__(self):
+        # rebuilt through __init__, so the index is restored with the entries
+        return (self.__class__, (dict(self),))
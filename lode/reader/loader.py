@@ -2,35 +2,145 @@
 Reader - Caricamento e validazione file RDF
 """
 import requests
+import io
 import os
+import re
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from rdflib import Graph
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Optional, Union
 from urllib.parse import urlparse, urljoin 
 
 import lode.reader.modules as modules
 from lode.reader import security
+from lode.reader import spool
 from lode.exceptions import ArtefactLoadError, ArtefactNotFoundError, ArtefactValidationError
 
+logger = logging.getLogger(__name__)
+
+# What Loader.load accepts: path / URL, raw bytes, a binary stream, a parsed graph
+Source = Union[str, bytes, BinaryIO, Graph]
+
+# ----------------------------------------------------------
+#  POOLED HTTP SESSION (per worker process)
+# ----------------------------------------------------------
+
+# Hosts kept in the pool, and keep-alive connections kept per host
+HTTP_POOL_HOSTS = security._env_int("LODE_HTTP_POOL_HOSTS", 16)
+HTTP_POOL_PER_HOST = security._env_int("LODE_HTTP_POOL_PER_HOST", 8)
+# Redirect bodies up to this size are drained so their connection is reused
+_DRAIN_LIMIT = 64 * 1024
+
+_session = None
+_session_lock = threading.Lock()
+
+def _http_session() -> requests.Session:
+    """Shared keep-alive session: a w3id.org -> github -> raw redirect chain
+    reuses its TCP/TLS connections across hops and across requests. Redirects
+    are still followed (and SSRF-checked) by hand, one hop at a time."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_PER_HOST)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                # shared by every request of the worker: never carry cookies across
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                _session = session
+    return _session
+
+# Ordered trial list, only used when detection is not confident (or was wrong)
+_FALLBACK_FORMATS = ['xml', 'turtle', 'n3', 'nt', 'json-ld']
+
+# Extensions accepted by security.check_extension -> rdflib format
+_EXT_TO_FORMAT = {
+    ".rdf": "xml", ".owl": "xml", ".xml": "xml",
+    ".ttl": "turtle", ".n3": "n3", ".nt": "nt", ".jsonld": "json-ld",
+}
+
+
+def _format_hint(format: Optional[str]) -> Optional[str]:
+    """rdflib format name for a `format` hint given as a name or an extension."""
+    if not format:
+        return None
+    return _EXT_TO_FORMAT.get("." + format.lower().lstrip("."), format)
+
+
+_SNIFF_BYTES = 4096
+_NT_LINE = re.compile(r'^(<[^<>"\s]*>|_:\S+)\s+<[^<>"\s]*>\s+(<[^<>"\s]*>|_:\S+|".*)\s*\.\s*(#.*)?$')
+_XML_START = re.compile(r'^<(\?xml|!DOCTYPE|!--|[A-Za-z_][\w.-]*(:[A-Za-z_][\w.-]*)?[\s/>])')
+_TURTLE_DIRECTIVE = re.compile(r'^(@prefix|@base)\s|^(PREFIX|BASE)\s', re.IGNORECASE)
+
+
+def detect_format(head: bytes, path: str = "") -> tuple[Optional[str], str]:
+    """Guess the rdflib format of a document from its first bytes and extension.
+
+    Returns (format, reason); format is None when the input is ambiguous and the
+    caller has to fall back to trial parsing. The content sniff wins over the
+    extension.
+    """
+    ext_format = _EXT_TO_FORMAT.get(os.path.splitext(path)[1].lower())
+    text = head.decode("utf-8", errors="ignore").lstrip("\ufeff")
+    lines = text.splitlines()
+    if len(head) >= _SNIFF_BYTES and lines:
+        lines = lines[:-1]  # last line may be cut by the sniff window
+    lines = [l.strip() for l in lines]
+    lines = [l for l in lines if l]
+
+    body = [l for l in lines if not l.startswith("#")]
+    if not body:
+        return ext_format, "extension (empty sniff)" if ext_format else "no content"
+    first = body[0]
+
+    if _XML_START.match(first):
+        return "xml", "sniff: XML prolog/element"
+    if first[0] in "{[":
+        return "json-ld", "sniff: JSON"
+    if any(_TURTLE_DIRECTIVE.match(l) for l in body):
+        # n3 is a superset of turtle: honour an explicit .n3
+        return ("n3" if ext_format == "n3" else "turtle"), "sniff: turtle directives"
+    if all(_NT_LINE.match(l) for l in body):
+        return "nt", "sniff: N-Triples lines"
+    if ext_format in ("turtle", "n3", "nt", "json-ld"):
+        return ext_format, "extension"
+    return None, "ambiguous"
+
 
 class Loader:
     """Gestisce il caricamento di file RDF"""
 
-    def __init__(self, file_path: Optional[str] = None, imported=None, closure=None):
-        
+    def __init__(self, file_path: Optional[Source] = None, imported=None, closure=None,
+                 format: Optional[str] = None):
+
         self.graph = Graph()
         self._imported = imported
         self._closure = closure
+        self._modules_applied = False
+        # HTTP cache validators of the last URL fetched (ETag / Last-Modified)
+        self.validators = {}
+        self.not_modified = False
 
-        if file_path:
-            self.load(file_path)
+        if isinstance(file_path, Graph) or file_path:  # an empty Graph is falsy
+            self.load(file_path, format=format)
 
     # ----------------------------------------------------------
     #  MAIN LOAD METHOD
     # ----------------------------------------------------------
-    def load(self, source: str) -> None:
-        """Loads RDF from local file or from URL with content negotiation"""
-
-        if self._is_url(source):
+    def load(self, source: Source, format: Optional[str] = None) -> None:
+        """Loads RDF from local file or from URL with content negotiation, or from
+        memory: bytes / a binary stream or an already parsed rdflib.Graph.
+        `format` (rdflib name or extension) is an optional hint for local files
+        and in-memory sources."""
+
+        if isinstance(source, Graph):
+            self._load_from_graph(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)) or hasattr(source, "read"):
+            self._load_from_memory(source, format)
+        elif self._is_url(source):
             self._load_from_url_with_content_negotiation(source)
         else:
             # A value carrying a URL scheme that is not http(s) (file:, ftp:, ...)
@@ -42,7 +152,7 @@ class Loader:
                     "URL scheme not allowed; use http(s)://host",
                     context={"scheme": scheme},
                 )
-            self._load_from_local_file(source)
+            self._load_from_local_file(source, format)
 
         if len(self.graph) == 0:
             raise ArtefactLoadError(
@@ -50,7 +160,8 @@ class Loader:
                 context={"source": source}
             )
         
-        self._apply_modules()
+        if not self._modules_applied:
+            self._apply_modules()
     
     # ----------------------------------------------------------
     #  MODULES MAIN HANDLER
@@ -58,17 +169,36 @@ class Loader:
 
     def _apply_modules(self) -> None:
 
-        if self._imported and self._closure:
+        # closure already contains the direct imports: never fetch them twice
+        if self._closure:
             self.graph = modules.apply_closure(self.graph)
-        if self._imported:
+        elif self._imported:
             self.graph = modules.apply_imported(self.graph)
-        elif self._closure:
-            self.graph = modules.apply_closure(self.graph)
+
+    def load_if_modified(self, url: str, etag: Optional[str] = None,
+                         last_modified: Optional[str] = None) -> bool:
+        """Conditional GET of `url` (no modules applied). Returns False when the
+        server answers 304 Not Modified: the graph is then left empty and the
+        caller keeps its cached copy."""
+        conditional = {}
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        self._load_from_url_with_content_negotiation(url, conditional)
+        if self.not_modified:
+            return False
+        if len(self.graph) == 0:
+            raise ArtefactLoadError(
+                "Parsed graph is empty (wrong URL or not an RDF resource)",
+                context={"source": url}
+            )
+        return True
 
     ## ----------------------------------------------------------
     #  CONTENT NEGOTIATION FOR URLS
     # ----------------------------------------------------------
-    def _load_from_url_with_content_negotiation(self, url: str) -> None:
+    def _load_from_url_with_content_negotiation(self, url: str, conditional: Optional[Dict[str, str]] = None) -> None:
         """RDF graph loading with content-negotiation for semantic artefact loaded from URL"""
 
         security.check_url_safe(url)  # SECURITY: url validation (anti-SSRF), before downlaod 
@@ -77,7 +207,8 @@ class Loader:
             "Accept": (
                 "text/turtle, application/rdf+xml, application/ld+json, "
                 "application/n-triples, application/n-quads, */*;q=0.1"
-            )
+            ),
+            **(conditional or {}),
         }
 
         response = None
@@ -85,6 +216,15 @@ class Loader:
             # SECURITY: fetch with per-hop URL validation (anti-SSRF); manual redirects, no auto-follow into unchecked hosts
             response = self._fetch_following_redirects(url, headers)
 
+            self.validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            if response.status_code == 304 and conditional:
+                response.close()
+                self.not_modified = True
+                return
+
             # Error: Cannot Load RDF
             if response.status_code != 200:
                 raise ArtefactNotFoundError(
@@ -97,21 +237,14 @@ class Loader:
             if declared and declared.isdigit():
                 security.check_size(int(declared))
 
-            # SECURITY: stop if file > 10MB even without Content-Length
-            raw = b""
-            for chunk in response.iter_content(8192): # 8kb at the time in iteration
-                raw += chunk
-                if len(raw) > security.MAX_BYTES:
-                    security.check_size(len(raw))  
-
-            # SECURITY: checks the file is text not binary
-            security.check_is_text(raw)
-
-            # Proceed with encoding
-            content = raw.decode("utf-8")
-
-            # SECURITY: block XXE / entity-expansion on remote artefacts and owl:imports
-            security.check_safe_xml(content)
+            # SECURITY: size (even without Content-Length), text-only and XXE checks
+            # run on each chunk as it arrives; the body is kept once, in `buffer`
+            validator = security.TextStreamValidator()
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(64 * 1024):
+                validator.feed(chunk)
+                buffer.write(chunk)
+            validator.close()
 
             content_type = response.headers.get("Content-Type", "").lower()
 
@@ -122,14 +255,14 @@ class Loader:
 
             if guessed_format:
                 try:
-                    self.graph.parse(data=content, format=guessed_format)
+                    self._parse(buffer, guessed_format)
                     return
                 except Exception:
                     pass  # fallback below
 
             for fmt in ["xml", "turtle", "json-ld", "nt", "n3"]:
                 try:
-                    self.graph.parse(data=content, format=fmt)
+                    self._parse(buffer, fmt)
                     return
                 except Exception:
                     continue
@@ -146,26 +279,90 @@ class Loader:
                 "Network error fetching artefact",
                 context={"url": url, "original_error": str(e)}
             )
+        finally:
+            # hand the (fully read) connection back to the pool
+            if response is not None:
+                response.close()
 
     # ----------------------------------------------------------
     #  LOCAL FILE LOADING
     # ----------------------------------------------------------
-    def _load_from_local_file(self, path: str) -> None: 
+    def _load_from_local_file(self, path: str, format: Optional[str] = None) -> None:
+
+        # /extract spool entry: fixed format, no sniffing; owl:imports already
+        # expanded when the entry was written with imported/closure
+        if spool.is_spool_file(path):
+            self.graph, params = spool.read_graph(path)
+            self._modules_applied = bool(params.get("modules_applied"))
+            return
 
         with open(path, "rb") as f:
             raw = f.read()
+        self._parse_detected(raw, path, context={"path": path}, hint=_format_hint(format))
 
-        for fmt in ['xml', 'turtle', 'n3', 'nt', 'json-ld']:
+    # ----------------------------------------------------------
+    #  IN-MEMORY SOURCES
+    # ----------------------------------------------------------
+    def _load_from_graph(self, graph: Graph) -> None:
+        if self._imported or self._closure:
+            # imports are merged into self.graph: never into the caller's graph
+            self.graph = Graph()
+            for prefix, ns in graph.namespaces():
+                self.graph.bind(prefix, ns, override=True, replace=True)
+            self.graph += graph
+        else:
+            self.graph = graph
+
+    def _load_from_memory(self, source, format: Optional[str]) -> None:
+        if hasattr(source, "read"):
+            name = getattr(source, "name", None)
+            name = name if isinstance(name, str) else "<stream>"
+            seekable = getattr(source, "seekable", lambda: False)()
+            if not seekable or isinstance(source, io.TextIOBase):
+                source = source.read()
+                if isinstance(source, str):
+                    source = source.encode("utf-8")
+        else:
+            name = "<bytes>"
+        if isinstance(source, (bytearray, memoryview)):
+            source = bytes(source)
+        self._parse_detected(source, name, context={"source": name}, hint=_format_hint(format))
+
+    def _parse_detected(self, source, name: str, context: dict, hint: Optional[str] = None) -> None:
+        """Parse bytes or a seekable binary stream: the `hint` format or the
+        sniffed one first, then every other format in turn."""
+        if hint:
+            detected, reason = hint, "format hint"
+        else:
+            if isinstance(source, bytes):
+                head = source[:_SNIFF_BYTES]
+            else:
+                source.seek(0)
+                head = source.read(_SNIFF_BYTES)
+            detected, reason = detect_format(head, name)
+        if detected:
             try:
-                self.graph = Graph()
-                self.graph.parse(data=raw, format=fmt)
+                self._parse(source, detected)
+                logger.info("format detection: %s -> %s (%s)", name, detected, reason)
                 return
             except Exception:
+                logger.warning("format detection: %s -> %s (%s) failed to parse, falling back",
+                               name, detected, reason)
+        else:
+            logger.info("format detection: %s -> ambiguous, trying %s", name, _FALLBACK_FORMATS)
+
+        for fmt in _FALLBACK_FORMATS:
+            if fmt == detected:
                 continue
-    
-        raise ArtefactLoadError( 
+            try:
+                self._parse(source, fmt)
+                return
+            except Exception:
+                continue
+
+        raise ArtefactLoadError(
             "Could not parse RDF with any known format",
-            context={"path": path}
+            context=context
         )
 
     # ----------------------------------------------------------
@@ -190,6 +387,17 @@ class Loader:
 
     def get_graph(self) -> Graph:
         return self.graph
+
+    def _parse(self, source, fmt: str) -> None:
+        """Parse bytes, or a binary stream from its start, into a fresh graph
+        (self.graph is left untouched on failure)."""
+        graph = Graph()
+        if isinstance(source, bytes):
+            graph.parse(data=source, format=fmt)
+        else:
+            source.seek(0)
+            graph.parse(source=source, format=fmt)
+        self.graph = graph
     
     def _fetch_following_redirects(self, url: str, headers: dict, max_redirects: int = security.MAX_REDIRECTS):
         """Follow URLs redirects manually, validating each hop via security.check_url_safe. Returns final response.
@@ -198,14 +406,14 @@ class Loader:
         current = url
         for _ in range(max_redirects):
             security.check_url_safe(current)
-            response = requests.get(current, headers=headers, timeout=10,
-                                    stream=True, allow_redirects=False)
+            response = _http_session().get(current, headers=headers, timeout=10,
+                                           stream=True, allow_redirects=False)
             # Validate the IP we ACTUALLY connected to, before reading anything:
             # defeats DNS rebinding between check_url_safe above and this connect.
             self._verify_peer_ip(response)
             if response.status_code in (301, 302, 303, 307, 308):
                 location = response.headers.get("Location")
-                response.close()
+                self._drain(response)
                 if not location:
                     raise ArtefactLoadError("Redirect without Location", context={"url": current})
                 current = urljoin(current, location)
@@ -213,6 +421,22 @@ class Loader:
             return response
         raise ArtefactLoadError("Too many redirects", context={"url": url})
 
+    @staticmethod
+    def _drain(response) -> None:
+        """Close a response we do not need, reading a small body first so the
+        pooled connection goes back to the pool instead of being dropped."""
+        try:
+            declared = response.headers.get("Content-Length")
+            if declared is None or (declared.isdigit() and int(declared) <= _DRAIN_LIMIT):
+                read = 0
+                for chunk in response.iter_content(8192):
+                    read += len(chunk)
+                    if read > _DRAIN_LIMIT:
+                        break
+        except Exception:
+            pass
+        response.close()
+
     def _verify_peer_ip(self, response) -> None:
         """Re-check the SSRF policy against the socket's real peer IP. If it
         cannot be determined (e.g. mocked in tests) fall back to the per-hop
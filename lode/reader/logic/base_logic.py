@@ -1,5 +1,6 @@
 # base_logic.py
 from abc import ABC, abstractmethod
+from collections import deque
 from rdflib import Graph, URIRef, Node, Literal as RDFlibLiteral, BNode
 from rdflib.namespace import RDF, RDFS, OWL, SKOS, XSD, Namespace
 from rdflib.collection import Collection as RDFLibCollection
@@ -8,6 +9,14 @@ SWRL_NS = Namespace("http://www.w3.org/2003/11/swrl#")
 
 from lode.models import *
 
+# built-in datatypes: always Datatype in get_or_create, no exceptions
+DATATYPE_BUILTINS = frozenset({
+    RDFS.Literal, RDF.XMLLiteral, RDF.HTML,
+    RDF.PlainLiteral, RDF.langString, RDF.JSON,
+    OWL.real, OWL.rational
+})
+_XSD_NS = str(XSD)
+
 class BaseLogic(ABC):
     """
     Logica base comune per parsing RDF.
@@ -20,12 +29,37 @@ class BaseLogic(ABC):
         self._property_mapping = strategy.get_property_mapping()
         self._allowed_classes = self._get_allowed_classes()
         self._triples_map = {}
+        # (lexical form, language, datatype) -> Literal: literals are interned
+        # here, apart from the instance cache, which only holds entity nodes
+        self._literals = {}
+        # subject instance -> its Statements, kept up to date while phase 6 creates them
+        self._statements_by_subject = {}
+        # BNode -> triples of its BNode-transitive closure (provenance)
+        self._bnode_closures = {}
+        # next_getter -> (parent -> children, child -> parents), for "down" traversals
+        self._children_index = {}
+        # predicate -> compiled dispatch plan for populate_instance (_compile_predicate)
+        self._predicate_plan = {}
+        self._punning_priority = None
+        # node -> {requested class: (instance, its class)}: get_or_create fast path
+        self._resolved = {}
+        # URIRef -> whether get_or_create always builds a Datatype for it
+        self._forced_datatype = {}
+        self._named_individual_nodes = None
+        # Python class -> nearest allowed ancestor (_resolve_allowed_class)
+        self._allowed_ancestors = {}
         # Namespaces now driven by config YAML (key: 'namespaces')
         self._allowed_namespaces = self._get_allowed_namespaces()
         # Validate all handlers declared in config exist on this instance
         self._validate_handlers()
         self._warnings = []
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_predicate_plan'] = {}  # closures: rebuilt on demand
+        state['_resolved'] = {}
+        return state
+
     def add_warning(self, code, subject, message):
         self._warnings.append({'code': code, 'subject': str(subject), 'message': message})
 
@@ -84,6 +118,7 @@ class BaseLogic(ABC):
         pass
 
     def phase6_create_statements(self):
+        self._index_statements_by_subject()
         for subj, pred, obj in self.graph:
             # if pred in self._property_mapping:
             #     continue
@@ -99,6 +134,24 @@ class BaseLogic(ABC):
                 continue
             self._create_statement_for_triple(subj, pred, obj)
 
+    def _index_statements_by_subject(self):
+        """Seed the subject -> Statements index with the Statements already in
+        cache (reified through the config in the earlier phases); the ones phase 6
+        creates are added by _register_statement. Subjects are matched by identity,
+        so punned instances stay apart; the viewers and build_provenance_subgraph
+        look them up per entity instead of scanning every instance."""
+        index = {}
+        for instances in self._instance_cache.values():
+            for instance in instances:
+                if isinstance(instance, Statement):
+                    index.setdefault(instance.get_has_subject(), []).append(instance)
+        self._statements_by_subject = index
+
+    def _register_statement(self, statement):
+        subject = statement.get_has_subject()
+        if subject is not None:
+            self._statements_by_subject.setdefault(subject, []).append(statement)
+
     # ========== VALIDAZIONE CONFIG -> LOGIC ==========
 
     def _validate_handlers(self):
@@ -139,7 +192,8 @@ class BaseLogic(ABC):
         Before the MRO walk, calls _pre_resolve_hook to allow subclasses to
         short-circuit resolution with custom logic (e.g. reusing an existing
         cached type instead of silently downcasting).
-        Falls back to Resource if nothing is found.
+        Falls back to Resource if nothing is found. The MRO walk only depends
+        on the class, so its result is memoized per class.
         """
         if python_class in self._allowed_classes:
             return python_class
@@ -149,12 +203,15 @@ class BaseLogic(ABC):
         if resolved:
             return resolved
 
-        for parent_class in python_class.__mro__[1:]:
-            if parent_class in self._allowed_classes:
-                return parent_class
-
-        print(f"  [WARN] {python_class.__name__} -> Resource (fallback finale)")
-        return Resource
+        ancestor = self._allowed_ancestors.get(python_class)
+        if ancestor is None:
+            ancestor = next((parent_class for parent_class in python_class.__mro__[1:]
+                             if parent_class in self._allowed_classes), None)
+            if ancestor is None:
+                print(f"  [WARN] {python_class.__name__} -> Resource (fallback finale)")
+                ancestor = Resource
+            self._allowed_ancestors[python_class] = ancestor
+        return ancestor
 
     def _pre_resolve_hook(self, python_class: type, id: Node) -> type | None:
         """
@@ -176,6 +233,24 @@ class BaseLogic(ABC):
 
     # ========== UTILITIES ==========
 
+    def _collect_mapped_subjects(self) -> dict:
+        """Subjects of the mapped predicates -> their classifying predicates, in
+        one pass over those triples. Subjects come in the order they are first
+        met (property mapping order, then graph order), so phase 1 registers
+        them in the same order as before.
+        """
+        classifiers = self._strategy.get_predicate_classifiers()
+        subjects = {}
+        for pred in self._property_mapping:
+            classifying = pred in classifiers
+            for uri in self.graph.subjects(pred, None):
+                preds = subjects.get(uri)
+                if preds is None:
+                    preds = subjects[uri] = set()
+                if classifying:
+                    preds.add(pred)
+        return subjects
+
     def _traverse_hierarchy(
         self,
         start: object,
@@ -192,10 +267,10 @@ class BaseLogic(ABC):
         start        : starting node (Python model instance)
         next_getter  : name of the getter that returns the next nodes in the
                     'up' direction (e.g. 'get_is_sub_property_of').
-                    For 'down' the cache is scanned for instances that list
-                    `start` as one of their `next_getter` targets.
+                    For 'down' the instances that list the node as one of
+                    their `next_getter` targets (see _children_of).
         direction    : 'up'   - follow next_getter only
-                    'down' - scan cache for reverse links only
+                    'down' - follow reverse links only
                     'both' - up first, then down
         collect      : callable(node) -> value | None
                     Called on every visited node (including start).
@@ -208,11 +283,10 @@ class BaseLogic(ABC):
         Returns the first non-None value from collect, or None if visit_all is used.
         """
         visited = set()
-        queue = [start]
-        result = None
+        queue = deque([start])
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if id(current) in visited:
                 continue
             visited.add(id(current))
@@ -227,29 +301,61 @@ class BaseLogic(ABC):
 
             # --- enqueue next nodes ---
             if direction in ("up", "both"):
-                getter = getattr(current, next_getter, None)
-                if getter:
-                    nexts = getter()
-                    if nexts:
-                        if not isinstance(nexts, list):
-                            nexts = [nexts]
-                        queue.extend(nexts)
+                queue.extend(self._next_nodes(current, next_getter))
 
             if direction in ("down", "both"):
-                for instances_set in self._instance_cache.values():
-                    for inst in instances_set:
-                        if inst is current or id(inst) in visited:
-                            continue
-                        getter = getattr(inst, next_getter, None)
-                        if getter:
-                            parents = getter() or []
-                            if not isinstance(parents, list):
-                                parents = [parents]
-                            if any(p is current for p in parents):
-                                queue.append(inst)
+                for inst in self._children_of(current, next_getter):
+                    if inst is not current and id(inst) not in visited:
+                        queue.append(inst)
 
         return None
 
+    @staticmethod
+    def _next_nodes(node, next_getter) -> list:
+        getter = getattr(node, next_getter, None)
+        nexts = getter() if getter else None
+        if not nexts:
+            return []
+        return nexts if isinstance(nexts, list) else [nexts]
+
+    # ---------- child index for "down" traversals ----------
+
+    def _children_of(self, node, next_getter) -> list:
+        """Instances in cache that list `node` among their `next_getter` targets,
+        in cache order. The index is built on the first downward traversal along
+        `next_getter` and then kept in sync by _refresh_children_index; each
+        parent maps to a dict used as an insertion-ordered set of children."""
+        index = self._children_index.get(next_getter)
+        if index is None:
+            children, parents = {}, {}
+            for instances in self._instance_cache.values():
+                for inst in instances:
+                    # a tuple, not the model's own list (getters hand it out
+                    # as is): _refresh_children_index diffs the next reading against it
+                    nexts = tuple(self._next_nodes(inst, next_getter))
+                    if nexts:
+                        parents[inst] = nexts
+                        for parent in nexts:
+                            children.setdefault(parent, {})[inst] = None
+            index = self._children_index[next_getter] = (children, parents)
+        return index[0].get(node, ())
+
+    def _refresh_children_index(self, instance, removed: bool = False):
+        """Re-read the links of `instance` (populated again, promoted, or just
+        added to the cache), or drop it when it left the cache."""
+        for next_getter, (children, parents) in self._children_index.items():
+            old = parents.pop(instance, ())
+            new = () if removed else tuple(self._next_nodes(instance, next_getter))
+            # set/dict operations only: a parent with many children costs O(1)
+            old_set, new_set = set(old), set(new)
+            for parent in old_set - new_set:
+                del children[parent][instance]
+            for parent in new:
+                if parent not in old_set:
+                    children.setdefault(parent, {})[instance] = None
+            if new:
+                parents[instance] = new
+
     # def is_in_range_or_domain_of_property(self, property_getter, property_getter_inverse, property_instance):
 
     #     if isinstance(object, (Concept, Individual, Datatype)):
@@ -258,12 +364,14 @@ class BaseLogic(ABC):
 
 
     def _create_literal(self, rdflib_literal):
-        literal_key = f"LITERAL::{rdflib_literal}"
-        if literal_key in self._instance_cache:
-            return next(iter(self._instance_cache[literal_key]))
+        lexical = str(rdflib_literal)
+        key = (lexical, rdflib_literal.language, rdflib_literal.datatype)
+        literal = self._literals.get(key)
+        if literal is not None:
+            return literal
 
         literal = Literal()
-        literal.set_has_value(str(rdflib_literal))
+        literal.set_has_value(lexical)
 
         if rdflib_literal.language:
             literal.set_has_language(rdflib_literal.language)
@@ -273,21 +381,12 @@ class BaseLogic(ABC):
             if dt:
                 literal.set_has_type(dt)
 
-        self._instance_cache[literal_key] = {literal}
+        self._literals[key] = literal
         return literal
 
     def _is_rdf_collection(self, node: Node) -> bool:
         return (node, RDF.first, None) in self.graph
 
-    def _instance_matches_target(self, instance, target_classes: list) -> bool:
-        instance_class = instance.__class__
-        if instance_class in target_classes:
-            return True
-        for parent_class in instance_class.__mro__[1:]:
-            if parent_class in target_classes:
-                return True
-        return False
-
     def _apply_setters(self, instance, setters_config, obj):
         for setter_item in setters_config:
             if isinstance(setter_item, dict):
@@ -343,6 +442,11 @@ class BaseLogic(ABC):
 
     def clear_cache(self):
         self._instance_cache.clear()
+        self._literals = {}
+        self._statements_by_subject = {}
+        self._bnode_closures = {}
+        self._children_index = {}
+        self._resolved = {}
 
     # ========== LOGIC CORE ==========
 
@@ -352,69 +456,102 @@ class BaseLogic(ABC):
             if isinstance(id, RDFlibLiteral):
                 return self._create_literal(id)
 
-            DATATYPE_BUILTINS = frozenset({
-            RDFS.Literal, RDF.XMLLiteral, RDF.HTML,
-            RDF.PlainLiteral, RDF.langString, RDF.JSON,
-            OWL.real, OWL.rational
-            })
-
-            if isinstance(id, URIRef):
-                if id in DATATYPE_BUILTINS:
-                    python_class = Datatype  # built-ins: always Datatype, no exceptions
-                elif str(id).startswith(str(XSD)) and str(id) != str(XSD):
-                    if (id, RDF.type, None) not in self.graph:
-                        python_class = Datatype  # XSD: only if explicitly declared as something else
-
-            # if isinstance(id, URIRef):
-            #     uri_str = str(id)
-            #     for ns in self._allowed_namespaces:
-            #         if uri_str.startswith(ns) and id not in (OWL.Thing, OWL.Nothing, RDFS.Literal):
-            #             return None
-
-            # Individual punning: non sovrascrivere tipi esistenti non-Individual
-            if python_class == Individual and id in self._instance_cache:
-                is_named_individual = (id, RDF.type, OWL.NamedIndividual) in self.graph
-                if not is_named_individual:
-                    for existing in self._instance_cache[id]:
-                        if not isinstance(existing, Individual):
-                            return existing
-
-            if id in self._instance_cache:
-                if isinstance(id, BNode):
-                    return next(iter(self._instance_cache[id]))
-                if isinstance(id, URIRef):
-                    for obj in self._instance_cache[id]:
-                        if isinstance(obj, python_class):
-                            return obj
-                    # Promote only if there is exactly one cached instance and
-                    # the requested class is strictly more specific than it
-                    # so punning is mantained
-                    cached = list(self._instance_cache[id])
-                    if len(cached) == 1 and issubclass(python_class, type(cached[0])):
-                        old = cached[0]
-                        new = python_class()
-                        new.__dict__.update(old.__dict__)
-                        self._instance_cache[id].discard(old)
-                        self._instance_cache[id].add(new)
-                        if old in self._triples_map:
-                            self._triples_map[new] = self._triples_map.pop(old)
-                        return new
-
-            instance = python_class()
-            if id not in self._instance_cache:
-                self._instance_cache[id] = set()
-            self._instance_cache[id].add(instance)
-            instance.set_has_identifier(str(id))
-
-            if populate:
-                self.populate_instance(instance, id)
-
+            # fast path: what the same request resolved to last time. Promotions
+            # and reclassifications drop the node's entries (_forget_resolved);
+            # the hit is also re-checked to still be the node's only cached
+            # instance, with its class, since punning adds siblings directly
+            resolved = self._resolved.get(id)
+            hit = resolved.get(python_class) if resolved else None
+            if hit is not None:
+                cached = self._instance_cache.get(id)
+                if cached is not None and len(cached) == 1 and hit[0] in cached and type(hit[0]) is hit[1]:
+                    return hit[0]
+
+            instance = self._resolve_instance(id, python_class, populate)
+            if instance is not None:
+                self._resolved.setdefault(id, {})[python_class] = (instance, type(instance))
             return instance
 
         except Exception as e:
             print(f"Cannot create {python_class.__name__ if python_class else 'Unknown'} for {id}: {e}")
             return None
 
+    def _resolve_instance(self, id: Node, python_class: type, populate: bool):
+        """get_or_create for a non-literal node, without the fast path."""
+        if isinstance(id, URIRef) and self._is_forced_datatype(id):
+            python_class = Datatype
+
+        # if isinstance(id, URIRef):
+        #     uri_str = str(id)
+        #     for ns in self._allowed_namespaces:
+        #         if uri_str.startswith(ns) and id not in (OWL.Thing, OWL.Nothing, RDFS.Literal):
+        #             return None
+
+        # Individual punning: non sovrascrivere tipi esistenti non-Individual
+        if python_class == Individual and id in self._instance_cache:
+            if id not in self._named_individuals():
+                for existing in self._instance_cache[id]:
+                    if not isinstance(existing, Individual):
+                        return existing
+
+        if id in self._instance_cache:
+            if isinstance(id, BNode):
+                return next(iter(self._instance_cache[id]))
+            if isinstance(id, URIRef):
+                for obj in self._instance_cache[id]:
+                    if isinstance(obj, python_class):
+                        return obj
+                # Promote only if there is exactly one cached instance and
+                # the requested class is strictly more specific than it
+                # so punning is mantained
+                cached = list(self._instance_cache[id])
+                if len(cached) == 1 and issubclass(python_class, type(cached[0])):
+                    old = cached[0]
+                    new = python_class()
+                    new.copy_fields_from(old)
+                    self._instance_cache[id].discard(old)
+                    self._instance_cache[id].add(new)
+                    self._forget_resolved(id)
+                    if old in self._triples_map:
+                        self._triples_map[new] = self._triples_map.pop(old)
+                    self._refresh_children_index(old, removed=True)
+                    self._refresh_children_index(new)
+                    return new
+
+        instance = python_class()
+        if id not in self._instance_cache:
+            self._instance_cache[id] = set()
+        self._instance_cache[id].add(instance)
+        instance.set_has_identifier(str(id))
+
+        if populate:
+            self.populate_instance(instance, id)
+
+        return instance
+
+    def _forget_resolved(self, node) -> None:
+        """Drop the get_or_create fast-path entries of a node whose cached
+        instances were replaced or reclassified."""
+        self._resolved.pop(node, None)
+
+    def _is_forced_datatype(self, uri: URIRef) -> bool:
+        """Built-in datatypes, and XSD IRIs unless explicitly declared as
+        something else; looked up in the graph once per IRI."""
+        forced = self._forced_datatype.get(uri)
+        if forced is None:
+            uri_str = str(uri)
+            forced = uri in DATATYPE_BUILTINS or (
+                uri_str.startswith(_XSD_NS) and uri_str != _XSD_NS
+                and (uri, RDF.type, None) not in self.graph
+            )
+            self._forced_datatype[uri] = forced
+        return forced
+
+    def _named_individuals(self) -> set:
+        if self._named_individual_nodes is None:
+            self._named_individual_nodes = set(self.graph.subjects(RDF.type, OWL.NamedIndividual))
+        return self._named_individual_nodes
+
     def populate_instance(self, instance, uri: Node):
         
         if isinstance(uri, URIRef):
@@ -425,57 +562,89 @@ class BaseLogic(ABC):
         if instance not in self._triples_map:
             self._triples_map[instance] = set()
 
-        for predicate, obj in self.graph.predicate_objects(uri):
-            predicate_str = str(predicate)
-            predicate_namespace = (
-                predicate_str.rsplit('#', 1)[0] + '#'
-                if '#' in predicate_str
-                else predicate_str.rsplit('/', 1)[0] + '/'
-            )
+        # punning dominance is a property of the subject, not of the triple
+        is_subordinate = self._is_punning_subordinate(instance, uri)
+        instance_cls = type(instance)
+        triples = self._triples_map[instance]
 
-            if predicate_namespace not in self._allowed_namespaces:
+        for predicate, obj in self.graph.predicate_objects(uri):
+            plan = self._predicate_plan.get(predicate)
+            if plan is None:
+                plan = self._predicate_plan[predicate] = self._compile_predicate(predicate)
+            if plan is False:
                 continue
-        
-            # handles punning priorities wrt config
-            is_subordinate = self._is_punning_subordinate(instance, uri)
-            instance_cls_name = type(instance).__name__
-
-            if predicate in self._property_mapping:
-                config = self._property_mapping[predicate]
-                target_classes = config.get('target_classes', [])
 
+            target_classes, action = plan
+            if target_classes is not None:
                 # Punning subordinate: apply only if config explicitly targets this class
-                if is_subordinate and type(instance) not in target_classes:
-                    continue
-
-                if target_classes and not self._instance_matches_target(instance, target_classes):
+                if is_subordinate and instance_cls not in target_classes:
                     continue
 
-                if 'handler' in config:
-                    handler_name = config['handler']
-                    # handler existence already guaranteed by _validate_handlers
-                    handler = getattr(self, handler_name)
-                    try:
-                        handler(instance, uri, predicate, obj, None)
-                        self._triples_map[instance].add((uri, predicate, obj))
-                    except Exception as e:
-                        print(f"  Errore handler {handler_name}: {e}")
+                if target_classes and not issubclass(instance_cls, target_classes):
                     continue
 
-                if 'setters' in config:
-                    try:
-                        self._apply_setters(instance, config['setters'], obj)
-                        self._triples_map[instance].add((uri, predicate, obj))
-                    except Exception as e:
-                        print(f"  Errore setters: {e}")
+                if action is not None:
+                    if action(instance, uri, predicate, obj):
+                        triples.add((uri, predicate, obj))
                     continue
 
             if self._is_rdf_collection(obj):
                 self._handle_collection_object(instance, predicate, obj)
-                self._triples_map[instance].add((uri, predicate, obj))
+                triples.add((uri, predicate, obj))
+
+        self._refresh_children_index(instance)
 
     # ========== HELPERS ==========
 
+    def _compile_predicate(self, predicate):
+        """Dispatch plan of one predicate for populate_instance, built on first
+        use: False if its namespace is not allowed, otherwise (target classes,
+        action), with target classes None for unmapped predicates. The action
+        applies the configured handler or setters and tells whether the triple
+        was mapped; None means only the collection fallback applies."""
+        predicate_str = str(predicate)
+        predicate_namespace = (
+            predicate_str.rsplit('#', 1)[0] + '#'
+            if '#' in predicate_str
+            else predicate_str.rsplit('/', 1)[0] + '/'
+        )
+        if predicate_namespace not in self._allowed_namespaces:
+            return False
+
+        config = self._property_mapping.get(predicate)
+        if config is None:
+            return None, None
+        target_classes = tuple(config.get('target_classes', []))
+
+        if 'handler' in config:
+            handler_name = config['handler']
+            # handler existence already guaranteed by _validate_handlers
+            handler = getattr(self, handler_name)
+
+            def action(instance, uri, predicate, obj):
+                try:
+                    handler(instance, uri, predicate, obj, None)
+                    return True
+                except Exception as e:
+                    print(f"  Errore handler {handler_name}: {e}")
+                    return False
+
+        elif 'setters' in config:
+            setters = config['setters']
+            apply_setters = self._apply_setters
+
+            def action(instance, uri, predicate, obj):
+                try:
+                    apply_setters(instance, setters, obj)
+                    return True
+                except Exception as e:
+                    print(f"  Errore setters: {e}")
+                    return False
+
+        else:
+            return target_classes, None
+        return target_classes, action
+
     def _is_triple_mapped(self, subj, pred, obj) -> bool:
         if subj not in self._instance_cache:
             return False
@@ -546,6 +715,7 @@ class BaseLogic(ABC):
         if stmt_bnode not in self._instance_cache:
             self._instance_cache[stmt_bnode] = set()
         self._instance_cache[stmt_bnode].add(statement)
+        self._register_statement(statement)
 
     def _is_unmapped_structured_bnode(self, node) -> bool:
         """A BNode is a structured Statement value if:
@@ -624,7 +794,7 @@ class BaseLogic(ABC):
                 if existing is None:
                     setattr(statement, attr_name, o_inst)
                 elif isinstance(existing, list):
-                    existing.append(o_inst)
+                    statement._grow(attr_name).append(o_inst)
                 else:
                     setattr(statement, attr_name, [existing, o_inst])
 
@@ -638,8 +808,9 @@ class BaseLogic(ABC):
             return None
         if len(cached) == 1:
             return next(iter(cached))
-        priority = self._strategy.get_punning_priority()
-        for cls in priority:
+        if self._punning_priority is None:
+            self._punning_priority = self._strategy.get_punning_priority()
+        for cls in self._punning_priority:
             for inst in cached:
                 if type(inst) is cls:
                     return inst
@@ -657,9 +828,10 @@ class BaseLogic(ABC):
             existing = next(iter(self._instance_cache[uri]))
             if not isinstance(existing, Rule):
                 rule = Rule()
-                rule.__dict__.update(existing.__dict__)
+                rule.copy_fields_from(existing)
                 self._instance_cache[uri].discard(existing)
                 self._instance_cache[uri].add(rule)
+                self._forget_resolved(uri)
                 if existing in self._triples_map:
                     self._triples_map[rule] = self._triples_map.pop(existing)
             else:
@@ -767,7 +939,6 @@ class BaseLogic(ABC):
         - strategy-specific axioms (hook: _add_axiom_provenance)
         """
         from rdflib import Graph, BNode
-        from lode.models import Statement
 
         sub = Graph()
         for prefix, ns in self.graph.namespaces():
@@ -785,36 +956,62 @@ class BaseLogic(ABC):
                 self._expand_bnode_into(o, sub, seen)
 
         # 3. reified Statements pointing at instance
-        for other_inst, other_triples in self._triples_map.items():
-            if not isinstance(other_inst, Statement):
-                continue
-            if other_inst.get_has_subject() is instance:
-                for t in other_triples:
-                    sub.add(t)
-                    _, _, o = t
-                    if isinstance(o, BNode) and o not in seen:
-                        self._expand_bnode_into(o, sub, seen)
+        for statement in self._statements_by_subject.get(instance, ()):
+            for t in self._triples_map.get(statement, ()):
+                sub.add(t)
+                _, _, o = t
+                if isinstance(o, BNode):
+                    self._expand_bnode_into(o, sub, seen)
 
         # 4. strategy-specific axioms (hook)
         self._add_axiom_provenance(instance, sub)
 
         return sub
 
+    def has_provenance(self, instance) -> bool:
+        """True if build_provenance_subgraph(instance) has any triple, checked
+        on the indexes without building (or serializing) the subgraph."""
+        if self._triples_map.get(instance):
+            return True
+        if any(self._triples_map.get(st) for st in self._statements_by_subject.get(instance, ())):
+            return True
+        return self._has_axiom_provenance(instance)
+
     def _expand_bnode_into(self, bn, sub, seen):
-        """Add `bn` and its BNode-transitive closure to `sub`."""
+        """Add `bn` and its BNode-transitive closure to `sub` (once per `seen`)."""
+        if bn in seen:
+            return
+        seen.add(bn)
+        for t in self._bnode_closure(bn):
+            sub.add(t)
+
+    def _bnode_closure(self, bn) -> tuple:
+        """Triples of `bn` and of the BNodes reachable from it, memoized: a
+        restriction or list shared by many entities is walked only once."""
+        closure = self._bnode_closures.get(bn)
+        if closure is not None:
+            return closure
         from rdflib import BNode
+        triples = []
+        visited = set()
         stack = [bn]
         while stack:
             n = stack.pop()
-            if n in seen:
+            if n in visited:
                 continue
-            seen.add(n)
+            visited.add(n)
             for p, o in self.graph.predicate_objects(n):
-                sub.add((n, p, o))
-                if isinstance(o, BNode) and o not in seen:
+                triples.append((n, p, o))
+                if isinstance(o, BNode) and o not in visited:
                     stack.append(o)
+        closure = self._bnode_closures[bn] = tuple(triples)
+        return closure
 
     def _add_axiom_provenance(self, instance, sub):
         """Hook for subclasses. Default: no strategy-specific axioms."""
         pass
+
+    def _has_axiom_provenance(self, instance) -> bool:
+        """Hook for subclasses: whether _add_axiom_provenance adds anything."""
+        return False
     
\ No newline at end of file
@@ -23,6 +23,13 @@ class OwlLogic(BaseLogic):
 
     # _get_allowed_namespaces: ereditato da BaseLogic, legge config YAML
 
+    def __init__(self, graph: Graph, instance_cache: dict, strategy):
+        super().__init__(graph, instance_cache, strategy)
+        # member node -> group axioms listing it (provenance), built in phase 4
+        self._axioms_by_member = {}
+        # generic Property IRI -> (inverse linked, rdfs:range type), during phase 5
+        self._property_facts = {}
+
     # ========== HOOK per resolve custom OWL ==========
 
     def _pre_resolve_hook(self, python_class: type, id: Node) -> type | None:
@@ -48,24 +55,23 @@ class OwlLogic(BaseLogic):
 
         classified = {}
 
-        for pred in self._property_mapping:
-            for uri in self.graph.subjects(pred, None):
-                if uri in self._instance_cache:
-                    continue
-                python_class = self._strategy.classify_by_predicate(uri, self.graph)
-                if not python_class:
+        for uri, preds in self._collect_mapped_subjects().items():
+            if uri in self._instance_cache:
+                continue
+            python_class = self._strategy.classify_predicates(preds)
+            if not python_class:
+                continue
+            if isinstance(uri, BNode):
+                # [ owl:inverseOf <prop> ] used as object of owl:onProperty is an
+                # anonymous inline property expression inside a Restriction, not a
+                # standalone entity — skipped it to avoid spurious cache entries
+                if (None, OWL.onProperty, uri) in self.graph:
                     continue
-                if isinstance(uri, BNode):
-                    # [ owl:inverseOf <prop> ] used as object of owl:onProperty is an
-                    # anonymous inline property expression inside a Restriction, not a
-                    # standalone entity — skipped it to avoid spurious cache entries
-                    if (None, OWL.onProperty, uri) in self.graph:
-                        continue
-                    if uri not in classified:
-                        classified[uri] = python_class
-                elif isinstance(uri, URIRef):
-                    if not issubclass(python_class, Restriction):
-                        self.get_or_create(uri, python_class, populate=False)
+                if uri not in classified:
+                    classified[uri] = python_class
+            elif isinstance(uri, URIRef):
+                if not issubclass(python_class, Restriction):
+                    self.get_or_create(uri, python_class, populate=False)
 
         owl_warnings.flag_malformed_restrictions(self, classified)
         
@@ -126,6 +132,7 @@ class OwlLogic(BaseLogic):
             for uri in self.graph.subjects(RDF.type, axiom_type):
                 # handler existence guaranteed by _validate_handlers (defined in base_logic)
                 getattr(self, handler_name)(uri)
+        self._index_axiom_members()
 
     def phase5_fallback(self):
         """
@@ -136,7 +143,9 @@ class OwlLogic(BaseLogic):
 
         After reclassification, applies OWL defaults (e.g., domain, range, thing) to all instances via _enrich_or_apply_owl_defaults.
         """
-        
+        # graph facts of every generic Property, read once for _infer_property_type
+        self._property_facts = self._collect_property_facts()
+
         for uri, instances in list(self._instance_cache.items()):
             for instance in list(instances):
 
@@ -151,6 +160,8 @@ class OwlLogic(BaseLogic):
                     if has_concrete:
                         # Remove generic Property, keep the concrete one
                         self._instance_cache[uri].discard(instance)
+                        self._forget_resolved(uri)
+                        self._refresh_children_index(instance, removed=True)
                     else:
                         # # No concrete type found — infer and reclassify
                         # inferred = self._infer_property_type(instance)
@@ -165,13 +176,17 @@ class OwlLogic(BaseLogic):
                         # instance = new
 
                         inferred = self._infer_property_type(instance)
-                        old_dict = instance.__dict__.copy()
+                        old_fields = list(instance.iter_fields())
                         instance.__class__ = inferred
                         inferred.__init__(instance)
-                        instance.__dict__.update(old_dict)
+                        for name, value in old_fields:
+                            setattr(instance, name, value)
+                        self._forget_resolved(uri)
                         self.populate_instance(instance, uri)
 
-                self._enrich_or_apply_owl_defaults(instance, uri)        
+                self._enrich_or_apply_owl_defaults(instance, uri)
+
+        self._property_facts = {}        
 
     # def _infer_property_type(self, instance) -> type:
     #     """
@@ -246,19 +261,16 @@ class OwlLogic(BaseLogic):
         if not other or not isinstance(other, Concept):
             return
         
-        if other not in instance.get_is_equivalent_to():
-            instance.set_is_equivalent_to(other)
-        if instance not in other.get_is_equivalent_to():
-            other.set_is_equivalent_to(instance)
+        # i set_* delle relazioni ignorano i valori già presenti
+        instance.set_is_equivalent_to(other)
+        other.set_is_equivalent_to(instance)
 
     def handle_disjoint_with(self, instance, uri, predicate, obj, setter=None):
         """§9.1.3 DisjointClasses — simmetria garantita."""
         other = self.get_or_create(obj, Concept)
         if other:
-            if other not in instance.get_is_disjoint_with():
-                instance.set_is_disjoint_with(other)
-            if instance not in other.get_is_disjoint_with():
-                other.set_is_disjoint_with(instance)
+            instance.set_is_disjoint_with(other)
+            other.set_is_disjoint_with(instance)
 
     def handle_equivalent_property(self, instance, uri, predicate, obj, setter=None):        
         if obj in self._instance_cache:
@@ -266,19 +278,15 @@ class OwlLogic(BaseLogic):
         else:
             other = self.get_or_create(obj, type(instance))
         if other:
-            if other not in instance.get_is_equivalent_to():
-                instance.set_is_equivalent_to(other)
-            if instance not in other.get_is_equivalent_to():
-                other.set_is_equivalent_to(instance)
+            instance.set_is_equivalent_to(other)
+            other.set_is_equivalent_to(instance)
 
     def handle_property_disjoint_with(self, instance, uri, predicate, obj, setter=None):
         """§9.2.3 DisjointObjectProperties — simmetria garantita."""
         other = self.get_or_create(obj, Property)
         if other:
-            if other not in instance.get_is_disjoint_with():
-                instance.set_is_disjoint_with(other)
-            if instance not in other.get_is_disjoint_with():
-                other.set_is_disjoint_with(instance)
+            instance.set_is_disjoint_with(other)
+            other.set_is_disjoint_with(instance)
 
     def _ensure_individual(self, node):
         """Get or create an Individual for node, preserving existing types (punning)."""
@@ -298,20 +306,16 @@ class OwlLogic(BaseLogic):
         subj_ind = self._ensure_individual(uri)
         other = self._ensure_individual(obj)
         if subj_ind and other:
-            if other not in subj_ind.get_is_same_as():
-                subj_ind.set_is_same_as(other)
-            if subj_ind not in other.get_is_same_as():
-                other.set_is_same_as(subj_ind)
+            subj_ind.set_is_same_as(other)
+            other.set_is_same_as(subj_ind)
 
     def handle_different_from(self, instance, uri, predicate, obj, setter=None):
         """§9.6.2 DifferentIndividuals — simmetria garantita."""
         subj_ind = self._ensure_individual(uri)
         other = self._ensure_individual(obj)
         if subj_ind and other:
-            if other not in subj_ind.get_is_different_from():
-                subj_ind.set_is_different_from(other)
-            if subj_ind not in other.get_is_different_from():
-                other.set_is_different_from(subj_ind)
+            subj_ind.set_is_different_from(other)
+            other.set_is_different_from(subj_ind)
 
     def handle_inverse_of(self, instance, uri, predicate, obj, setter=None):
         if isinstance(instance, Restriction) and not isinstance(instance, Relation):
@@ -321,10 +325,8 @@ class OwlLogic(BaseLogic):
             return
         other = self.get_or_create(obj, Relation)
         if other:
-            if instance.get_is_inverse_of() is not other:
-                instance.set_is_inverse_of(other)
-            if other.get_is_inverse_of() is not instance:
-                other.set_is_inverse_of(instance)
+            instance.set_is_inverse_of(other)
+            other.set_is_inverse_of(instance)
 
     def handle_on_property(self, instance, uri, predicate, obj, setter=None):
         """If obj is a BNode with owl:inverseOf, resolve the real property and mark as inverse.
@@ -351,10 +353,12 @@ class OwlLogic(BaseLogic):
         cached = list(self._instance_cache.get(uri, set()))
         concept = Concept()
         if cached:
-            concept.__dict__.update(cached[0].__dict__)
+            concept.copy_fields_from(cached[0])
         else:
             concept.set_has_identifier(str(uri))
         self._instance_cache.setdefault(uri, set()).add(concept)
+        self._forget_resolved(uri)
+        self._refresh_children_index(concept)
         return concept
 
     def _enrich_or_apply_owl_defaults(self, instance, uri):
@@ -370,7 +374,9 @@ class OwlLogic(BaseLogic):
         rdfs_string = self.get_or_create(RDFS.Literal, Datatype)
 
         def _safe_inherited(instance, getter_name):
-            values = self._get_inherited_property_values(instance, getter_name)
+            # copia: i valori possono essere la lista stessa dell'istanza (owl:inverseOf
+            # su se stessa), che il chiamante svuota prima di ripopolarla
+            values = list(self._get_inherited_property_values(instance, getter_name))
             if isinstance(instance, Attribute):
                 if getter_name == "get_has_range":
                     return [v for v in values if isinstance(v, (Datatype, DatatypeRestriction))]
@@ -512,12 +518,13 @@ class OwlLogic(BaseLogic):
         6. Fallback to Annotation.
         """
         uri_ref = URIRef(instance.get_has_identifier()) if instance.get_has_identifier() else None
+        facts = self._property_facts.get(uri_ref) if uri_ref else None
+        if uri_ref and facts is None:
+            facts = self._property_graph_facts(uri_ref, self._inverse_linked(uri_ref))
 
         # (1) inverseOf in graph (instance not yet populated as Property)
-        if uri_ref:
-            if any(self.graph.objects(uri_ref, OWL.inverseOf)) or \
-               any(self.graph.subjects(OWL.inverseOf, uri_ref)):
-                return Relation
+        if facts and facts[0]:
+            return Relation
 
         CONCRETE = (Relation, Attribute, Annotation)
 
@@ -547,31 +554,61 @@ class OwlLogic(BaseLogic):
             return result
 
         # (4) Declared rdfs:range
-        if uri_ref:
-            for range_obj in self.graph.objects(uri_ref, RDFS.range):
-                range_str = str(range_obj)
-                if range_str.startswith(str(XSD)) or range_obj in (RDFS.Literal,):
-                    return Attribute
-                if isinstance(range_obj, URIRef):
-                    return Relation
+        if facts and facts[1]:
+            return facts[1]
 
         # (5) Graph usage: how the property is used as predicate
         if uri_ref:
-            has_literal = False
-            has_uriref = False
-            for s, p, o in self.graph.triples((None, uri_ref, None)):
-                if isinstance(o, RDFlibLiteral):
-                    has_literal = True
-                elif isinstance(o, URIRef):
-                    has_uriref = True
-            if has_uriref:
-                return Relation
-            if has_literal:
-                return Attribute
+            usage = self._usage_type(uri_ref)
+            if usage:
+                return usage
 
         # (6) fallback
         return Annotation
 
+    def _collect_property_facts(self) -> dict:
+        """(inverse linked, rdfs:range type) for the IRI of every generic
+        Property in cache, with one pass over the owl:inverseOf triples."""
+        uris = {
+            URIRef(inst.get_has_identifier())
+            for instances in self._instance_cache.values() for inst in instances
+            if type(inst) is Property and inst.get_has_identifier()
+        }
+        if not uris:
+            return {}
+        linked = set()
+        for s, o in self.graph.subject_objects(OWL.inverseOf):
+            linked.add(s)
+            linked.add(o)
+        return {uri: self._property_graph_facts(uri, uri in linked) for uri in uris}
+
+    def _inverse_linked(self, uri_ref) -> bool:
+        return any(self.graph.objects(uri_ref, OWL.inverseOf)) or \
+               any(self.graph.subjects(OWL.inverseOf, uri_ref))
+
+    def _property_graph_facts(self, uri_ref, inverse_linked: bool) -> tuple:
+        # the first declared range that decides: XSD/Literal -> Attribute, IRI -> Relation
+        range_type = None
+        for range_obj in self.graph.objects(uri_ref, RDFS.range):
+            if str(range_obj).startswith(str(XSD)) or range_obj in (RDFS.Literal,):
+                range_type = Attribute
+                break
+            if isinstance(range_obj, URIRef):
+                range_type = Relation
+                break
+        return inverse_linked, range_type
+
+    def _usage_type(self, uri_ref):
+        """Relation if any object of uri_ref is an IRI (stops at the first one),
+        Attribute if they are all literals, None if it is never used."""
+        has_literal = False
+        for o in self.graph.objects(None, uri_ref):
+            if isinstance(o, URIRef):
+                return Relation
+            if isinstance(o, RDFlibLiteral):
+                has_literal = True
+        return Attribute if has_literal else None
+
     # ========== HELPERS & RELATED FUNCTIONS PHASE 1 ==========
 
     def _classify_nested(self, classified, predicates):
@@ -1037,6 +1074,7 @@ class OwlLogic(BaseLogic):
         if stmt_bnode not in self._instance_cache:
             self._instance_cache[stmt_bnode] = set()
         self._instance_cache[stmt_bnode].add(statement)
+        self._register_statement(statement)
 
         self._enrich_or_apply_owl_defaults(subj_inst, subj)
         if obj_inst and not isinstance(obj, RDFlibLiteral):
@@ -1061,22 +1099,37 @@ class OwlLogic(BaseLogic):
         uri_str = getattr(instance, 'has_identifier', None)
         if not uri_str:
             return
-        uri_ref = URIRef(uri_str)
+        for axiom in self._axioms_by_member.get(URIRef(uri_str), ()):
+            self._expand_bnode_into(axiom, sub, set())
+
+    def _has_axiom_provenance(self, instance) -> bool:
+        uri_str = getattr(instance, 'has_identifier', None)
+        return bool(uri_str) and URIRef(uri_str) in self._axioms_by_member
+
+    def _index_axiom_members(self):
+        """Map every member of the provenance group axioms to the axioms listing
+        it, in axiom type / graph order, so each entity only visits its own axioms
+        (their subgraphs are memoized by _bnode_closure)."""
+        index = {}
         for axiom_type in self._PROVENANCE_AXIOM_TYPES:
             for axiom in self.graph.subjects(RDF.type, axiom_type):
-                if self._uri_in_axiom_members(axiom, uri_ref):
-                    self._expand_bnode_into(axiom, sub, set())
-
-    def _uri_in_axiom_members(self, axiom_node, uri_ref):
-        """True if uri_ref appears in owl:members or owl:distinctMembers list of axiom_node."""
+                for member in self._axiom_members(axiom):
+                    axioms = index.setdefault(member, [])
+                    if not axioms or axioms[-1] != axiom:
+                        axioms.append(axiom)
+        self._axioms_by_member = index
+
+    def _axiom_members(self, axiom_node):
+        """Items of the owl:members and owl:distinctMembers lists of axiom_node."""
         for list_pred in (OWL.members, OWL.distinctMembers):
             head = self.graph.value(axiom_node, list_pred)
             if head is None:
                 continue
             node = head
-            while node and node != RDF.nil:
+            visited = set()
+            while node and node != RDF.nil and node not in visited:
+                visited.add(node)
                 first = self.graph.value(node, RDF.first)
-                if first == uri_ref:
-                    return True
+                if first is not None:
+                    yield first
                 node = self.graph.value(node, RDF.rest)
-        return False
\ No newline at end of file
@@ -37,18 +37,17 @@ class RdfLogic(BaseLogic):
         """
         classified = {}
 
-        for pred in self._property_mapping:
-            for uri in self.graph.subjects(pred, None):
-                if uri in self._instance_cache:
-                    continue
-                python_class = self._strategy.classify_by_predicate(uri, self.graph)
-                if not python_class:
-                    continue
-                if isinstance(uri, BNode):
-                    if uri not in classified:
-                        classified[uri] = python_class
-                elif isinstance(uri, URIRef):
-                    self.get_or_create(uri, python_class, populate=False)
+        for uri, preds in self._collect_mapped_subjects().items():
+            if uri in self._instance_cache:
+                continue
+            python_class = self._strategy.classify_predicates(preds)
+            if not python_class:
+                continue
+            if isinstance(uri, BNode):
+                if uri not in classified:
+                    classified[uri] = python_class
+            elif isinstance(uri, URIRef):
+                self.get_or_create(uri, python_class, populate=False)
 
         for uri, py_class in classified.items():
             self.get_or_create(uri, py_class, populate=False)
@@ -1,7 +1,18 @@
 # modules.py - Moduli di arricchimento del grafo RDF
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlsplit, urlunsplit
+
 from rdflib import Graph, OWL
 from typing import Optional
 
+from lode.reader.security import _env_int
+
+# Concurrent owl:imports fetches, and overall time budget (seconds) for one expansion
+IMPORTS_WORKERS = max(1, _env_int("LODE_IMPORTS_WORKERS", 4))
+IMPORTS_DEADLINE = _env_int("LODE_IMPORTS_DEADLINE", 60)
+
+
 def apply_imported(graph: Graph) -> Graph:
     """Arricchisce il grafo con le triple delle ontologie direttamente importate (profondita 1)."""
     return _expand_owl_imports(graph, max_depth=1)
@@ -11,33 +22,74 @@ def apply_closure(graph: Graph) -> Graph:
     """Arricchisce il grafo con la chiusura transitiva completa di owl:imports."""
     return _expand_owl_imports(graph, max_depth=None)
 
+
+def _normalize_iri(iri: str) -> str:
+    """Chiave di deduplica: senza fragment, scheme/host minuscoli, senza '/' finale."""
+    parts = urlsplit(iri.strip())
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
 def _expand_owl_imports(graph: Graph, max_depth: Optional[int]) -> Graph:
+    """Breadth-first expansion: every level is fetched concurrently (at most
+    IMPORTS_WORKERS at a time) and merged in declaration order, so the result
+    does not depend on which download finishes first. Imports still pending
+    when IMPORTS_DEADLINE expires are skipped."""
     visited: set = set()
-    for _, _, uri in graph.triples((None, OWL.imports, None)):
-        _load_into(graph, str(uri), depth=1, max_depth=max_depth, visited=visited)
+    level = _new_imports(graph, visited)
+    depth = 1
+    deadline = time.monotonic() + IMPORTS_DEADLINE
+
+    pool = ThreadPoolExecutor(max_workers=IMPORTS_WORKERS, thread_name_prefix="lode-imports")
+    try:
+        while level and (max_depth is None or depth <= max_depth):
+            futures = [pool.submit(_fetch, source) for source in level]
+            _, pending = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+            for f in pending:
+                f.cancel()
+
+            next_level = []
+            for source, future in zip(level, futures):
+                if future in pending:
+                    print(f"  [modules] Warning: deadline exceeded, skipped {source}")
+                    continue
+                imported_graph = future.result()
+                if imported_graph is None:
+                    continue
+                print(f"  [modules] Imported {len(imported_graph)} triples from {source}")
+                graph += imported_graph
+                next_level.extend(_new_imports(imported_graph, visited))
+
+            if pending:
+                break
+            level = next_level
+            depth += 1
+    finally:
+        # do not wait for fetches abandoned at the deadline
+        pool.shutdown(wait=False, cancel_futures=True)
+
     return graph
 
 
-def _load_into(graph: Graph, source: str, depth: int, max_depth: Optional[int], visited: set) -> None:
-    if source in visited:
-        return
-    if max_depth is not None and depth > max_depth:
-        return
+def _new_imports(graph: Graph, visited: set) -> list:
+    """owl:imports targets of `graph` not seen yet (marked as seen)."""
+    found = []
+    for _, _, uri in graph.triples((None, OWL.imports, None)):
+        key = _normalize_iri(str(uri))
+        if key in visited:
+            continue
+        visited.add(key)
+        found.append(str(uri))
+    return found
 
-    visited.add(source)
 
+def _fetch(source: str) -> Optional[Graph]:
     # Riusa il Loader per tutto il caricamento (content negotiation, formati, ecc.)
+    # via la cache persistente degli import (revalidata con ETag/Last-Modified).
     # I moduli non vengono propagati: ogni ontologia importata viene caricata as-is
-    from lode.reader.loader import Loader
+    from lode.reader import import_cache
     try:
-        imported_loader = Loader(source)
+        return import_cache.fetch(source, _normalize_iri(source))
     except Exception:
         print(f"  [modules] Warning: could not load {source}")
-        return
-
-    imported_graph = imported_loader.get_graph()
-    print(f"  [modules] Imported {len(imported_graph)} triples from {source}")
-    graph += imported_graph
-
-    for _, _, nested_uri in imported_graph.triples((None, OWL.imports, None)):
-        _load_into(graph, str(nested_uri), depth + 1, max_depth, visited)
\ No newline at end of file
+        return None
@@ -1,6 +1,8 @@
 # reader.py - ORCHESTRATOR GENERICO
 from lode.reader.loader import Loader
 from lode.reader.config_manager import get_configuration
+from lode.reader import snapshot
+from lode.reader.instance_cache import InstanceCache
 from lode.models import *
 
 class Reader:
@@ -14,10 +16,11 @@ class Reader:
     """
     
     def __init__(self):
-        self._instance_cache = {}
+        self._instance_cache = InstanceCache()
         self._logic = None  # Logic specializzata (OWL, SKOS, RDF, RDFS)
         self._graph = None
         self._configuration = None
+        self._viewer = None
 
     def get_warnings(self) -> list:
         if not getattr(self, '_warnings_enabled', False):
@@ -26,12 +29,17 @@ class Reader:
             return self._logic._warnings
         return []
     
-    def load_instances(self, graph_path: str, read_as: str, imported=None, closure=None, warnings=False):
-        """Carica e processa grafo RDF"""
+    def load_instances(self, graph_path, read_as: str, imported=None, closure=None, warnings=False,
+                       format=None):
+        """Carica e processa grafo RDF.
+
+        `graph_path` is a path or URL, bytes or a binary stream (with an optional
+        `format` hint), or an rdflib.Graph already parsed by the caller."""
         self._warnings_enabled = warnings
+        self._viewer = None
 
         # 1. Parse generico
-        loader = Loader(graph_path, imported=imported, closure=closure)
+        loader = Loader(graph_path, imported=imported, closure=closure, format=format)
         self._graph = loader.get_graph()
         
         # 2. Seleziona strategia
@@ -46,18 +54,10 @@ class Reader:
     
     def get_instance(self, uri: str, instance_type=None):
         """Ottiene istanze per URI"""
-        uri_identifier = None
-        
-        for identifier in self._instance_cache.keys():
-            if str(identifier) == uri:
-                uri_identifier = identifier
-                break
-        
-        if uri_identifier is None:
+        instances = self._instance_cache.lookup(uri)
+        if instances is None:
             return None
         
-        instances = self._instance_cache[uri_identifier]
-        
         if instance_type is None:
             return instances
         
@@ -71,10 +71,7 @@ class Reader:
         """Raggruppa istanze per tipo"""
         grouped = {}
         
-        for uri_identifier, instances in self._instance_cache.items():
-            if isinstance(uri_identifier, str) and uri_identifier.startswith("LITERAL::"):
-                continue
-            
+        for instances in self._instance_cache.values():
             instances_list = instances if isinstance(instances, set) else [instances]
             
             for instance in instances_list:
@@ -97,12 +94,24 @@ class Reader:
             return self._logic._triples_map
         return {}
 
+    def get_statements_about(self, instance) -> list:
+        """Statements whose subject is `instance` (indexed after phase 6)"""
+        if self._logic and hasattr(self._logic, '_statements_by_subject'):
+            return self._logic._statements_by_subject.get(instance, [])
+        return []
+
     def get_provenance_subgraph(self, instance):
         """Return the rdflib.Graph subgraph that provenanced `instance`."""
         if self._logic and hasattr(self._logic, 'build_provenance_subgraph'):
             return self._logic.build_provenance_subgraph(instance)
         from rdflib import Graph
         return Graph()
+
+    def has_provenance(self, instance) -> bool:
+        """Whether `instance` has a non-empty provenance subgraph (cheap check)."""
+        if self._logic and hasattr(self._logic, 'has_provenance'):
+            return self._logic.has_provenance(instance)
+        return False
     
      
     # function reused by the api to push instances
@@ -117,8 +126,7 @@ class Reader:
         }
         
         # Serializza le proprietà dell'istanza
-        for attr_name in instance.__dict__.keys():
-            value = getattr(instance, attr_name)
+        for attr_name, value in instance.iter_fields():
             # removes empty values from the properties
             if value is not None and not (isinstance(value, (list, set)) and not value):
                 result["properties"][attr_name] = str(value)
@@ -147,15 +155,41 @@ class Reader:
             return str(value)
         
     def get_viewer(self):
-        """Ottiene il viewer appropriato per il formato corrente."""
+        """Ottiene il viewer appropriato per il formato corrente.
+
+        The viewer only reads the extracted model, so it is built once and
+        shared by every caller (including concurrent requests on a cached Reader).
+        """
         if not self._configuration:
             raise ValueError("No configuration loaded. Call load_instances() first.")
 
-        return self._configuration.create_viewer(self)
+        if self._viewer is None:
+            self._viewer = self._configuration.create_viewer(self)
+        return self._viewer
     
+    # ==================== SNAPSHOT ====================
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_viewer'] = None  # rebuilt on demand
+        return state
+
+    def save_snapshot(self, path: str) -> bool:
+        """Persiste il modello estratto (vedi lode.reader.snapshot)."""
+        if self._logic is None:
+            return False  # nothing extracted yet
+        return snapshot.save(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path: str):
+        """Reader ricostruito da uno snapshot, o None se assente/obsoleto."""
+        reader = snapshot.load(path)
+        return reader if isinstance(reader, cls) else None
+
     def clear_cache(self):
         """Pulisce la cache"""
         self._instance_cache.clear()
+        self._viewer = None
         if self._logic:
             self._logic.clear_cache()
     
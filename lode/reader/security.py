@@ -1,4 +1,5 @@
 """Security validation for incoming semantic artefacts."""
+import codecs
 import os
 import socket
 import ipaddress
@@ -17,11 +18,16 @@ MAX_BYTES = _env_int("LODE_MAX_UPLOAD_MB", 10) * 1024 * 1024  # 10 MB default
 MAX_REDIRECTS = _env_int("LODE_MAX_REDIRECTS", 6)  # hops followed when fetching a URL
 MAX_ENTITY_DECLARATIONS = _env_int("LODE_MAX_XML_ENTITIES", 100)
 MAX_DTD_SUBSET = 50 * 1024  # bytes; a legitimate DOCTYPE internal subset is tiny
+MAX_PROLOG = 2 * MAX_DTD_SUBSET  # chars before the root element (XML decl, comments, DOCTYPE)
 ALLOWED_EXTENSIONS = {".rdf", ".owl", ".ttl", ".n3", ".nt", ".jsonld", ".xml"}
 ALLOWED_SCHEMES = {"http", "https"}
 
 # Control characters that are legitimate in a text file.
 _ALLOWED_CONTROL = {"\t", "\n", "\r", "\f", "\v"}
+_HEAD_BYTES = 64         # window checked against the binary signatures
+_CONTROL_SAMPLE = 8192   # leading characters checked for the control-char ratio
+_XML_SPACE = " \t\r\n"
+_PROLOG_TOKENS = ("<?", "<!--", "<!doctype")
 
 # Magic-byte signatures of common binary/archive/executable formats.
 _BINARY_SIGNATURES: tuple[tuple[bytes, str], ...] = (
@@ -71,12 +77,14 @@ def check_size(num_bytes: int) -> None:
     if num_bytes > MAX_BYTES:
         raise ArtefactValidationError("File too large", context={"bytes": num_bytes, "max": MAX_BYTES})
 
-def check_extension(name: str) -> None:
+def check_extension(name: str) -> str:
+    """Return the (lowercased) extension of `name` if it is an allowed one."""
     if not name:
         raise ArtefactValidationError("Missing filename", context={"name": name})
     ext = os.path.splitext(urlparse(name).path)[1].lower()
     if ext not in ALLOWED_EXTENSIONS:
         raise ArtefactValidationError("Extension not allowed", context={"ext": ext})
+    return ext
 
 def check_ip_safe(ip_str: str) -> None:
     """Reject an IP that points at an internal/non-routable range (SSRF).
@@ -114,7 +122,7 @@ def check_is_text(data: bytes) -> None:
     if not data:
         raise ArtefactValidationError("Empty artefact")
     # 1) known binary/archive/executable signature -> reject up front
-    head = data[:64]
+    head = data[:_HEAD_BYTES]
     for signature, label in _BINARY_SIGNATURES:
         if head.startswith(signature):
             raise ArtefactValidationError(
@@ -129,7 +137,7 @@ def check_is_text(data: bytes) -> None:
     except UnicodeDecodeError:
         raise ArtefactValidationError("Not a text/ASCII artefact")
     # 4) too many non-printable control chars -> not a real RDF serialization
-    sample = text[:8192]
+    sample = text[:_CONTROL_SAMPLE]
     if sample:
         control = sum(1 for ch in sample if ord(ch) < 32 and ch not in _ALLOWED_CONTROL)
         if control / len(sample) > 0.05:
@@ -183,6 +191,141 @@ def check_safe_xml(text: str) -> None:
     if _has_entity_reference(subset):  # an entity value references another entity
         raise ArtefactValidationError("Nested XML entities not allowed (billion laughs)")
 
+class TextStreamValidator:
+    """check_size + check_is_text + check_safe_xml applied chunk by chunk.
+
+    For bodies that are consumed as a stream: the payload is never held, decoded
+    or lowercased as a whole here. check_safe_xml only sees the DOCTYPE of the
+    XML prolog, which is bounded by MAX_PROLOG. Feed every chunk, then call close().
+    """
+
+    def __init__(self, max_bytes: int = None):
+        self.max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+        self.total = 0
+        self._head = b""
+        self._head_checked = False
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._sampled = 0
+        self._control = 0
+        self._in_prolog = True
+        self._prolog = ""      # text seen while still in the XML prolog (bounded)
+        self._pos = 0          # prolog scanned up to here
+
+    def feed(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        if self.total > self.max_bytes:
+            raise ArtefactValidationError("File too large", context={"bytes": self.total, "max": self.max_bytes})
+        if not self._head_checked:
+            # binary signatures are reported first, as in check_is_text
+            self._head += chunk
+            if len(self._head) < _HEAD_BYTES:
+                return
+            chunk = self._head
+            self._check_head()
+        self._check_text(chunk)
+
+    def close(self) -> None:
+        if not self.total:
+            raise ArtefactValidationError("Empty artefact")
+        if not self._head_checked:
+            head = self._head
+            self._check_head()
+            self._check_text(head)
+        try:
+            self._scan(self._decoder.decode(b"", final=True))
+        except UnicodeDecodeError:
+            raise ArtefactValidationError("Not a text/ASCII artefact")
+        self._check_control_ratio()
+        if self._in_prolog and self._prolog[self._pos:self._pos + len("<!doctype")].lower() == "<!doctype":
+            check_safe_xml(self._prolog[self._pos:])  # unterminated DOCTYPE
+
+    def _check_text(self, chunk: bytes) -> None:
+        if b"\x00" in chunk:
+            raise ArtefactValidationError("Not a text/ASCII artefact (binary content)")
+        try:
+            text = self._decoder.decode(chunk)
+        except UnicodeDecodeError:
+            raise ArtefactValidationError("Not a text/ASCII artefact")
+        self._scan(text)
+
+    def _check_head(self) -> None:
+        self._head_checked = True
+        head = self._head[:_HEAD_BYTES]
+        self._head = b""
+        for signature, label in _BINARY_SIGNATURES:
+            if head.startswith(signature):
+                raise ArtefactValidationError(
+                    "Not a text/ASCII artefact (binary content)", context={"detected": label}
+                )
+
+    def _check_control_ratio(self) -> None:
+        if self._sampled and self._control / self._sampled > 0.05:
+            raise ArtefactValidationError("Not a text/ASCII artefact (control characters)")
+
+    def _scan(self, text: str) -> None:
+        if not text:
+            return
+        if self._sampled < _CONTROL_SAMPLE:
+            sample = text[:_CONTROL_SAMPLE - self._sampled]
+            self._control += sum(1 for ch in sample if ord(ch) < 32 and ch not in _ALLOWED_CONTROL)
+            self._sampled += len(sample)
+            if self._sampled == _CONTROL_SAMPLE:
+                self._check_control_ratio()
+
+        if self._in_prolog:
+            self._prolog += text
+            self._scan_prolog()
+
+    def _scan_prolog(self) -> None:
+        """Walk the XML prolog (whitespace, <?...?>, comments, DOCTYPE) and vet the
+        DOCTYPE declaration. A DTD is only honoured before the root element, so
+        the scan ends at the first other construct, whatever the format."""
+        p, i = self._prolog, self._pos
+        while True:
+            while i < len(p) and p[i] in _XML_SPACE:
+                i += 1
+            rest = p[i:i + len("<!doctype")].lower()
+            if not rest:
+                break
+            if rest.startswith("<?"):
+                end = p.find("?>", i + 2)
+                end = end + 2 if end != -1 else -1
+            elif rest.startswith("<!--"):
+                end = p.find("-->", i + 4)
+                end = end + 3 if end != -1 else -1
+            elif rest == "<!doctype":
+                end = _doctype_end(p, i)
+                if end != -1:
+                    check_safe_xml(p[i:end])
+            elif any(token.startswith(rest) for token in _PROLOG_TOKENS):
+                end = -1  # token cut by the chunk boundary
+            else:
+                self._in_prolog = False
+                self._prolog = ""
+                return
+            if end == -1:
+                break  # construct still open: wait for more text
+            i = end
+        self._pos = i
+        if len(p) > MAX_PROLOG:
+            if p[i:i + len("<!doctype")].lower() == "<!doctype":
+                check_safe_xml(p[i:])  # oversized internal subset
+            raise ArtefactValidationError("XML prolog too large", context={"max": MAX_PROLOG})
+
+
+def _doctype_end(text: str, start: int) -> int:
+    """Index just past the DOCTYPE declaration starting at `start` (internal
+    subset included), or -1 if it is not closed yet."""
+    end = text.find(">", start)
+    bracket = text.find("[", start)
+    if bracket != -1 and (end == -1 or bracket < end):
+        close = text.find("]", bracket)
+        if close == -1:
+            return -1
+        end = text.find(">", close)
+    return end + 1 if end != -1 else -1
+
+
 async def read_upload_capped(upload, max_bytes: int = MAX_BYTES) -> bytes:
     """Read an UploadFile in chunks, aborting as soon as it exceeds max_bytes.
 
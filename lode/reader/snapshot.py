@@ -0,0 +1,172 @@
+# snapshot.py - PERSISTED POST-EXTRACTION MODEL
+"""
+On-disk snapshot of an extracted Reader: the rdflib graph, the instance cache
+(with cross-references and punning sets), the provenance triples map, namespaces
+and warnings. Loading a snapshot skips parsing and all extraction phases.
+
+A snapshot is only valid for the code that produced it: its header carries a
+fingerprint of the YAML config, the model classes and the extraction logic, and
+any mismatch makes `load` return None so the caller re-extracts.
+
+Model instances are pickled flat: inside the Reader each one is only an empty
+shell, and its state follows as a record of its own (which again refers to
+other instances by shell). A plain pickle nests every referenced instance in
+the one referring to it, so a long rdfs:subClassOf chain hit the recursion
+limit, which cannot be raised for the C pickler on every Python version.
+"""
+import hashlib
+import os
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from lode.models.resource import Resource
+
+SNAPSHOT_FORMAT = 2
+_RECORDS_PER_DUMP = 4096  # instance states per pickle record (bounds the batch in memory)
+_MAGIC = b"LODESNAP"
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent   # lode/
+# Everything that shapes the extracted model: changing any of these files
+# invalidates every snapshot written before.
+_FINGERPRINT_SOURCES = (
+    "reader/config/*.yaml",
+    "reader/config_manager.py",
+    "reader/reader.py",
+    "reader/instance_cache.py",
+    "reader/logic/*.py",
+    "models/*.py",
+)
+
+
+@lru_cache(maxsize=1)
+def model_fingerprint() -> str:
+    h = hashlib.sha256(f"{SNAPSHOT_FORMAT}|{sys.version_info[:2]}".encode())
+    for pattern in _FINGERPRINT_SOURCES:
+        for path in sorted(_PACKAGE_DIR.glob(pattern)):
+            h.update(path.relative_to(_PACKAGE_DIR).as_posix().encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _slot_names() -> list:
+    names, classes = {}, [Resource]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        names.update(dict.fromkeys(cls.__dict__.get("__slots__", ())))
+    return list(names)
+
+
+def _shell(cls):
+    """Empty instance of a model class; its state comes in a later record.
+    Only a placeholder when pickling: _FlatUnpickler resolves it to its own."""
+    return cls.__new__(cls)
+
+
+class _FlatPickler(pickle.Pickler):
+    """Pickles each model instance as a shell and queues it in `pending`."""
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.pending = []
+
+    def reducer_override(self, obj):
+        # called once per object (later references come from the memo)
+        if isinstance(obj, Resource):
+            self.pending.append(obj)
+            return (_shell, (type(obj),))
+        return NotImplemented
+
+    def dump_flat(self, root) -> None:
+        """The slot names, `root`, then lists with the states of the shells in
+        creation order, then None."""
+        # memoized first, at low indexes: every state refers to them with short gets
+        self.dump(_slot_names())
+        self.dump(root)
+        done = 0
+        while done < len(self.pending):  # the states may queue more instances
+            batch = self.pending[done:done + _RECORDS_PER_DUMP]
+            self.dump([obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)[2] for obj in batch])
+            done += len(batch)
+        self.dump(None)
+
+
+class _FlatUnpickler(pickle.Unpickler):
+    """Collects the shells in `shells`, in the order they are created.
+    A single instance reads all the records: its memo resolves the shells."""
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.shells = []
+
+    def find_class(self, module, name):
+        if module == __name__ and name == "_shell":
+            return self._shell
+        return super().find_class(module, name)
+
+    def _shell(self, cls):
+        obj = _shell(cls)
+        self.shells.append(obj)
+        return obj
+
+
+def _load_flat(f):
+    unpickler = _FlatUnpickler(f)
+    unpickler.load()  # slot names
+    root = unpickler.load()
+    done = 0
+    while (states := unpickler.load()) is not None:
+        shells = unpickler.shells
+        for i, state in enumerate(states, done):
+            obj = shells[i]
+            # what pickle's BUILD does for the default state
+            if isinstance(state, tuple) and len(state) == 2:
+                state, slotstate = state
+            else:
+                slotstate = None
+            if state:
+                obj.__dict__.update(state)
+            if slotstate:
+                for name, value in slotstate.items():
+                    setattr(obj, name, value)
+        done += len(states)
+    return root
+
+
+def save(reader, path: str) -> bool:
+    """Write `reader` to `path` atomically. Best-effort: returns False if the
+    model cannot be pickled or written (the caller just keeps no snapshot)."""
+    header = _MAGIC + b" " + model_fingerprint().encode() + b"\n"
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(header)
+            _FlatPickler(f).dump_flat(reader)
+        os.replace(tmp, path)
+        return True
+    except (OSError, RecursionError, pickle.PicklingError, TypeError, AttributeError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+
+
+def load(path: str):
+    """Return the Reader stored at `path`, or None if missing, stale or unreadable.
+
+    Only files written by `save` into the server-owned spool are ever loaded here.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.readline().rstrip(b"\n").split(b" ")
+            if header != [_MAGIC, model_fingerprint().encode()]:
+                return None
+            return _load_flat(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # truncated / incompatible snapshot: treat as a miss
+        return None
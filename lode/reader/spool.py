@@ -0,0 +1,160 @@
+# spool.py - FORMATO DEL GRAFO IN SPOOL
+"""
+Compact on-disk graph format for the /extract spool.
+
+Layout:
+    LODESPOOL <version> <JSON params>\\n     header (format + build parameters)
+    <JSON prefix -> namespace bindings>\\n
+    <JSON term table>\\n                       one entry per distinct term
+    <uint32 little-endian triple indexes>     3 indexes per triple
+
+Terms are interned once, so reloading is a single JSON decode plus graph.addN,
+with no RDF syntax to parse or sniff. The payload is plain data (no pickle):
+a file that merely looks like a spool entry can only ever yield triples.
+"""
+import array
+import json
+import os
+import sys
+import time
+
+from rdflib import Graph, URIRef, BNode, Literal
+
+from lode.exceptions import ArtefactLoadError
+
+SPOOL_MAGIC = b"LODESPOOL"
+SPOOL_VERSION = 1
+
+
+def is_spool_file(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(SPOOL_MAGIC)) == SPOOL_MAGIC
+
+
+def write_graph(graph: Graph, path: str, **params) -> None:
+    """Dump `graph` to `path`; `params` (e.g. read_as, imported, closure) are
+    recorded in the header and returned by `read_graph`. Raises ValueError,
+    writing nothing, if the graph holds a term the format cannot represent
+    (anything but URIRef, BNode and Literal, e.g. a Variable)."""
+    index = {}
+    terms = []
+    triples = array.array("I")
+    for triple in graph:
+        for term in triple:
+            i = index.get(term)
+            if i is None:
+                i = index[term] = len(terms)
+                if isinstance(term, Literal):
+                    terms.append(["L", str(term), term.language,
+                                  str(term.datatype) if term.datatype else None])
+                elif isinstance(term, BNode):
+                    terms.append(["B", str(term)])
+                elif isinstance(term, URIRef):
+                    terms.append(str(term))
+                else:
+                    # it would reload as a URIRef: refuse rather than alter the graph
+                    raise ValueError(f"cannot spool {type(term).__name__} term {term!r}")
+            triples.append(i)
+    if sys.byteorder != "little":
+        triples.byteswap()
+
+    header = json.dumps({"format": f"terms-v{SPOOL_VERSION}", **params})
+    # written aside and renamed: concurrent readers never see a partial entry
+    tmp = f"{path}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(SPOOL_MAGIC + f" {SPOOL_VERSION} {header}\n".encode("utf-8"))
+            f.write(json.dumps({p: str(ns) for p, ns in graph.namespaces()}).encode("utf-8"))
+            f.write(b"\n")
+            f.write(json.dumps(terms, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            f.write(b"\n")
+            f.write(triples.tobytes())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _read_header(f) -> dict:
+    magic, version, header = f.readline().decode("utf-8").split(" ", 2)
+    if magic.encode() != SPOOL_MAGIC or int(version) != SPOOL_VERSION:
+        raise ValueError(f"unsupported spool header {magic} {version}")
+    return json.loads(header)
+
+
+def read_params(path: str) -> dict:
+    """Header params of a spool entry, without loading its graph."""
+    try:
+        with open(path, "rb") as f:
+            return _read_header(f)
+    except (ValueError, TypeError) as e:
+        raise ArtefactLoadError("Corrupted spool entry", context={"path": path, "original_error": str(e)})
+
+
+def read_graph(path: str) -> tuple[Graph, dict]:
+    """Return (graph, header params) for a spool entry written by `write_graph`."""
+    try:
+        with open(path, "rb") as f:
+            params = _read_header(f)
+
+            bindings = json.loads(f.readline())
+            nodes = []
+            for term in json.loads(f.readline()):
+                if isinstance(term, str):
+                    nodes.append(URIRef(term))
+                elif term[0] == "B":
+                    nodes.append(BNode(term[1]))
+                else:
+                    # normalize=False: keep the lexical form exactly as spooled
+                    nodes.append(Literal(term[1], lang=term[2], datatype=term[3], normalize=False))
+
+            triples = array.array("I")
+            triples.frombytes(f.read())
+        if sys.byteorder != "little":
+            triples.byteswap()
+
+        graph = Graph()
+        for prefix, ns in bindings.items():
+            graph.bind(prefix, ns, override=True, replace=True)
+        graph.addN((nodes[triples[i]], nodes[triples[i + 1]], nodes[triples[i + 2]], graph)
+                   for i in range(0, len(triples), 3))
+        return graph, params
+    except (ValueError, IndexError, TypeError) as e:
+        raise ArtefactLoadError("Corrupted spool entry", context={"path": path, "original_error": str(e)})
+
+
+def prune_dir(directory: str, ttl: float, max_bytes: int) -> None:
+    """Evict entries older than `ttl` (by mtime), then enforce the total-size
+    budget by deleting the oldest until back under `max_bytes`. Sub-directories
+    are left alone. Best-effort across workers (races caught via OSError).
+    """
+    cutoff = time.time() - ttl
+    survivors = []  # (mtime, size, path) of entries still within the TTL
+    for name in os.listdir(directory):
+        p = os.path.join(directory, name)
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        if not os.path.isfile(p):
+            continue
+        if st.st_mtime < cutoff:
+            try:
+                os.unlink(p)
+            except OSError:
+                pass
+            continue
+        survivors.append((st.st_mtime, st.st_size, p))
+
+    total = sum(size for _, size, _ in survivors)
+    if total <= max_bytes:
+        return
+    survivors.sort()  # oldest cache-write time first
+    for _, size, p in survivors:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(p)
+            total -= size
+        except OSError:
+            pass
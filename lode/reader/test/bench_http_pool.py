@@ -0,0 +1,96 @@
+"""
+Benchmark of URL fetching through Loader with and without the pooled
+keep-alive session, against a local stand-in HTTP server that serves a
+w3id-style redirect chain (/w3id -> /github -> /raw).
+
+Every new TCP connection costs --connect-ms on the server side, standing in
+for the TCP + TLS handshake a real remote host would need.
+
+The SSRF checks reject loopback addresses, so they are disabled *for this
+benchmark only*.
+
+Usage:
+    python lode/reader/test/bench_http_pool.py [--requests 30] [--connect-ms 30]
+"""
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from lode.reader import loader as loader_module, security
+from lode.reader.loader import Loader
+
+BODY = b"".join(
+    f"<http://example.org/s{i}> <http://example.org/p> \"value {i}\" .\n".encode() for i in range(200)
+)
+CHAIN = {"/w3id": "/github", "/github": "/raw"}
+
+
+def make_handler(connect_s):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+        def setup(self):
+            time.sleep(connect_s)  # handshake cost, once per connection
+            super().setup()
+
+        def do_GET(self):
+            if self.path in CHAIN:
+                self.send_response(302)
+                self.send_header("Location", CHAIN[self.path])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/n-triples")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def timed_loads(url, n):
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        Loader(url)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--connect-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.connect_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/w3id"
+
+    security.check_url_safe = lambda u: None
+    security.check_ip_safe = lambda ip: None
+
+    pooled_session = loader_module._http_session
+    loader_module._http_session = lambda: requests  # one connection per hop
+    unpooled = timed_loads(url, args.requests)
+    loader_module._http_session = pooled_session
+    timed_loads(url, 1)  # warm the pool
+    pooled = timed_loads(url, args.requests)
+    server.shutdown()
+
+    print(f"{args.requests} loads of a 3-hop chain, {args.connect_ms:.0f} ms per new connection")
+    for name, samples in (("no pooling", unpooled), ("pooled", pooled)):
+        print(f"{name:11s} mean {statistics.mean(samples) * 1000:7.1f} ms   "
+              f"median {statistics.median(samples) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of the /extract spool entry: write + reload time of the previous
+Turtle spool (reloaded through Loader's format fallback, RDF/XML first) vs
+the interned-term spool format of lode.reader.spool.
+
+Usage:
+    python lode/reader/test/bench_spool.py path/or/url [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from rdflib import Graph
+
+from lode.reader import Loader, spool
+
+
+def _best(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    graph = Loader(args.source).get_graph()
+    tmp = tempfile.mkdtemp()
+    ttl_path = os.path.join(tmp, "entry.ttl")
+    bin_path = os.path.join(tmp, "entry.rdf")
+
+    def write_turtle():
+        with open(ttl_path, "wb") as f:
+            f.write(graph.serialize(format="turtle").encode("utf-8"))
+
+    rows = [
+        ("turtle", _best(write_turtle, args.repeat),
+         _best(lambda: Loader(ttl_path), args.repeat), os.path.getsize(ttl_path)),
+        ("terms-v1", _best(lambda: spool.write_graph(graph, bin_path), args.repeat),
+         _best(lambda: Loader(bin_path), args.repeat), os.path.getsize(bin_path)),
+    ]
+
+    print(f"{len(graph)} triples")
+    print(f"{'format':10s} {'write (s)':>10s} {'reload (s)':>11s} {'bytes':>12s}")
+    for name, write, reload, size in rows:
+        print(f"{name:10s} {write:10.3f} {reload:11.3f} {size:12d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,16 @@ import urllib.parse
 from rdflib import Graph, URIRef, BNode, Literal as RDFlibLiteral
 from rdflib.namespace import RDF, OWL
 
+def _freeze(value):
+    """Hashable, equality-preserving form of a formatted value (nested dicts and
+    lists), for set-based de-duplication."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class BaseViewer:
     """Base viewer per visualizzare istanze estratte dal Reader."""
     
@@ -19,10 +29,7 @@ class BaseViewer:
         """Ottiene tutte le istanze (esclusi literal)."""
         instances = []
         
-        for uri_id, instance_set in self._cache.items():
-            if isinstance(uri_id, str) and uri_id.startswith("LITERAL::"):
-                continue
-            
+        for instance_set in self._cache.values():
             instance_list = instance_set if isinstance(instance_set, set) else [instance_set]
             instances.extend(instance_list)
 
@@ -30,12 +37,7 @@ class BaseViewer:
     
     def get_instances_from_single_resource(self, resource_uri: str) -> Optional[set]:
         """Ottiene istanze per un URI specifico dalla cache."""
-        # Cerca l'URI nella cache
-        for uri_id in self._cache.keys():
-            if str(uri_id) == resource_uri:
-                return self._cache[uri_id]
-        
-        return None
+        return self._cache.lookup(resource_uri)
 
     def _get_best_label(self, resource, language: Optional[str] = None) -> Optional[str]:
         """Gets the best label to display: language > preferred_label > label > identifier."""
@@ -162,8 +164,6 @@ class BaseViewer:
         Converts Python Models -> HTML Template Dictionary.
         Ensures consistent keys ('type', 'uri', 'label') across all viewers.
         """
-        all_instances = self.get_all_instances()
-
         entities = []
         for instance in instances:
             uri = instance.has_identifier if hasattr(instance, 'has_identifier') else None
@@ -176,8 +176,9 @@ class BaseViewer:
 
             # Extract internal attributes (SuperClasses, etc.)
             relations = {}
-            if hasattr(instance, '__dict__'):
-                for attr, value in instance.__dict__.items():
+            seen = {}
+            if hasattr(instance, 'iter_fields'):
+                for attr, value in instance.iter_fields():
                     if not attr.startswith('_') and value:
                         # Skip attributes that are handled elsewhere or are empty
                         # Clean up name:
@@ -204,8 +205,11 @@ class BaseViewer:
                         if formatted_values:
                             if clean_name not in relations:
                                 relations[clean_name] = []
+                                seen[clean_name] = set()
                             for v in formatted_values:
-                                if v not in relations[clean_name]:  # Valentina FIX: this do not add duplicates in metadata values  
+                                key = _freeze(v)
+                                if key not in seen[clean_name]:  # Valentina FIX: this do not add duplicates in metadata values
+                                    seen[clean_name].add(key)
                                     relations[clean_name].append(v)
             # Sort relations
             ordered_relations = {}
@@ -247,7 +251,7 @@ class BaseViewer:
                     characteristics[display_name] = True
 
             # Extract Statement Entities
-            statements = self._format_statement(all_instances, instance, language)
+            statements = self._format_statement(instance, language)
             type_inst = type(instance).__name__.replace(" ", "_")
 
             is_dep = getattr(instance, 'get_is_deprecated')() if hasattr(instance, 'get_is_deprecated') else getattr(
@@ -262,7 +266,10 @@ class BaseViewer:
                 'statements': statements,
                 'characteristics': characteristics,
                 'is_deprecated': bool(is_dep),
-                'provenance': self._build_provenance_subgraph(instance),
+                # serialized on demand (/extract/provenance, or the static files);
+                # None hides the accordion when there is nothing to serialize
+                'provenance': ({'resource': str(uri), 'kind': type(instance).__name__}
+                               if self.reader.has_provenance(instance) else None),
             })
 
         entities.sort(key=lambda x: (x['label'] or x['uri']).lower())
@@ -349,7 +356,7 @@ class BaseViewer:
             ]
             
         # 9. Statements
-        data.update(self._format_statement(all_instances, ontology_model, language))
+        data.update(self._format_statement(ontology_model, language))
 
         return data
     
@@ -459,12 +466,12 @@ class BaseViewer:
                 'predicate': self._get_best_label(inner_pred, language) if inner_pred else None,
                 'value': self._resolve_resource_value(inner_obj, language) if inner_obj else None,
             }
-            # Walk Statement's own annotations (anything else in __dict__ besides
-            # the reification slots), so dc:date, rdf:value siblings show up too.
+            # Walk Statement's own annotations (any other field besides the
+            # reification slots), so dc:date, rdf:value siblings show up too.
             skip = {'has_subject', 'has_predicate', 'has_object',
                     'has_identifier', 'is_positive_statement'}
             siblings = []
-            for attr, value in obj.__dict__.items():
+            for attr, value in obj.iter_fields():
                 if attr.startswith('_') or attr in skip or not value:
                     continue
                 values = value if isinstance(value, list) else [value]
@@ -503,43 +510,36 @@ class BaseViewer:
 
         return handler_dic
 
-    def _format_statement(self, instances, target_instance, language=None) -> Dict:
+    def _format_statement(self, target_instance, language=None) -> Dict:
         """
         Extracts all statements where the subject matches the given target_instance.
         """
         statements = {}
+        seen = {}
 
         # 1. Validate the target instance
         if target_instance is None:
             return statements
 
-        for instance in instances:
-            if isinstance(instance, Statement):
-                subj = instance.get_has_subject()
-
-                # 2. Identity comparison (handles punning: same URI, different Python instances)
-                if subj is not target_instance:
-                    continue
+        # 2. Identity lookup (handles punning: same URI, different Python instances)
+        for instance in self.reader.get_statements_about(target_instance):
+            predicate = instance.get_has_predicate()
+            obj = instance.get_has_object()
 
-                predicate = instance.get_has_predicate()
-                obj = instance.get_has_object()
+            # 3. Predicate Resolution
+            pred_label = self._get_best_label(predicate, language) if predicate else "Annotation"
 
-                if obj:
-                    obj_data = self._resolve_resource_value(obj, language)
+            if pred_label not in statements:
+                statements[pred_label] = []
+                seen[pred_label] = set()
 
-                # 3. Predicate Resolution
-                pred_label = self._get_best_label(predicate, language) if predicate else "Annotation"
-
-                if pred_label not in statements:
-                    statements[pred_label] = []
-
-                # 4. Resolve Object and Prevent Duplicates
-                if obj:
-                    obj_data = self._resolve_resource_value(obj, language)
-
-
-                    if obj_data not in statements[pred_label]:
-                        statements[pred_label].append(obj_data)
+            # 4. Resolve Object and Prevent Duplicates
+            if obj:
+                obj_data = self._resolve_resource_value(obj, language)
+                key = _freeze(obj_data)
+                if key not in seen[pred_label]:
+                    seen[pred_label].add(key)
+                    statements[pred_label].append(obj_data)
 
         return statements
 
@@ -799,14 +799,24 @@ class BaseViewer:
     
     # ========== PROVENANCE: subgraph serialisation for each card ==========
 
-    def _build_provenance_subgraph(self, instance) -> Dict[str, str]:
-        """Get the provenance subgraph from the reader and serialize it."""
-        sub = self.reader.get_provenance_subgraph(instance)
-        return {
-            'turtle': self._safe_serialize(sub, 'turtle'),
-            'rdfxml': self._safe_serialize(sub, 'xml'),
-            'n3':     self._safe_serialize(sub, 'n3'),
-        }
+    def export_provenance(self, resource_uri: str, fmt: str = "turtle",
+                          kind: Optional[str] = None) -> Optional[str]:
+        """Serializza il provenance subgraph della card (resource_uri, kind):
+        le istanze della risorsa di classe `kind`, o tutte se kind è None.
+        None se la risorsa (o la classe) non c'è."""
+        instances = self.get_instances_from_single_resource(resource_uri) or ()
+        matching = [inst for inst in instances if kind is None or type(inst).__name__ == kind]
+        if not matching:
+            return None
+        if len(matching) == 1:
+            return self._safe_serialize(self.reader.get_provenance_subgraph(matching[0]), fmt)
+        g = Graph()
+        for prefix, ns in self.reader._graph.namespaces():
+            g.bind(prefix, ns)
+        for inst in matching:
+            for t in self.reader.get_provenance_subgraph(inst):
+                g.add(t)
+        return self._safe_serialize(g, fmt)
 
     @staticmethod
     def _safe_serialize(g, fmt: str) -> str:
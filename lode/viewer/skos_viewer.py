@@ -139,7 +139,7 @@ class SkosViewer(BaseViewer):
                 'has_broad_match', 'has_narrow_match', 'has_exact_match', 'has_close_match', 'has_related_match',
                 'is_ordered',  # Boolean, not a relation
             }
-            for attr, value in instance.__dict__.items():
+            for attr, value in instance.iter_fields():
                 if not attr.startswith('_') and value and attr not in skip_attrs:
                     clean_name = attr.replace('has_', '').replace('is_', '').replace('_', ' ').title()
                     relations[clean_name] = value
@@ -157,4 +157,285 @@ def test_url_spool_cache_and_bypass(tmp_path, monkeypatch):
 
     assert seen[0] == "http://x/o"
     assert seen[1].endswith(".rdf") and seen[1] != "http://x/o"   # served from spool
-    assert seen[2] == "http://x/o"                                # cache=false refetched
\ No newline at end of file
+    assert seen[2] == "http://x/o"                                # cache=false refetched
+
+
+def test_reader_lru_reuse_and_eviction(tmp_path, monkeypatch):
+    """Navigating the same artefact reuses the extracted Reader (and its viewer);
+    cache=false re-extracts; the oldest entry is evicted past the budget."""
+    import os
+    from rdflib import Graph
+    from lode import api
+
+    monkeypatch.setattr(api.security, "check_url_safe", lambda u: None)
+    monkeypatch.setattr(api, "SPOOL_DIR", os.path.realpath(str(tmp_path)))
+    cache = api._ReaderCache(max_units=2, ttl=api._SPOOL_TTL)
+    monkeypatch.setattr(api, "_reader_cache", cache)
+
+    seen = []
+    def fake_load(self, graph_path, read_as, **kw):
+        seen.append(graph_path)
+        self._graph = Graph()
+        self._instance_cache = {graph_path: set()}   # 1 unit per reader
+    monkeypatch.setattr(Reader, "load_instances", fake_load)
+
+    r1 = api._resolve_reader("owl", "http://x/a", None, None, None, False)
+    assert api._resolve_reader("owl", "http://x/a", None, None, None, False) is r1
+    assert len(seen) == 1                                         # no re-extraction
+
+    r2 = api._resolve_reader("owl", "http://x/a", None, None, None, False, use_cache=False)
+    assert r2 is not r1 and len(seen) == 2                        # cache=false refreshed
+
+    api._resolve_reader("owl", "http://x/b", None, None, None, False)
+    api._resolve_reader("owl", "http://x/c", None, None, None, False)   # evicts /a
+    api._resolve_reader("owl", "http://x/a", None, None, None, False)
+    assert len(seen) == 5
+
+
+def test_upload_parsed_from_memory_and_spooled_aside(tmp_path, monkeypatch):
+    """The upload is validated while it is read, extracted from memory, and
+    spooled in the background for later navigation; rejected bodies leave
+    nothing behind."""
+    import os
+    from rdflib import Graph
+    from lode import api
+
+    monkeypatch.setattr(api, "SPOOL_DIR", os.path.realpath(str(tmp_path)))
+    seen = []
+    def fake_load(self, graph_path, read_as, **kw):
+        seen.append(graph_path.getvalue())   # a buffer, not a spool path
+        self._graph = Graph()
+    monkeypatch.setattr(Reader, "load_instances", fake_load)
+    monkeypatch.setattr(api, "_render_view",
+                        lambda request, reader, **kw: api.HTMLResponse(kw["upload_id"]))
+
+    body = b"<http://e/a> <http://e/b> \"citt\xc3\xa0\" .\n" * 5000
+    resp = client.post("/extract", data={"read_as": "owl"}, files={"file": ("a.nt", body, "text/plain")})
+    assert resp.status_code == 200
+    assert seen == [body]
+    path = api._upload_spool_path(resp.text)
+    assert path.endswith(".nt")                 # spooled under its own extension
+    with open(path, "rb") as f:
+        assert f.read() == body
+
+    xxe = b'<?xml version="1.0"?><!DOCTYPE r [ <!ENTITY x SYSTEM "file:///etc/passwd"> ]><r>&x;</r>'
+    before = set(os.listdir(tmp_path))
+    for name, data in (("x.rdf", xxe), ("png.rdf", b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)):
+        resp = client.post("/extract", data={"read_as": "owl"}, files={"file": (name, data, "text/plain")})
+        assert resp.status_code == 400
+    assert set(os.listdir(tmp_path)) == before
+
+
+@pytest.mark.parametrize("isolated", [False, True])
+def test_upload_extension_is_the_format_hint(tmp_path, monkeypatch, caplog, isolated):
+    """The validated upload extension reaches the loader as format hint, from
+    memory and from the spool entry the extraction process reads: a .n3 is
+    parsed as N3, a .ttl without directives is not tried as XML first."""
+    import logging
+    import os
+    from lode import api
+    from lode.reader import extraction_pool
+
+    class InProcessPool:
+        def run(self, fn, *args, cancel=None):
+            return fn(*args)
+
+    monkeypatch.setattr(api, "SPOOL_DIR", os.path.realpath(str(tmp_path)))
+    monkeypatch.setattr(api, "_get_extraction_pool", lambda: InProcessPool() if isolated else None)
+    monkeypatch.setattr(api, "_render_view",
+                        lambda request, reader, **kw: api.HTMLResponse(kw["upload_id"]))
+    bodies = {
+        "a.n3": b"@prefix ex: <http://e/> .\nex:a ex:b ex:c .\n",
+        "b.ttl": b"<http://e/a> <http://e/b> <http://e/c> ; <http://e/d> <http://e/e> .\n",
+    }
+    for name, body in bodies.items():
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="lode.reader.loader"):
+            resp = client.post("/extract", data={"read_as": "owl"},
+                               files={"file": (name, body, "text/plain")})
+        assert resp.status_code == 200
+        detections = [r.getMessage() for r in caplog.records if "format detection" in r.getMessage()]
+        expected = "n3" if name.endswith(".n3") else "turtle"
+        assert detections and detections[0].endswith(f"-> {expected} (format hint)")
+        assert api._upload_spool_path(resp.text).endswith(os.path.splitext(name)[1])
+
+
+def test_provenance_fetched_lazily_and_cached(tmp_path, monkeypatch):
+    """Cards carry only the /extract/provenance link; the serialized subgraph
+    is computed on the first fetch and then served from the cache."""
+    import html
+    import os
+    from lode import api
+
+    monkeypatch.setattr(api, "SPOOL_DIR", os.path.realpath(str(tmp_path)))
+    monkeypatch.setattr(api, "_provenance_cache",
+                        api._ProvenanceCache(api._PROVENANCE_CACHE_MAX_CHARS, api._SPOOL_TTL))
+    body = (b"@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            b"<http://e/onto> a owl:Ontology .\n"
+            b"<http://e/onto#Cat> a owl:Class .\n")
+    resp = client.post("/extract", data={"read_as": "owl", "imported": "true"},
+                       files={"file": ("a.ttl", body, "text/turtle")})
+    assert resp.status_code == 200
+    assert "owl:Class" not in resp.text          # nothing serialized up front
+    srcs = [html.unescape(m) for m in re.findall(r'data-prov-src="([^"]+)"', resp.text)]
+    cat = next(s for s in srcs if "Cat" in s and s.endswith("format=ttl"))
+    assert "imported=true" in cat               # same Reader as the page
+
+    first = client.get(cat)
+    assert first.status_code == 200
+    assert first.headers["content-type"].startswith("text/turtle")
+    assert "owl:Class" in first.text
+
+    async def no_extraction(*a, **kw):
+        raise AssertionError("provenance cache miss")
+    monkeypatch.setattr(api, "_run_extraction", no_extraction)
+    assert client.get(cat).text == first.text
+
+    monkeypatch.undo()
+    assert client.get(cat.replace("kind=Concept", "kind=Individual")).status_code == 400
+    assert client.get(cat.replace("format=ttl", "format=json")).status_code == 400
+
+
+def test_card_without_provenance_has_no_accordion():
+    """A card whose provenance subgraph is empty (provenance None) renders
+    without the provenance accordion; the others keep it."""
+    from lode import api
+
+    card = api.templates.env.get_template("_entity_card.html")
+    item = {"type": "Datatype", "uri": "http://www.w3.org/2001/XMLSchema#integer",
+            "label": "integer", "anchor_id": "id_integer_Datatype", "relations": {},
+            "statements": {}, "characteristics": {}, "is_deprecated": False,
+            "provenance": None}
+    assert "prov-accordion" not in card.render(item=item, prov_qs="read_as=owl")
+
+    item["provenance"] = {"resource": item["uri"], "kind": "Datatype"}
+    html = card.render(item=item, prov_qs="read_as=owl")
+    assert "prov-accordion" in html and "kind=Datatype" in html
+
+# --- Extraction executor -----------------------------------------------------
+
+
+def test_extraction_offloaded_and_bounded(monkeypatch):
+    """Extraction runs off the event loop; with every slot taken, a queued
+    request gives up after the queue timeout with ExtractionBusyError (503)."""
+    import asyncio
+    import threading
+    from lode import api
+    from lode.exceptions import ExtractionBusyError
+
+    monkeypatch.setattr(api, "_EXTRACT_CONCURRENCY", 1)
+    monkeypatch.setattr(api, "_EXTRACT_QUEUE_TIMEOUT", 0.2)
+    release = threading.Event()
+
+    async def scenario():
+        slow = asyncio.ensure_future(api._run_extraction(release.wait, 5))
+        await asyncio.sleep(0.05)
+        # the loop is still free while the slow job holds the only slot
+        ticks = 0
+        for _ in range(3):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        with pytest.raises(ExtractionBusyError):
+            await api._run_extraction(lambda: "never")
+        release.set()
+        assert await slow is True
+        assert await api._run_extraction(lambda: "ok") == "ok"
+        return ticks
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_cancel_event_only_for_isolated_jobs(monkeypatch):
+    """Only the process pool can act on a cancellation, so in-process jobs
+    run without a cancel Event."""
+    import asyncio
+    import threading
+    from lode import api
+
+    def job_cancel():
+        return api._job_context.cancel
+
+    monkeypatch.setattr(api, "EXTRACT_ISOLATED", False)
+    assert asyncio.run(api._run_extraction(job_cancel)) is None
+    monkeypatch.setattr(api, "EXTRACT_ISOLATED", True)
+    assert isinstance(asyncio.run(api._run_extraction(job_cancel)), threading.Event)
+
+
+def test_busy_error_is_503():
+    from lode import api
+    from lode.exceptions import ExtractionBusyError
+    with patch.object(api, "_resolve_reader", side_effect=ExtractionBusyError("Server busy")):
+        resp = client.get("/extract", params={"read_as": "owl", "url": FABIO_URL})
+    assert resp.status_code == 503
+    assert "Retry-After" in resp.headers
+
+
+def test_extraction_pool_limits():
+    """A job past its deadline (or cancelled) kills only its own process: the
+    pool replaces it and keeps serving."""
+    import threading
+    import time
+    from lode.exceptions import ExtractionLimitError
+    from lode.reader.extraction_pool import ExtractionPool
+
+    pool = ExtractionPool(1, deadline_s=0.5, max_memory_mb=0, max_cpu_s=0)
+    try:
+        assert pool.run(len, [1, 2, 3]) == 3
+        with pytest.raises(ExtractionLimitError) as exc:
+            pool.run(time.sleep, 5)
+        assert exc.value.context["limit"] == "deadline"
+
+        cancel = threading.Event()
+        threading.Timer(0.1, cancel.set).start()
+        pool.deadline_s = 10
+        with pytest.raises(ExtractionLimitError) as exc:
+            pool.run(time.sleep, 5, cancel=cancel)
+        assert exc.value.context["limit"] == "cancelled"
+
+        assert pool.run(len, [1]) == 1          # replacement process works
+    finally:
+        pool.shutdown()
+
+
+def test_isolated_extraction_of_a_deep_hierarchy(tmp_path):
+    """A subClassOf chain deeper than the pickle recursion limit still comes
+    back from the extraction process through its snapshot."""
+    from lode import api
+    from lode.models import Concept
+    from lode.reader.extraction_pool import ExtractionPool
+
+    depth = 3000
+    onto = tmp_path / "deep.ttl"
+    onto.write_text(
+        "@prefix ex: <http://e/> .\n@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+        + "".join(f"ex:C{i} a owl:Class ; rdfs:subClassOf ex:C{i + 1} .\n" for i in range(depth)))
+
+    pool = ExtractionPool(1, deadline_s=60, max_memory_mb=0, max_cpu_s=0)
+    try:
+        with patch.object(api, "_get_extraction_pool", return_value=pool):
+            reader = api._extract(str(onto), "owl", None, None, False, str(tmp_path / "s.snap"))
+    finally:
+        pool.shutdown()
+
+    node, steps = reader.get_instance("http://e/C0", Concept), 0
+    while node.get_is_sub_concept_of():
+        node, steps = node.get_is_sub_concept_of()[0], steps + 1
+    assert steps == depth and node.get_has_identifier() == f"http://e/C{depth}"
+
+
+def test_isolated_extraction_without_snapshot_fails(tmp_path):
+    """No snapshot from the pool process is an error: the artefact is never
+    parsed again in the web worker, outside the job limits."""
+    from lode import api
+    from lode.exceptions import ArtefactLoadError
+
+    class NoSnapshotPool:
+        def run(self, fn, *args, cancel=None):
+            return False
+
+    with patch.object(api, "_get_extraction_pool", return_value=NoSnapshotPool()), \
+            patch.object(api.Reader, "load_instances") as load:
+        with pytest.raises(ArtefactLoadError):
+            api._extract("x.ttl", "owl", None, None, False, str(tmp_path / "s.snap"))
+    load.assert_not_called()
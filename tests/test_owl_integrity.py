@@ -478,13 +478,11 @@ def test_all_literals_have_value(owl_logic):
     """Every Literal in cache must have has_value set."""
     from lode.models import Literal
 
-    for instances in owl_logic._instance_cache.values():
-        for inst in instances:
-            if not isinstance(inst, Literal):
-                continue
-            assert inst.get_has_value() is not None, (
-                f"Literal has no value"
-            )
+    for inst in owl_logic._literals.values():
+        assert isinstance(inst, Literal)
+        assert inst.get_has_value() is not None, (
+            f"Literal has no value"
+        )
 
 def test_no_generic_property_in_cache(owl_logic):
     for instances in owl_logic._instance_cache.values():
@@ -94,6 +94,36 @@ def _make_rdf_list(g, items):
 
 class TestPhase1:
 
+    def test_predicate_table_matches_mapping_scan(self):
+        """The precomputed classification of a predicate set gives what the scan
+        over the whole property mapping gives, for every pair of predicates."""
+        from itertools import combinations
+        strategy = OwlConfigManager()
+        mapping = strategy.get_property_mapping()
+
+        def scan(preds):
+            fallback = inferred = None
+            for predicate, cfg in mapping.items():
+                if predicate in preds:
+                    if 'inferred_class' in cfg:
+                        if inferred is None or issubclass(cfg['inferred_class'], inferred):
+                            inferred = cfg['inferred_class']
+                    elif fallback is None and len(cfg.get('target_classes', [])) == 1:
+                        if cfg.get('classify', True):
+                            fallback = cfg['target_classes'][0]
+            return inferred or fallback
+
+        classifiers = list(strategy.get_predicate_classifiers())
+        for pair in combinations(classifiers, 2):
+            assert strategy.classify_predicates(pair) is scan(pair)
+
+        node = BNode()
+        g = Graph()
+        g.add((node, OWL.onProperty, EX.p))
+        g.add((node, OWL.someValuesFrom, EX.C))
+        g.add((node, RDFS.label, RDFLiteral("r")))
+        assert strategy.classify_by_predicate(node, g) is scan(set(g.predicates(node)))
+
     def test_bnode_classified_as_quantifier_via_some_values_from(self):
         """A BNode bearing owl:someValuesFrom must be classified as Quantifier."""
         bnode = BNode()
@@ -453,6 +483,28 @@ class TestPhase3:
         assert len(labels) >= 1
         assert any(l.get_has_value() == "My Class" for l in labels)
 
+    def test_literals_interned_by_language_and_datatype(self):
+        """Literals sharing a lexical form but not language or datatype stay
+        distinct; equal ones are shared. None of them enters the instance cache."""
+        logic = _make_logic([
+            (EX.A, RDF.type, OWL.Class),
+            (EX.B, RDF.type, OWL.Class),
+            (EX.A, RDFS.label, RDFLiteral("Name", lang="en")),
+            (EX.A, RDFS.label, RDFLiteral("Name", lang="it")),
+            (EX.B, RDFS.label, RDFLiteral("Name", lang="en")),
+            (EX.A, RDFS.comment, RDFLiteral("1", datatype=XSD.string)),
+            (EX.A, RDFS.comment, RDFLiteral("1", datatype=XSD.integer)),
+        ])
+        _run_all(logic)
+        a = _instance_for_uri(logic, EX.A, Concept)
+        b = _instance_for_uri(logic, EX.B, Concept)
+        assert sorted(l.get_has_language() for l in a.get_has_label()) == ["en", "it"]
+        assert b.get_has_label()[0] in a.get_has_label()
+        assert sorted(l.get_has_type().get_has_identifier() for l in a.get_has_comment()) == \
+            [str(XSD.integer), str(XSD.string)]
+        assert ("Name", "it", None) in logic._literals
+        assert not any(isinstance(i, Literal) for insts in logic._instance_cache.values() for i in insts)
+
     def test_rdfs_subclass_of_populated(self):
         """rdfs:subClassOf must wire is_sub_concept_of on the Concept."""
         logic = _make_logic([
@@ -552,6 +604,24 @@ class TestPhase3:
         b = _instance_for_uri(logic, EX.B, Concept)
         assert b in a.get_is_disjoint_with()
 
+    def test_symmetric_axioms_stored_once(self):
+        """Axioms stated in both directions (and high fan-out ones) keep one
+        entry per partner, in the order they were first seen."""
+        others = [EX[f"D{i}"] for i in range(20)]
+        triples = [(EX.A, RDF.type, OWL.Class), (EX.B, RDF.type, OWL.Class),
+                   (EX.A, OWL.disjointWith, EX.B), (EX.B, OWL.disjointWith, EX.A),
+                   (EX.A, OWL.equivalentClass, EX.B), (EX.B, OWL.equivalentClass, EX.A)]
+        triples += [(EX.A, OWL.disjointWith, o) for o in others]
+        logic = _make_logic(triples)
+        _run_all(logic)
+        a = _instance_for_uri(logic, EX.A, Concept)
+        b = _instance_for_uri(logic, EX.B, Concept)
+        assert b.get_is_disjoint_with() == [a]
+        assert a.get_is_equivalent_to() == [b] and b.get_is_equivalent_to() == [a]
+        disjoint = a.get_is_disjoint_with()
+        assert len(disjoint) == 21 and len(set(disjoint)) == 21
+        assert disjoint is a.get_is_disjoint_with()   # no copy per call
+
     def test_on_property_wired_to_restriction(self):
         """owl:onProperty must set applies_on_property on the Restriction."""
         restriction = BNode()
@@ -719,6 +789,24 @@ class TestPhase3:
         assert dt is not None
         assert dt.get_has_identifier() == str(XSD.double)
 
+    def test_predicate_dispatch_compiled_once(self):
+        """populate_instance compiles each predicate's dispatch once: foreign
+        namespaces are dropped, mapped predicates apply to every subject."""
+        logic = _make_logic([
+            (EX.A, RDF.type, OWL.Class),
+            (EX.B, RDF.type, OWL.Class),
+            (EX.A, RDFS.label, RDFLiteral("A")),
+            (EX.B, RDFS.label, RDFLiteral("B")),
+            (EX.A, EX.custom, RDFLiteral("x")),
+        ])
+        compiled = []
+        compile_predicate = logic._compile_predicate
+        logic._compile_predicate = lambda p: compiled.append(p) or compile_predicate(p)
+        _run_all(logic)
+        assert compiled.count(RDFS.label) == 1
+        assert logic._predicate_plan[EX.custom] is False
+        labels = [l.get_has_value() for l in _instance_for_uri(logic, EX.B, Concept).get_has_label()]
+        assert labels == ["B"]
 
 # ===========================================================================
 # PHASE 4 - Group axioms
@@ -780,6 +868,28 @@ class TestPhase4:
         assert p2 in p1.get_is_disjoint_with()
         assert p1 in p2.get_is_disjoint_with()
 
+    def test_group_axiom_provenance_indexed_by_member(self):
+        """Each member's provenance includes only the group axioms listing it."""
+        g = Graph()
+        ab, bc = BNode(), BNode()
+        g.add((ab, RDF.type, OWL.AllDisjointClasses))
+        g.add((ab, OWL.members, _make_rdf_list(g, [EX.A, EX.B])))
+        g.add((bc, RDF.type, OWL.AllDisjointClasses))
+        g.add((bc, OWL.members, _make_rdf_list(g, [EX.B, EX.C])))
+        for cls in (EX.A, EX.B, EX.C):
+            g.add((cls, RDF.type, OWL.Class))
+        logic = OwlLogic(g, {}, OwlConfigManager())
+        _run_all(logic)
+        assert logic._axioms_by_member == {EX.A: [ab], EX.B: [ab, bc], EX.C: [bc]}
+
+        def axioms_in(cls):
+            sub = logic.build_provenance_subgraph(_instance_for_uri(logic, cls, Concept))
+            return set(sub.subjects(RDF.type, OWL.AllDisjointClasses))
+        assert axioms_in(EX.A) == {ab}
+        assert axioms_in(EX.B) == {ab, bc}
+        assert (ab, OWL.members, g.value(ab, OWL.members)) in \
+            logic.build_provenance_subgraph(_instance_for_uri(logic, EX.A, Concept))
+
 
 # ===========================================================================
 # PHASE 5 - Fallback: reclassification + OWL defaults
@@ -916,6 +1026,97 @@ class TestPhase5Reclassification:
         inst = _instance_for_uri(logic, EX.unknownPred, Annotation)
         assert inst is not None
 
+    def test_property_graph_facts_collected_once(self):
+        """Inverse links and declared ranges of every generic Property are read
+        in one batch; graph usage still decides when nothing else does."""
+        logic = _make_logic([
+            (EX.inv, OWL.inverseOf, EX.other),
+            (EX.ranged, RDFS.range, XSD.string),
+            (EX.ranged, RDFS.subPropertyOf, EX.untyped),
+            (EX.s, EX.used, RDFLiteral("x")),
+            (EX.s, EX.used, EX.o),
+        ])
+        for phase in ("phase1_classify_from_predicates", "phase2_create_from_types",
+                      "phase3_populate_properties", "phase4_process_group_axioms"):
+            getattr(logic, phase)()
+        facts = logic._collect_property_facts()
+        assert facts == {EX.ranged: (False, Attribute), EX.untyped: (False, None)}
+        assert logic._usage_type(EX.used) is Relation
+        assert logic._usage_type(EX.nowhere) is None
+
+        logic.phase5_fallback()
+        assert logic._property_facts == {}
+        assert _instance_for_uri(logic, EX.inv, Relation)
+        assert _instance_for_uri(logic, EX.ranged, Attribute)
+        assert _instance_for_uri(logic, EX.untyped, Attribute)   # from its sub-property
+
+    def test_deep_sub_property_chain_reclassified_down(self):
+        """Every ancestor of a typed leaf inherits its type through the child
+        index, which follows the cache as properties are reclassified."""
+        chain = [EX[f"p{i}"] for i in range(30)]
+        triples = [(child, RDFS.subPropertyOf, parent) for parent, child in zip(chain, chain[1:])]
+        triples.append((chain[-1], RDF.type, OWL.DatatypeProperty))
+        logic = _make_logic(triples)
+        _run_all(logic)
+        assert all(_instance_for_uri(logic, p, Attribute) for p in chain)
+
+        children, parents = logic._children_index["get_is_sub_property_of"]
+        for parent, child in zip(chain, chain[1:]):
+            child_inst = _instance_for_uri(logic, child)
+            assert list(children[_instance_for_uri(logic, parent)]) == [child_inst]
+            assert parents[child_inst] == (_instance_for_uri(logic, parent),)
+
+    def test_children_index_follows_parents_added_later(self):
+        """A parent added after the child index is built is picked up by the
+        refresh, as a full rebuild would."""
+        logic = _make_logic([
+            (EX.A, RDF.type, OWL.ObjectProperty),
+            (EX.B, RDF.type, OWL.ObjectProperty),
+            (EX.C, RDF.type, OWL.ObjectProperty),
+            (EX.C, RDFS.subPropertyOf, EX.A),
+        ])
+        _run_all(logic)
+        a, b, c = (_instance_for_uri(logic, u, Relation) for u in (EX.A, EX.B, EX.C))
+        assert list(logic._children_of(a, "get_is_sub_property_of")) == [c]
+
+        c.set_is_sub_property_of(b)
+        logic._refresh_children_index(c)
+        assert list(logic._children_of(b, "get_is_sub_property_of")) == [c]
+        assert list(logic._children_of(a, "get_is_sub_property_of")) == [c]
+        logic._children_index.clear()
+        assert list(logic._children_of(b, "get_is_sub_property_of")) == [c]
+
+    def test_children_index_refresh_keeps_sibling_order(self):
+        """Dropping one child of a wide parent leaves its siblings in cache
+        order; re-adding it appends it, as a rebuild would after re-caching."""
+        kids = [EX[f"k{i}"] for i in range(5)]
+        logic = _make_logic([(EX.P, RDF.type, OWL.ObjectProperty)]
+                            + [(k, RDFS.subPropertyOf, EX.P) for k in kids])
+        _run_all(logic)
+        p = _instance_for_uri(logic, EX.P, Relation)
+        k = [_instance_for_uri(logic, u, Relation) for u in kids]
+        assert list(logic._children_of(p, "get_is_sub_property_of")) == k
+
+        logic._refresh_children_index(k[2], removed=True)
+        assert list(logic._children_of(p, "get_is_sub_property_of")) == k[:2] + k[3:]
+        logic._refresh_children_index(k[2])
+        assert list(logic._children_of(p, "get_is_sub_property_of")) == k[:2] + k[3:] + [k[2]]
+
+    def test_reclassification_keeps_slot_fields(self):
+        """The __class__ swap of phase 5 carries every populated field over to
+        the reclassified instance (models store them in __slots__)."""
+        logic = _make_logic([
+            (EX.parentProp, RDF.type, OWL.ObjectProperty),
+            (EX.childProp, RDFS.subPropertyOf, EX.parentProp),
+            (EX.childProp, RDFS.label, RDFLiteral("child")),
+        ])
+        _run_all(logic)
+        child = _instance_for_uri(logic, EX.childProp, Relation)
+        assert not hasattr(child, "__dict__")
+        assert [l.get_has_value() for l in child.get_has_label()] == ["child"]
+        assert child.get_is_sub_property_of() == [_instance_for_uri(logic, EX.parentProp, Relation)]
+        assert child.get_is_symmetric() is False
+
 # ===========================================================================
 # PHASE 5 - Domain/range inheritance via subPropertyOf
 # ===========================================================================
@@ -1171,6 +1372,22 @@ class TestGetOrCreate:
         assert Concept in types
         assert Individual in types
 
+    def test_resolution_fast_path_follows_promotions(self):
+        """A repeated request is served from the resolution cache, which a
+        promotion or _force_as_concept invalidates for that node."""
+        logic = _make_logic([])
+        prop = logic.get_or_create(EX.p, Property, populate=False)
+        assert logic._resolved[EX.p][Property] == (prop, Property)
+        relation = logic.get_or_create(EX.p, Relation, populate=False)
+        assert relation is not prop
+        assert logic.get_or_create(EX.p, Property, populate=False) is relation
+
+        individual = logic.get_or_create(EX.x, Individual, populate=False)
+        assert logic.get_or_create(EX.x, Individual, populate=False) is individual
+        concept = logic._force_as_concept(EX.x)
+        assert EX.x not in logic._resolved
+        assert logic.get_or_create(EX.x, Concept, populate=False) is concept
+
     def test_xsd_uri_creates_datatype(self):
         """A URI in the XSD namespace must always produce a Datatype regardless of
         the requested class."""
@@ -1626,6 +1843,55 @@ class TestCacheEdgeCases:
         assert labels_after == labels_before
  
  
+    def test_relation_lists_allocated_on_first_set(self):
+        """Empty relation fields share one read-only placeholder until the
+        first set_*; iter_fields skips them and copy_fields_from shares lists."""
+        from lode.models.resource import EMPTY
+        a, b = Concept(), Concept()
+        assert a.is_sub_concept_of is EMPTY and b.has_label is EMPTY
+        with pytest.raises(TypeError):
+            a.is_sub_concept_of.append(b)
+        assert "is_sub_concept_of" not in dict(a.iter_fields())
+
+        a.set_is_sub_concept_of(b)
+        assert a.get_is_sub_concept_of() == [b] and b.is_sub_concept_of is EMPTY
+        assert dict(a.iter_fields())["is_sub_concept_of"] == [b]
+
+        copy = Concept()
+        copy.copy_fields_from(a)
+        assert copy.is_sub_concept_of is a.is_sub_concept_of
+        copy.set_has_label("x")
+        assert a.has_label is copy.has_label == ["x"]
+
+    def test_relation_list_keeps_first_insertion(self):
+        """RelationList drops repeated values, keeps insertion order past the
+        membership index threshold and survives pickling; SWRL atom arguments
+        stay positional."""
+        import pickle
+        from lode.models import Atom
+        from lode.models.resource import RelationList
+        c = Concept()
+        labels = [Literal() for _ in range(RelationList.INDEX_FROM + 4)]
+        for label in labels + labels[::-1]:
+            c.set_has_label(label)
+        assert isinstance(c.has_label, RelationList)
+        assert c.get_has_label() == labels and labels[-1] in c.has_label
+
+        c.has_label.remove(labels[0])
+        c.set_has_label(labels[0])
+        assert c.get_has_label() == labels[1:] + labels[:1]
+
+        restored = pickle.loads(pickle.dumps(c))
+        assert isinstance(restored.has_label, RelationList)
+        assert len(restored.get_has_label()) == len(labels)
+        restored.set_has_label(restored.get_has_label()[0])
+        assert len(restored.get_has_label()) == len(labels)
+
+        atom, x = Atom(), object()
+        atom.set_has_arguments(x)
+        atom.set_has_arguments(x)
+        assert atom.get_has_arguments() == [x, x]
+
 # ===========================================================================
 # PHASE 6 EXCLUSIONS
 # ===========================================================================
@@ -55,6 +55,115 @@ class TestReaderWithLoadedOntology:
         assert hasattr(viewer, 'get_all_instances')
 
 
+class TestInstanceIndex:
+    def test_lookup_follows_the_cache(self, tmp_path):
+        import pickle
+        from rdflib import BNode, URIRef
+        from lode.reader.instance_cache import InstanceCache
+
+        cache = InstanceCache()
+        cache[URIRef("http://e/A")] = {"a"}
+        cache.setdefault(BNode("b1"), set()).add("b")
+        assert cache.lookup("http://e/A") == {"a"}
+        assert cache.lookup("b1") == {"b"}
+        assert cache.lookup("http://e/missing") is None
+
+        cache[URIRef("http://e/A")].add("promoted")      # entries mutated in place
+        assert cache.lookup("http://e/A") == {"a", "promoted"}
+
+        restored = pickle.loads(pickle.dumps(cache))
+        assert restored.lookup("b1") == {"b"}
+        cache.clear()
+        assert cache.lookup("http://e/A") is None
+
+    def test_reader_and_viewer_agree_with_a_scan(self, tmp_path):
+        path = tmp_path / "o.ttl"
+        path.write_text(
+            "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            "<http://e/A> a owl:Class ; rdfs:label \"A\"@en ;\n"
+            "  rdfs:subClassOf [ a owl:Restriction ; owl:onProperty <http://e/p> ; owl:someValuesFrom <http://e/B> ] .\n"
+            "<http://e/p> a owl:ObjectProperty .\n")
+        reader = Reader()
+        reader.load_instances(str(path), "owl")
+        viewer = reader.get_viewer()
+        for key, entry in list(reader._instance_cache.items()):
+            expected = next(v for k, v in reader._instance_cache.items() if str(k) == str(key))
+            assert reader.get_instance(str(key)) is expected
+            assert viewer.get_instances_from_single_resource(str(key)) is expected
+
+
+class TestStatementIndex:
+    def test_statements_indexed_by_subject(self, tmp_path):
+        from lode.models import Individual, Statement
+        path = tmp_path / "abox.ttl"
+        path.write_text(
+            "@prefix ex: <http://e/> .\n@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            "ex:C a owl:Class .\n"
+            "ex:i a ex:C ; ex:note \"n\" ; ex:k \"a\" , \"b\" .\n"
+            "ex:j a ex:C ; ex:note \"m\" .\n")
+        reader = Reader()
+        reader.load_instances(str(path), "owl")
+
+        statements = [i for s in reader._instance_cache.values() for i in s if isinstance(i, Statement)]
+        for subject in {st.get_has_subject() for st in statements}:
+            expected = [st for st in statements if st.get_has_subject() is subject]
+            assert reader.get_statements_about(subject) == expected
+
+        individual = reader.get_instance("http://e/i", Individual)
+        formatted = reader.get_viewer()._format_statement(individual, "en")
+        assert sorted(v["text"] for values in formatted.values() for v in values) == ["a", "b", "n"]
+
+    def test_provenance_uses_index_and_shared_bnode_closures(self, tmp_path):
+        from rdflib import BNode, Literal as RDFLiteral, URIRef
+        from lode.models import Concept, Individual
+        path = tmp_path / "tbox.ttl"
+        path.write_text(
+            "@prefix ex: <http://e/> .\n@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            "ex:p a owl:ObjectProperty .\n"
+            "ex:A a owl:Class ; rdfs:subClassOf _:r .\n"
+            "ex:B a owl:Class ; rdfs:subClassOf _:r .\n"
+            "_:r a owl:Restriction ; owl:onProperty ex:p ; owl:someValuesFrom ex:A .\n"
+            "ex:i a ex:A ; ex:note \"n\" .\n")
+        reader = Reader()
+        reader.load_instances(str(path), "owl")
+
+        individual = reader.get_instance("http://e/i", Individual)
+        assert (URIRef("http://e/i"), URIRef("http://e/note"), RDFLiteral("n")) \
+            in reader.get_provenance_subgraph(individual)
+
+        a = reader.get_provenance_subgraph(reader.get_instance("http://e/A", Concept))
+        b = reader.get_provenance_subgraph(reader.get_instance("http://e/B", Concept))
+        restriction = {t for t in a if isinstance(t[0], BNode)}
+        assert len(restriction) == 3 and restriction == {t for t in b if isinstance(t[0], BNode)}
+        # the shared restriction was walked once
+        assert list(reader._logic._bnode_closures) == [next(iter(restriction))[0]]
+
+    def test_cards_without_provenance_carry_none(self, tmp_path):
+        from lode.models import Datatype, Individual
+        path = tmp_path / "abox.ttl"
+        path.write_text(
+            "@prefix ex: <http://e/> .\n@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n"
+            "ex:C a owl:Class .\n"
+            "ex:i a ex:C ; ex:age \"3\"^^xsd:integer .\n")
+        reader = Reader()
+        reader.load_instances(str(path), "owl")
+
+        individual = reader.get_instance("http://e/i", Individual)
+        integer = reader.get_instance("http://www.w3.org/2001/XMLSchema#integer", Datatype)
+        assert reader.has_provenance(individual) and not reader.has_provenance(integer)
+        for instances in reader._instance_cache.values():
+            for inst in instances:
+                assert reader.has_provenance(inst) == bool(len(reader.get_provenance_subgraph(inst)))
+
+        cards = reader.get_viewer()._format_entities([individual, integer])
+        by_uri = {card["uri"]: card["provenance"] for card in cards}
+        assert by_uri["http://e/i"] == {"resource": "http://e/i", "kind": "Individual"}
+        assert by_uri["http://www.w3.org/2001/XMLSchema#integer"] is None
+
+
 class TestReaderClearCache:
     def test_clear_cache_empties_instances(self, reader):
         reader._instance_cache['test'] = 'value'
@@ -245,4 +354,287 @@ class TestReaderTriplesMap:
         from lode.models import Resource
         for key in triples_map.keys():
             assert isinstance(key, Resource), \
-                f"Chiave {key} non è un'istanza di Resource ma {type(key)}"
\ No newline at end of file
+                f"Chiave {key} non è un'istanza di Resource ma {type(key)}"
+
+class TestReaderSnapshot:
+    @pytest.fixture
+    def loaded_reader(self, tmp_path):
+        owl_file = tmp_path / "snap.ttl"
+        owl_file.write_text("""
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix ex: <http://example.org/test#> .
+<http://example.org/test> a owl:Ontology .
+ex:Person a owl:Class ; rdfs:label "Person"@en .
+ex:Agent a owl:Class ; owl:equivalentClass [ owl:unionOf ( ex:Person ex:Org ) ] .
+ex:knows a owl:ObjectProperty ; rdfs:domain ex:Person ; rdfs:range ex:Person .
+""")
+        reader = Reader()
+        reader.load_instances(str(owl_file), read_as='owl')
+        return reader
+
+    def test_snapshot_roundtrip(self, loaded_reader, tmp_path):
+        path = str(tmp_path / "r.snap")
+        assert loaded_reader.save_snapshot(path)
+
+        restored = Reader.load_snapshot(path)
+        assert restored is not None
+        assert len(restored._instance_cache) == len(loaded_reader._instance_cache)
+        assert len(restored.get_all_triples_map()) == len(loaded_reader.get_all_triples_map())
+        person = restored.get_instance("http://example.org/test#Person")
+        assert person and all(restored.get_triples_for_instance(i) for i in person)
+        assert restored.get_viewer().get_view_data()
+        # empty relations come back as the shared placeholder, so set_* still works
+        from lode.models.resource import EMPTY
+        placeholders = [getattr(i, name) for insts in restored._instance_cache.values()
+                        for i in insts for name in i._field_names
+                        if type(getattr(i, name, None)) is type(EMPTY)]
+        assert placeholders and all(v is EMPTY for v in placeholders)
+
+    def test_snapshot_rejected_on_fingerprint_change(self, loaded_reader, tmp_path, monkeypatch):
+        from lode.reader import snapshot
+        path = str(tmp_path / "r.snap")
+        loaded_reader.save_snapshot(path)
+
+        monkeypatch.setattr(snapshot, "model_fingerprint", lambda: "changed")
+        assert Reader.load_snapshot(path) is None
+
+    def test_snapshot_missing_or_unextracted(self, reader, tmp_path):
+        path = str(tmp_path / "r.snap")
+        assert Reader.load_snapshot(path) is None
+        assert not reader.save_snapshot(path)
+
+
+class TestContainerMembers:
+    def test_repeated_members_keep_their_positions(self, tmp_path):
+        from rdflib import URIRef
+        from lode.models import Collection, Container, Concept
+        path = tmp_path / "c.ttl"
+        path.write_text(
+            "@prefix ex: <http://e/> .\n"
+            "@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .\n"
+            "ex:s ex:p ( ex:a ex:b ex:a ) .\n"
+            "ex:bag a rdf:Bag ; rdf:_1 ex:a ; rdf:_2 ex:b ; rdf:_3 ex:a .\n")
+        reader = Reader()
+        reader.load_instances(str(path), "rdf")
+        ids = lambda members: [m.get_has_identifier() for m in members]
+
+        bag = next(i for i in reader.get_instance("http://e/bag") if isinstance(i, Container))
+        assert ids(bag.get_has_members()) == ["http://e/a", "http://e/b", "http://e/a"]
+
+        rdf_list = Container()
+        reader._logic.create_python_container(rdf_list, reader._graph.value(URIRef("http://e/s"), URIRef("http://e/p")))
+        assert ids(rdf_list.get_has_members()) == ["http://e/a", "http://e/b", "http://e/a"]
+
+        collection, a = Collection(), Concept()
+        collection.set_has_member(a)
+        collection.set_has_member(a)
+        assert collection.get_has_member() == [a, a]
+
+
+class TestSpoolFormat:
+    def test_spool_roundtrip_through_loader(self, tmp_path, monkeypatch):
+        from rdflib import Graph, Literal, BNode, URIRef
+        from lode.reader import Loader, spool, modules
+
+        g = Graph()
+        g.bind("ex", "http://example.org/test#")
+        s, b = URIRef("http://example.org/test#A"), BNode()
+        g.add((s, URIRef("http://example.org/test#p"), b))
+        g.add((b, URIRef("http://example.org/test#q"), Literal("01", datatype="http://www.w3.org/2001/XMLSchema#int")))
+        g.add((s, URIRef("http://example.org/test#r"), Literal("a\nb", lang="en")))
+
+        path = str(tmp_path / "entry.rdf")
+        spool.write_graph(g, path, read_as="owl", imported="true", closure=None, modules_applied=True)
+        assert spool.read_graph(path)[1]["imported"] == "true"
+
+        # imports were expanded before spooling: reloading must not fetch them again
+        monkeypatch.setattr(modules, "apply_imported", lambda graph: pytest.fail("imports re-applied"))
+        loaded = Loader(path, imported="true").get_graph()
+        assert set(loaded) == set(g)
+        assert dict(loaded.namespaces())["ex"] == URIRef("http://example.org/test#")
+
+    def test_spool_refuses_unsupported_terms(self, tmp_path):
+        from rdflib import Graph, URIRef, Variable
+        from lode.reader import spool
+
+        g = Graph()
+        g.add((URIRef("http://example.org/test#A"), URIRef("http://example.org/test#p"), Variable("x")))
+        path = tmp_path / "entry.rdf"
+        # a Variable would come back as a URIRef: nothing is written
+        with pytest.raises(ValueError):
+            spool.write_graph(g, str(path))
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFormatDetection:
+    @pytest.mark.parametrize("head, name, expected", [
+        (b'<?xml version="1.0"?>\n<rdf:RDF/>', "up.rdf", "xml"),
+        (b'\xef\xbb\xbf<rdf:RDF xmlns:rdf="x"/>', "up.rdf", "xml"),
+        (b'# c\n@prefix ex: <http://e/> .\nex:a ex:b ex:c .', "up.rdf", "turtle"),
+        (b'PREFIX ex: <http://e/>\nex:a ex:b ex:c .', "up.n3", "n3"),
+        (b'<http://e/s> <http://e/p> "x"@en .\n_:b <http://e/p> <http://e/o> .\n', "up.rdf", "nt"),
+        (b'{"@context": {}}', "up.rdf", "json-ld"),
+        (b'ex:a ex:b ex:c .', "up.ttl", "turtle"),
+        (b'ex:a ex:b ex:c .', "up.rdf", None),
+    ])
+    def test_detect_format(self, head, name, expected):
+        from lode.reader.loader import detect_format
+        assert detect_format(head, name)[0] == expected
+
+    def test_confident_guess_parses_once(self, tmp_path, monkeypatch):
+        from rdflib import Graph
+        from lode.reader import Loader
+
+        path = tmp_path / "up.rdf"
+        path.write_text('<http://e/s> <http://e/p> <http://e/o> .\n')
+        tried = []
+        real_parse = Graph.parse
+        def spy(self, *a, **kw):
+            tried.append(kw.get("format"))
+            return real_parse(self, *a, **kw)
+        monkeypatch.setattr(Graph, "parse", spy)
+
+        assert len(Loader(str(path)).get_graph()) == 1
+        assert tried == ["nt"]
+
+
+
+class TestInMemorySources:
+    TTL = b"@prefix ex: <http://e/> .\nex:a ex:b ex:c .\n"
+
+    def test_bytes_and_streams(self):
+        import io
+        from lode.reader import Loader
+        assert len(Loader(self.TTL).get_graph()) == 1
+        assert len(Loader(bytearray(self.TTL), format="ttl").get_graph()) == 1
+        assert len(Loader(io.BytesIO(self.TTL)).get_graph()) == 1
+        assert len(Loader(io.StringIO(self.TTL.decode())).get_graph()) == 1
+
+    def test_graph_used_as_is_unless_imports_are_merged(self, monkeypatch):
+        from rdflib import Graph
+        from lode.reader import Loader, modules
+        graph = Graph().parse(data=self.TTL, format="turtle")
+        assert Loader(graph).get_graph() is graph
+
+        monkeypatch.setattr(modules, "apply_imported", lambda g: g)
+        loaded = Loader(graph, imported=True).get_graph()
+        assert loaded is not graph and set(loaded) == set(graph)
+
+    def test_reader_accepts_a_parsed_graph(self):
+        from rdflib import Graph
+        graph = Graph().parse(data=self.TTL, format="turtle")
+        reader = Reader()
+        reader.load_instances(graph, "rdf")
+        assert reader._graph is graph and reader._instance_cache
+
+
+class TestModulesImports:
+    @staticmethod
+    def _fake_web(monkeypatch, delay=0.0):
+        """A -> B, C ; B -> C#, D ; each fetch recorded."""
+        import time
+        from rdflib import Graph, URIRef, OWL
+        from lode.reader import modules
+
+        imports = {"http://e/A": ["http://e/B", "http://e/C"],
+                   "http://e/B": ["HTTP://E/C#", "http://e/D/"],
+                   "http://e/C": [], "http://e/D/": []}
+        fetched = []
+        def fake_fetch(source):
+            fetched.append(source)
+            time.sleep(delay)
+            g = Graph()
+            for target in imports[source.replace("HTTP://E/C#", "http://e/C")]:
+                g.add((URIRef(source), OWL.imports, URIRef(target)))
+            g.add((URIRef(source), URIRef("http://e/p"), URIRef("http://e/o")))
+            return g
+        monkeypatch.setattr(modules, "_fetch", fake_fetch)
+
+        root = Graph()
+        root.add((URIRef("http://e/root"), OWL.imports, URIRef("http://e/A")))
+        return root, fetched
+
+    def test_closure_is_breadth_first_and_deduplicated(self, monkeypatch):
+        from lode.reader import modules
+        root, fetched = self._fake_web(monkeypatch)
+        modules.apply_closure(root)
+        # one level at a time; B and C are fetched concurrently
+        assert fetched[0] == "http://e/A"
+        assert set(fetched[1:3]) == {"http://e/B", "http://e/C"}
+        assert fetched[3:] == ["http://e/D/"]
+
+    def test_imported_stops_at_depth_one(self, monkeypatch):
+        from lode.reader import modules
+        root, fetched = self._fake_web(monkeypatch)
+        modules.apply_imported(root)
+        assert fetched == ["http://e/A"]
+
+    def test_level_fetched_concurrently(self, monkeypatch):
+        import time
+        from lode.reader import modules
+        root, fetched = self._fake_web(monkeypatch, delay=0.3)
+        monkeypatch.setattr(modules, "IMPORTS_WORKERS", 4)
+        t0 = time.monotonic()
+        modules.apply_closure(root)
+        # 3 levels (A | B, C | D), not 4 sequential fetches
+        assert time.monotonic() - t0 < 1.15
+
+    def test_deadline_skips_pending_imports(self, monkeypatch):
+        from lode.reader import modules
+        root, fetched = self._fake_web(monkeypatch, delay=0.3)
+        monkeypatch.setattr(modules, "IMPORTS_DEADLINE", 0.1)
+        modules.apply_closure(root)
+        assert fetched == ["http://e/A"]
+
+    def test_imported_and_closure_fetch_once(self, monkeypatch, tmp_path):
+        from lode.reader import Loader, modules
+        root, fetched = self._fake_web(monkeypatch)
+        path = tmp_path / "root.nt"
+        path.write_text("<http://e/root> <http://www.w3.org/2002/07/owl#imports> <http://e/A> .\n")
+        Loader(str(path), imported=True, closure=True)
+        assert sorted(fetched) == sorted(set(fetched))
+
+
+class TestImportCache:
+    BODY = b"<http://e/V> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Ontology> .\n"
+
+    @pytest.fixture
+    def server(self, tmp_path, monkeypatch):
+        """Stand-in for the remote vocabulary: honours If-None-Match."""
+        from lode.reader import Loader, import_cache, security
+
+        class FakeResponse:
+            def __init__(self, status, body=b""):
+                self.status_code = status
+                self.headers = {"ETag": '"v1"', "Content-Type": "application/n-triples"}
+                self._body = body
+            def iter_content(self, size):
+                yield self._body
+            def close(self):
+                pass
+
+        calls = []
+        def fake_fetch(self, url, headers, max_redirects=None):
+            conditional = headers.get("If-None-Match") == '"v1"'
+            calls.append("304" if conditional else "200")
+            return FakeResponse(304) if conditional else FakeResponse(200, self_body)
+        self_body = self.BODY
+        monkeypatch.setattr(Loader, "_fetch_following_redirects", fake_fetch)
+        monkeypatch.setattr(security, "check_url_safe", lambda u: None)
+        monkeypatch.setattr(import_cache, "IMPORT_CACHE_DIR", str(tmp_path / "imports"))
+        return calls
+
+    def test_second_import_makes_no_download(self, server):
+        from lode.reader import import_cache
+        g1 = import_cache.fetch("http://e/V", "http://e/V")
+        g2 = import_cache.fetch("http://e/V", "http://e/V")
+        assert len(g1) == len(g2) == 1
+        assert server == ["200"]
+
+    def test_stale_entry_is_revalidated(self, server, monkeypatch):
+        from lode.reader import import_cache
+        import_cache.fetch("http://e/V", "http://e/V")
+        monkeypatch.setattr(import_cache, "IMPORT_CACHE_FRESH", -1)
+        assert len(import_cache.fetch("http://e/V", "http://e/V")) == 1
+        assert server == ["200", "304"]
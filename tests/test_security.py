@@ -54,6 +54,12 @@ class FakeResponse:
         self.closed = True
 
 
+class FakeSession:
+    """Stand-in for the pooled requests.Session used by the Loader."""
+    def __init__(self, get):
+        self.get = get
+
+
 def make_fake_get(responses):
     """Returns a fake requests.get that pops responses in order and records requested URLs."""
     queue = list(responses)
@@ -189,7 +195,7 @@ class TestFetchFollowingRedirects:
     def test_direct_200_returns_response(self, monkeypatch):
         resp = FakeResponse(status_code=200)
         fake = make_fake_get([resp])
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         out = self._loader()._fetch_following_redirects(
             "http://93.184.216.34/onto.ttl", headers={})
@@ -200,7 +206,7 @@ class TestFetchFollowingRedirects:
         r1 = FakeResponse(status_code=303, headers={"Location": "http://8.8.8.8/final.ttl"})
         r2 = FakeResponse(status_code=200)
         fake = make_fake_get([r1, r2])
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         out = self._loader()._fetch_following_redirects(
             "http://93.184.216.34/onto.ttl", headers={})
@@ -212,7 +218,7 @@ class TestFetchFollowingRedirects:
         # SSRF via redirect: first hop public, redirect Location points to metadata IP
         r1 = FakeResponse(status_code=302, headers={"Location": "http://169.254.169.254/latest/"})
         fake = make_fake_get([r1])
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         with pytest.raises(ArtefactValidationError):
             self._loader()._fetch_following_redirects(
@@ -223,7 +229,7 @@ class TestFetchFollowingRedirects:
     def test_redirect_without_location_raises(self, monkeypatch):
         r1 = FakeResponse(status_code=303, headers={})  # no Location
         fake = make_fake_get([r1])
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         with pytest.raises(ArtefactLoadError):
             self._loader()._fetch_following_redirects(
@@ -235,7 +241,7 @@ class TestFetchFollowingRedirects:
             for _ in range(6)
         ]
         fake = make_fake_get(redirects)
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         with pytest.raises(ArtefactLoadError):
             self._loader()._fetch_following_redirects(
@@ -246,7 +252,7 @@ class TestFetchFollowingRedirects:
         r1 = FakeResponse(status_code=303, headers={"Location": "other.ttl"})  # relative
         r2 = FakeResponse(status_code=200)
         fake = make_fake_get([r1, r2])
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         out = self._loader()._fetch_following_redirects(
             "http://93.184.216.34/dir/onto.ttl", headers={})
@@ -268,7 +274,7 @@ class TestFetchFollowingRedirects:
         ]
         chain.append(FakeResponse(status_code=200))
         fake = make_fake_get(chain)
-        monkeypatch.setattr("lode.reader.loader.requests.get", fake)
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(fake))
 
         out = self._loader()._fetch_following_redirects(
             "http://93.184.216.34/onto.ttl", headers={}, max_redirects=10)
@@ -365,14 +371,14 @@ class TestUrlSizeGuards:
     def test_streaming_size_guard(self, monkeypatch):
         monkeypatch.setattr(security, "MAX_BYTES", 16)
         resp = FakeResponse(status_code=200, headers={}, body=b"x" * 64)
-        monkeypatch.setattr("lode.reader.loader.requests.get", make_fake_get([resp]))
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(make_fake_get([resp])))
         with pytest.raises(ArtefactValidationError):
             Loader()._load_from_url_with_content_negotiation("http://93.184.216.34/big.ttl")
 
     def test_declared_content_length_rejected(self, monkeypatch):
         monkeypatch.setattr(security, "MAX_BYTES", 16)
         resp = FakeResponse(status_code=200, headers={"Content-Length": "1000"}, body=b"x")
-        monkeypatch.setattr("lode.reader.loader.requests.get", make_fake_get([resp]))
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(make_fake_get([resp])))
         with pytest.raises(ArtefactValidationError):
             Loader()._load_from_url_with_content_negotiation("http://8.8.8.8/big.ttl")
 
@@ -457,6 +463,78 @@ class TestCheckSafeXml:
         assert time.perf_counter() - t < 1.0
 
 
+# ----------------------------------------------------------------------
+#  TextStreamValidator  (same verdicts as the whole-body checks, chunk by chunk)
+# ----------------------------------------------------------------------
+def _whole_body_verdict(data: bytes):
+    try:
+        security.check_is_text(data)
+        security.check_safe_xml(data.decode("utf-8-sig"))
+    except ArtefactValidationError as e:
+        return str(e)
+    return None
+
+
+def _raise_stream(data: bytes, chunk: int):
+    validator = security.TextStreamValidator(max_bytes=len(data) + 1)
+    for i in range(0, len(data), chunk):
+        validator.feed(data[i:i + chunk])
+    validator.close()
+
+
+def _stream_verdict(data: bytes, chunk: int):
+    try:
+        _raise_stream(data, chunk)
+    except ArtefactValidationError as e:
+        return str(e)
+    return None
+
+
+class TestTextStreamValidator:
+
+    BODIES = [
+        "@prefix ex: <http://e/> . ex:a rdfs:label \"Citazione bibliografica – città\"@it .".encode("utf-8"),
+        '<?xml version="1.0"?><!DOCTYPE rdf:RDF [ <!ENTITY owl "http://www.w3.org/2002/07/owl#"> ]><r/>'.encode(),
+        b'<?xml version="1.0"?><!DOCTYPE r [ <!ENTITY x SYSTEM "file:///etc/passwd"> ]><r>&x;</r>',
+        b'<!DOCTYPE r [ <!ENTITY a "x"> <!ENTITY b "&a;&a;"> ]><r/>',
+        b'<!doctype x [ ' + b' ' * (security.MAX_DTD_SUBSET + 1) + b' ]>',
+        b"\xef\xbb\xbf<http://e/a> <http://e/b> <http://e/c> .",
+        b"valid text\x00then binary",
+        b"\xff\xfe\xfa\x9c",
+        "caff\u00e8".encode("utf-8")[:-1],   # truncated multi-byte sequence
+        ("x\x01" * 100).encode(),            # control characters
+        PNG, ZIP, ELF, JPEG,
+        b"",
+    ]
+
+    @pytest.mark.parametrize("chunk", [1, 3, 7, 8192])
+    @pytest.mark.parametrize("body", BODIES)
+    def test_same_verdict_as_whole_body_checks(self, body, chunk):
+        assert _stream_verdict(body, chunk) == _whole_body_verdict(body)
+
+    def test_doctype_after_the_prolog_is_not_scanned(self):
+        # a DTD is only honoured before the root element: later text is never lowercased/scanned
+        body = b'@prefix ex: <http://e/> . ex:a ex:html "<!DOCTYPE r SYSTEM \'file:///etc/passwd\'>" .'
+        assert _stream_verdict(body, 5) is None
+
+    @pytest.mark.parametrize("chunk", [1, 64 * 1024])
+    def test_doctype_behind_comments_and_pi_rejected(self, chunk):
+        body = (b'<?xml version="1.0"?>\n<!-- exported -->\n<?pi x?>'
+                b'<!DOCTYPE r [ <!ENTITY x SYSTEM "file:///etc/passwd"> ]><r>&x;</r>')
+        assert _stream_verdict(body, chunk) is not None
+
+    def test_padded_prolog_rejected(self):
+        body = b"<!--" + b"x" * security.MAX_PROLOG + b"-->" + b'<!DOCTYPE r SYSTEM "http://evil/x.dtd"><r/>'
+        with pytest.raises(ArtefactValidationError):
+            _raise_stream(body, 64 * 1024)
+
+    def test_size_cap(self):
+        validator = security.TextStreamValidator(max_bytes=16)
+        validator.feed(b"x" * 16)
+        with pytest.raises(ArtefactValidationError):
+            validator.feed(b"x")
+
+
 # ----------------------------------------------------------------------
 #  read_upload_capped  (chunked upload read with size cap)
 # ----------------------------------------------------------------------
@@ -574,7 +652,7 @@ class TestPeerIpRebinding:
         # connected to an internal IP (rebinding) -> abort before reading.
         self._public_dns(monkeypatch)
         resp = FakeResponse(status_code=200, peer_ip="169.254.169.254")
-        monkeypatch.setattr("lode.reader.loader.requests.get", make_fake_get([resp]))
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(make_fake_get([resp])))
         with pytest.raises(ArtefactValidationError):
             Loader()._fetch_following_redirects("http://sneaky.example.org/o.ttl", headers={})
         assert resp.closed is True
@@ -582,7 +660,7 @@ class TestPeerIpRebinding:
     def test_peer_public_ip_allowed(self, monkeypatch):
         self._public_dns(monkeypatch)
         resp = FakeResponse(status_code=200, peer_ip="93.184.216.34")
-        monkeypatch.setattr("lode.reader.loader.requests.get", make_fake_get([resp]))
+        monkeypatch.setattr("lode.reader.loader._http_session", lambda: FakeSession(make_fake_get([resp])))
         out = Loader()._fetch_following_redirects("http://ok.example.org/o.ttl", headers={})
         assert out is resp
 